@@ -0,0 +1,72 @@
+"""
+Management command to onboard many recruiters and companies from a file
+Usage: python manage.py bulk_onboard <file.csv|file.json> [--batch-size N] [--workers N]
+
+CSV files need a header row with: username, email, company_name and optionally
+password, primary_color, secondary_color. JSON files contain a list of objects
+with the same keys.
+"""
+import csv
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.onboarding import onboard_tenants
+
+
+class Command(BaseCommand):
+    help = 'Create recruiter accounts and companies in bulk from a CSV or JSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', type=str, help='Path to CSV or JSON file')
+        parser.add_argument('--batch-size', type=int, default=500, help='Tenants per transaction')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Processes used for password hashing',
+        )
+
+    def handle(self, *args, **options):
+        path = options['file']
+        if not os.path.exists(path):
+            raise CommandError(f'File not found: {path}')
+
+        try:
+            if path.lower().endswith('.json'):
+                with open(path) as f:
+                    rows = json.load(f)
+            else:
+                with open(path, newline='', encoding='utf-8-sig') as f:
+                    rows = list(csv.DictReader(f))
+        except (ValueError, csv.Error) as e:
+            raise CommandError(f'Could not read {path}: {e}')
+
+        if not isinstance(rows, list):
+            raise CommandError('JSON file must contain a list of tenants')
+
+        self.stdout.write(f'Onboarding {len(rows)} tenants...')
+        started = time.monotonic()
+
+        def progress(done, total):
+            self.stdout.write(f'  {done}/{total} processed')
+
+        result = onboard_tenants(
+            rows,
+            batch_size=options['batch_size'],
+            workers=options['workers'],
+            progress=progress,
+        )
+
+        for row, reason in result.skipped:
+            self.stdout.write(self.style.WARNING(f'  - Row {row} skipped: {reason}'))
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✅ Onboarding complete!'
+            f'\n   Created: {len(result.created)} tenants'
+            f'\n   Skipped: {len(result.skipped)} rows'
+            f'\n   Time: {elapsed:.1f}s'
+        ))
@@ -0,0 +1,166 @@
+"""
+Bulk tenant provisioning: recruiters and their companies, created in batches.
+
+Rows are checked against the User and Company field validation (lengths,
+username characters, email format) up front, so a bad row is reported
+instead of failing the insert. Each batch is one transaction with one query
+for existing usernames/emails, one bulk insert per table and one slug query.
+Used by the bulk_onboard management command and the bulk-onboard API.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from companies.models import Company, allocate_slugs
+
+
+REQUIRED_FIELDS = ('username', 'email', 'company_name')
+COLOR_FIELDS = ('primary_color', 'secondary_color')
+
+
+class OnboardingResult:
+    def __init__(self):
+        self.created = []   # (username, company slug)
+        self.skipped = []   # (row number, reason)
+
+    def as_dict(self):
+        return {
+            'created': len(self.created),
+            'skipped': len(self.skipped),
+            'companies': [{'username': username, 'slug': slug} for username, slug in self.created],
+            'errors': [{'row': row, 'error': reason} for row, reason in self.skipped],
+        }
+
+
+def _field_errors(row):
+    """Model field validation for a row, without touching the database ('' when valid)"""
+    checks = (
+        (User(username=row['username'], email=row['email']), ['password']),
+        (Company(name=row['company_name'], **_colors(row)), ['recruiter', 'slug']),
+    )
+    messages = []
+    for instance, exclude in checks:
+        try:
+            instance.full_clean(exclude=exclude, validate_unique=False, validate_constraints=False)
+        except ValidationError as e:
+            messages.extend(f'{field}: {" ".join(errors)}' for field, errors in e.message_dict.items())
+    return '; '.join(messages)
+
+
+def _colors(row):
+    return {field: row[field] for field in COLOR_FIELDS if row.get(field)}
+
+
+def _validate(rows, result):
+    """Drop rows with missing or invalid fields, or duplicated within the input"""
+    valid = []
+    seen_usernames = set()
+    seen_emails = set()
+    for number, row in enumerate(rows, start=1):
+        row = {key: (str(value).strip() if value is not None else '') for key, value in row.items()}
+        missing = [field for field in REQUIRED_FIELDS if not row.get(field)]
+        errors = '' if missing else _field_errors(row)
+        if missing:
+            result.skipped.append((number, f'Missing {", ".join(missing)}'))
+        elif errors:
+            result.skipped.append((number, errors))
+        elif row['username'] in seen_usernames:
+            result.skipped.append((number, 'Duplicate username in input'))
+        elif row['email'].lower() in seen_emails:
+            result.skipped.append((number, 'Duplicate email in input'))
+        else:
+            seen_usernames.add(row['username'])
+            seen_emails.add(row['email'].lower())
+            valid.append((number, row))
+    return valid
+
+
+def _hash_passwords(passwords, workers):
+    """Hash passwords, in parallel processes when workers > 1 (hashing dominates the cost)"""
+    if workers > 1 and len(passwords) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(make_password, passwords, chunksize=50))
+    return [make_password(password) for password in passwords]
+
+
+def _create_batch(batch, workers):
+    """Create one batch in a transaction; returns (created, skipped)"""
+    usernames = [row['username'] for _, row in batch]
+    # Emails compare case-insensitively, as in _validate
+    emails = [row['email'].lower() for _, row in batch]
+    existing = User.objects.annotate(email_lower=Lower('email')).filter(
+        Q(username__in=usernames) | Q(email_lower__in=emails)
+    )
+    existing_usernames = set()
+    existing_emails = set()
+    for username, email in existing.values_list('username', 'email_lower'):
+        existing_usernames.add(username)
+        existing_emails.add(email)
+
+    to_create = []
+    skipped = []
+    for number, row in batch:
+        if row['username'] in existing_usernames:
+            skipped.append((number, 'Username already exists'))
+        elif row['email'].lower() in existing_emails:
+            skipped.append((number, 'Email already exists'))
+        else:
+            to_create.append(row)
+    if not to_create:
+        return [], skipped
+
+    # Rows without a password get an unusable one (they can reset it later)
+    hashes = _hash_passwords([row.get('password') or None for row in to_create], workers)
+
+    with transaction.atomic():
+        User.objects.bulk_create([
+            User(username=row['username'], email=row['email'], password=password_hash)
+            for row, password_hash in zip(to_create, hashes)
+        ])
+        user_ids = dict(
+            User.objects.filter(username__in=[row['username'] for row in to_create]).values_list('username', 'id')
+        )
+        slugs = allocate_slugs([row['company_name'] for row in to_create])
+        # bulk_create bypasses Company.save, so slugs are assigned here
+        Company.objects.bulk_create([
+            Company(
+                recruiter_id=user_ids[row['username']],
+                name=row['company_name'],
+                slug=slug,
+                **_colors(row),
+            )
+            for row, slug in zip(to_create, slugs)
+        ])
+    return [(row['username'], slug) for row, slug in zip(to_create, slugs)], skipped
+
+
+def onboard_tenants(rows, batch_size=500, workers=1, progress=None):
+    """
+    Create a recruiter user and a company for every row.
+
+    rows: iterable of dicts with username, email, company_name and optionally
+    password, primary_color and secondary_color.
+    """
+    result = OnboardingResult()
+    valid = _validate(rows, result)
+
+    for start in range(0, len(valid), batch_size):
+        batch = valid[start:start + batch_size]
+        for attempt in range(3):
+            try:
+                created, skipped = _create_batch(batch, workers)
+                result.created.extend(created)
+                result.skipped.extend(skipped)
+                break
+            except IntegrityError:
+                # A concurrent insert took a username or slug; re-read and try again
+                if attempt == 2:
+                    raise
+        if progress:
+            progress(min(start + batch_size, len(valid)), len(valid))
+    return result
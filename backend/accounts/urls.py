@@ -5,5 +5,6 @@ urlpatterns = [
     path('register/', views.register, name='register'),
     path('login/', views.login, name='login'),
     path('me/', views.get_current_user, name='current_user'),
+    path('bulk-onboard/', views.bulk_onboard, name='bulk_onboard'),
 ]
 
@@ -1,14 +1,22 @@
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from companies.models import Company
+from .onboarding import onboard_tenants
 from .serializers import UserSerializer
 
 
+# The API hashes passwords in the request (PBKDF2 takes ~0.3s each), so it stays
+# well inside the worker timeout; larger files go through the bulk_onboard command
+BULK_ONBOARD_MAX_ROWS = 25
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def register(request):
@@ -24,29 +32,42 @@ def register(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    if User.objects.filter(username=username).exists():
+    # One query for both uniqueness checks
+    existing = list(
+        User.objects.filter(Q(username=username) | Q(email=email)).values_list('username', 'email')
+    )
+    if any(existing_username == username for existing_username, _ in existing):
         return Response(
             {'error': 'Username already exists'},
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    if User.objects.filter(email=email).exists():
+    if existing:
         return Response(
             {'error': 'Email already exists'},
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    user = User.objects.create_user(
-        username=username,
-        email=email,
-        password=password
-    )
-    
-    # Create company if company_name is provided
-    if company_name:
-        Company.objects.create(
-            recruiter=user,
-            name=company_name
+    # User and company are created together or not at all
+    try:
+        with transaction.atomic():
+            user = User.objects.create_user(
+                username=username,
+                email=email,
+                password=password
+            )
+            
+            # Create company if company_name is provided
+            if company_name:
+                Company.objects.create(
+                    recruiter=user,
+                    name=company_name
+                )
+    except IntegrityError:
+        # A concurrent registration took the username first
+        return Response(
+            {'error': 'Username already exists'},
+            status=status.HTTP_400_BAD_REQUEST
         )
     
     refresh = RefreshToken.for_user(user)
@@ -93,3 +114,31 @@ def get_current_user(request):
     """Get current authenticated user"""
     return Response(UserSerializer(request.user).data)
 
+
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def bulk_onboard(request):
+    """Create recruiters and companies in bulk (staff only)"""
+    tenants = request.data.get('tenants')
+    
+    if not isinstance(tenants, list) or not tenants:
+        return Response(
+            {'error': 'tenants must be a non-empty list'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    if len(tenants) > BULK_ONBOARD_MAX_ROWS:
+        return Response(
+            {'error': f'At most {BULK_ONBOARD_MAX_ROWS} tenants per request. Use the bulk_onboard command for larger files.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    if not all(isinstance(tenant, dict) for tenant in tenants):
+        return Response(
+            {'error': 'Each tenant must be an object'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    result = onboard_tenants(tenants)
+    return Response(result.as_dict(), status=status.HTTP_201_CREATED)
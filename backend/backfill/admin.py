@@ -0,0 +1,12 @@
+from django.contrib import admin
+
+from .models import Checkpoint
+
+
+@admin.register(Checkpoint)
+class CheckpointAdmin(admin.ModelAdmin):
+    list_display = ['name', 'last_pk', 'last_key', 'processed', 'changed', 'started_at', 'updated_at', 'finished_at']
+    readonly_fields = [field.name for field in Checkpoint._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class BackfillConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'backfill'
+
+    def ready(self):
+        # Each app declares its backfills in <app>/backfills.py
+        autodiscover_modules('backfills')
@@ -0,0 +1,178 @@
+"""
+Online, resumable backfills.
+
+A backfill walks a model's rows in primary-key order, a batch at a time. Each
+batch and its checkpoint commit together in one short transaction, so the
+tables stay writable, a crash loses at most one batch, and the next run
+continues where the last one stopped. Between batches the runner sleeps
+and waits for read replicas to catch up.
+
+Declare backfills in <app>/backfills.py:
+
+    @register
+    class JobSalaries(Backfill):
+        name = 'job-salaries'
+        model = Job
+        fields = ('salary_range',)
+
+        def process_batch(self, rows):
+            ...  # rows are (pk, salary_range) tuples; return the number changed
+
+Run them with `manage.py run_backfill <name>` or from a migration with
+backfill.operations.RunBackfill.
+"""
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import OperationalError, connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import Checkpoint
+
+
+LOCK_RETRIES = 5
+
+Progress = namedtuple('Progress', 'name last_pk max_pk processed changed elapsed')
+
+_registry = {}
+
+
+class Backfill:
+    name = None
+    model = None
+    # Values read per row, after the primary key
+    fields = ()
+    batch_size = 5000
+    description = ''
+
+    def get_queryset(self, reprocess=False):
+        """Rows that need work; reprocess=True means every row (e.g. after a parser change)"""
+        return self.model._default_manager.all()
+
+    def process_batch(self, rows):
+        """Update one batch of (pk, *fields) tuples and return how many rows changed"""
+        raise NotImplementedError
+
+    def record_batch(self, rows):
+        """
+        Record the batch elsewhere (e.g. the sync change log), in the batch's
+        transaction. Skipped when running from a migration, where other apps'
+        tables may not match the live models yet.
+        """
+
+
+def register(cls):
+    if not cls.name:
+        raise ValueError(f'{cls.__name__} needs a name')
+    _registry[cls.name] = cls()
+    return cls
+
+
+def get_backfill(name):
+    try:
+        return _registry[name]
+    except KeyError:
+        raise KeyError(f'Unknown backfill "{name}". Registered: {", ".join(sorted(_registry)) or "none"}')
+
+
+def registered():
+    return dict(sorted(_registry.items()))
+
+
+def _wait_for_replicas():
+    """Hold off while any read replica is further behind than BACKFILL_MAX_REPLICA_LAG seconds"""
+    from careers_builder.db.routers import _check_lag, replica_aliases
+
+    max_lag = getattr(settings, 'BACKFILL_MAX_REPLICA_LAG', 5.0)
+    for alias in replica_aliases():
+        while True:
+            try:
+                lag = _check_lag(alias)
+            except Exception:
+                # An unreachable replica is skipped by the router anyway
+                break
+            if lag <= max_lag:
+                break
+            time.sleep(min(lag, 10))
+
+
+def _set_lock_timeout(connection):
+    # Give up quickly rather than queue behind (and block) DDL or long transactions
+    if connection.vendor == 'postgresql':
+        timeout = getattr(settings, 'BACKFILL_LOCK_TIMEOUT', '5s')
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT set_config(%s, %s, true)', ['lock_timeout', timeout])
+
+
+def run(backfill, batch_size=None, sleep=None, restart=False, reprocess=False, max_batches=None, progress=None,
+        migrating=False):
+    """
+    Process the backfill from its checkpoint until no rows are left.
+
+    Returns the checkpoint. max_batches stops early (the checkpoint keeps the
+    position); progress is called with a Progress after every batch.
+    migrating=True skips record_batch().
+    """
+    batch_size = batch_size or backfill.batch_size
+    if sleep is None:
+        sleep = getattr(settings, 'BACKFILL_SLEEP_SECONDS', 0.1)
+    model = backfill.model
+    using = model._default_manager.db
+    connection = connections[using]
+
+    checkpoint, _ = Checkpoint.objects.using(using).get_or_create(name=backfill.name)
+    if restart or checkpoint.finished_at is not None:
+        checkpoint.last_pk = 0
+        checkpoint.processed = 0
+        checkpoint.changed = 0
+        checkpoint.finished_at = None
+    if checkpoint.started_at is None or checkpoint.last_pk == 0:
+        checkpoint.started_at = timezone.now()
+    checkpoint.save()
+
+    queryset = backfill.get_queryset(reprocess=reprocess).order_by('pk')
+    max_pk = model._default_manager.using(using).aggregate(max_pk=Max('pk'))['max_pk'] or 0
+    started = time.monotonic()
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        _wait_for_replicas()
+        for attempt in range(LOCK_RETRIES):
+            try:
+                with transaction.atomic(using=using):
+                    _set_lock_timeout(connection)
+                    rows = list(
+                        queryset.filter(pk__gt=checkpoint.last_pk).values_list('pk', *backfill.fields)[:batch_size]
+                    )
+                    if rows:
+                        changed = backfill.process_batch(rows)
+                        if not migrating:
+                            backfill.record_batch(rows)
+                        checkpoint.last_pk = rows[-1][0]
+                        checkpoint.processed += len(rows)
+                        checkpoint.changed += changed or 0
+                    else:
+                        checkpoint.finished_at = timezone.now()
+                    checkpoint.save()
+                break
+            except OperationalError:
+                # Most likely lock_timeout; the batch rolled back, try it again shortly
+                if attempt == LOCK_RETRIES - 1:
+                    raise
+                checkpoint.refresh_from_db()
+                time.sleep(sleep + 2 ** attempt)
+
+        if not rows:
+            break
+        batches += 1
+        if progress:
+            progress(Progress(
+                backfill.name, checkpoint.last_pk, max_pk, checkpoint.processed, checkpoint.changed,
+                time.monotonic() - started,
+            ))
+        if sleep:
+            time.sleep(sleep)
+
+    return checkpoint
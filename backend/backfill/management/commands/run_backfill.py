@@ -0,0 +1,79 @@
+"""
+Management command to run a registered backfill online, in resumable batches
+Usage:
+    python manage.py run_backfill --list
+    python manage.py run_backfill <name> [--batch-size N] [--sleep S] [--max-batches N] [--restart] [--all]
+
+Rows are processed in primary-key batches, each committed together with the
+checkpoint, so the command can be stopped at any time and picks up where it
+left off. Backfills are declared in <app>/backfills.py (see backfill/base.py).
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from backfill.base import get_backfill, registered, run
+from backfill.models import Checkpoint
+
+
+class Command(BaseCommand):
+    help = 'Run a registered data backfill in resumable, throttled batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('name', nargs='?', help='Backfill name (see --list)')
+        parser.add_argument('--list', action='store_true', help='Show registered backfills and their progress')
+        parser.add_argument('--batch-size', type=int, default=None, help='Rows per batch (default: per backfill)')
+        parser.add_argument(
+            '--sleep', type=float, default=None, help='Seconds to pause between batches (default: BACKFILL_SLEEP_SECONDS)',
+        )
+        parser.add_argument('--max-batches', type=int, default=None, help='Stop after N batches (resume later)')
+        parser.add_argument('--restart', action='store_true', help='Ignore the checkpoint and start from the first row')
+        parser.add_argument('--all', action='store_true', help='Reprocess rows that were already filled')
+
+    def handle(self, *args, **options):
+        if options['list']:
+            return self._list()
+        if not options['name']:
+            raise CommandError('Give a backfill name, or --list to see them')
+        try:
+            backfill = get_backfill(options['name'])
+        except KeyError as e:
+            raise CommandError(e.args[0])
+
+        self.stdout.write(f'Running backfill "{backfill.name}" on {backfill.model._meta.db_table}')
+        checkpoint = run(
+            backfill,
+            batch_size=options['batch_size'],
+            sleep=options['sleep'],
+            restart=options['restart'],
+            reprocess=options['all'],
+            max_batches=options['max_batches'],
+            progress=self._report,
+        )
+
+        status = 'complete' if checkpoint.finished_at else f'paused at pk {checkpoint.last_pk}'
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✅ Backfill {status}!'
+            f'\n   Examined: {checkpoint.processed} rows'
+            f'\n   Changed: {checkpoint.changed} rows'
+        ))
+
+    def _report(self, progress):
+        percent = 100.0 * progress.last_pk / progress.max_pk if progress.max_pk else 100.0
+        rate = progress.processed / progress.elapsed if progress.elapsed else 0
+        self.stdout.write(
+            f'  {progress.processed} rows examined, {progress.changed} changed '
+            f'(pk {progress.last_pk}/{progress.max_pk}, {min(percent, 100.0):.1f}%, {rate:,.0f} rows/s)'
+        )
+
+    def _list(self):
+        checkpoints = {checkpoint.name: checkpoint for checkpoint in Checkpoint.objects.all()}
+        for name, backfill in registered().items():
+            checkpoint = checkpoints.get(name)
+            if checkpoint is None:
+                state = 'not started'
+            elif checkpoint.finished_at:
+                state = f'finished {checkpoint.finished_at:%Y-%m-%d %H:%M}, {checkpoint.changed} changed'
+            else:
+                state = f'at pk {checkpoint.last_pk}, {checkpoint.processed} examined'
+            self.stdout.write(f'{name:<24} {state}')
+            if backfill.description:
+                self.stdout.write(f'{"":<24} {backfill.description}')
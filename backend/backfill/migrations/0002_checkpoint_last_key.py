@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-19 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backfill', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='checkpoint',
+            name='last_key',
+            field=models.TextField(blank=True, default='', help_text='Position of scans not keyed by primary key'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import models
+
+
+class Checkpoint(models.Model):
+    """
+    Progress of one registered backfill; run_backfill resumes after last_pk.
+    Other resumable scans (sweep_orphaned_media) keep their position in last_key.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    last_pk = models.BigIntegerField(default=0)
+    last_key = models.TextField(blank=True, default='', help_text='Position of scans not keyed by primary key')
+    processed = models.BigIntegerField(default=0, help_text='Rows examined')
+    changed = models.BigIntegerField(default=0, help_text='Rows the backfill reported as updated')
+    started_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        if self.finished_at:
+            state = 'finished'
+        elif self.last_key:
+            state = f'at {self.last_key}'
+        else:
+            state = f'at pk {self.last_pk}'
+        return f"{self.name} ({state})"
@@ -0,0 +1,51 @@
+"""
+Migration helper for backfills.
+
+    class Migration(migrations.Migration):
+        atomic = False   # let every batch commit on its own
+
+        dependencies = [
+            ('jobs', '0007_job_parsed_salary'),
+            ('backfill', '0001_initial'),
+        ]
+
+        operations = [
+            RunBackfill('job-salaries'),
+        ]
+
+With BACKFILL_DURING_MIGRATE = False (e.g. for very large tables) the
+migration only registers the checkpoint and returns immediately; run
+`manage.py run_backfill <name>` after the deploy. Backfills use the live
+models, so they must only touch fields that exist at this migration. For
+the same reason Backfill.record_batch() is not called here: rows changed
+by migrations are covered by the change log seed (sync 0002) instead.
+"""
+import logging
+
+from django.conf import settings
+from django.db import migrations
+
+from .base import get_backfill, run
+
+
+logger = logging.getLogger('backfill')
+
+
+class RunBackfill(migrations.RunPython):
+    def __init__(self, name, batch_size=None, **kwargs):
+        self.backfill_name = name
+        self.batch_size = batch_size
+        super().__init__(self._forwards, migrations.RunPython.noop, atomic=False, **kwargs)
+
+    def _forwards(self, apps, schema_editor):
+        backfill = get_backfill(self.backfill_name)
+        if not getattr(settings, 'BACKFILL_DURING_MIGRATE', True):
+            from .models import Checkpoint
+
+            Checkpoint.objects.get_or_create(name=backfill.name)
+            logger.warning('Backfill "%s" deferred: run manage.py run_backfill %s', backfill.name, backfill.name)
+            return
+        run(backfill, batch_size=self.batch_size, migrating=True)
+
+    def describe(self):
+        return f'Backfill {self.backfill_name}'
@@ -0,0 +1,213 @@
+"""
+Process-level database connection pool.
+
+Used by the careers_builder.db.pooled_postgresql backend. Connections are
+shared by every thread of the process instead of being pinned to a thread,
+so a burst of requests reuses warm (TLS-established) connections rather
+than opening new ones.
+"""
+import collections
+import logging
+import os
+import threading
+import time
+
+
+logger = logging.getLogger('careers_builder.db')
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, connect, min_size=1, max_size=10, timeout=10.0, check_idle_after=30.0):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError('Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1')
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_idle_after = check_idle_after
+        self._idle = collections.deque()  # (connection, released_at)
+        self._size = 0  # open connections, idle or in use
+        self._condition = threading.Condition()
+        self.pid = os.getpid()
+
+        # Statistics
+        self.waiting = 0
+        self.connections_created = 0
+        self.connections_discarded = 0
+        self.acquired_total = 0
+        self.timeouts_total = 0
+        self.wait_seconds_total = 0.0
+
+        if min_size:
+            threading.Thread(target=self._fill, name='db-pool-fill', daemon=True).start()
+
+    def _fill(self):
+        """Open min_size connections in the background so the first requests find them warm"""
+        while True:
+            with self._condition:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                connection = self._new_connection()
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                logger.exception('Could not pre-open pooled database connection')
+                return
+            self.release(connection)
+
+    def _new_connection(self):
+        connection = self._connect()
+        with self._condition:
+            self.connections_created += 1
+        return connection
+
+    def acquire(self):
+        started = time.monotonic()
+        deadline = started + self.timeout
+        while True:
+            connection, released_at = self._checkout(deadline)
+            if connection is None:
+                connection = self._open_reserved()
+                break
+            # Checked outside the lock, so a stalled socket only holds up this thread
+            if self._healthy(connection, released_at):
+                break
+            self._discard(connection)
+
+        with self._condition:
+            self.acquired_total += 1
+            self.wait_seconds_total += time.monotonic() - started
+        return connection
+
+    def _checkout(self, deadline):
+        """
+        Take an idle (connection, released_at), or reserve a slot for a new
+        connection and return (None, None). Waits for a release until the deadline.
+        """
+        with self._condition:
+            self.waiting += 1
+            try:
+                while True:
+                    if self._idle:
+                        return self._idle.pop()
+                    if self._size < self.max_size:
+                        self._size += 1
+                        return None, None
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timeouts_total += 1
+                        raise PoolTimeout(
+                            f'Timed out after {self.timeout}s waiting for a database connection '
+                            f'(pool size {self.max_size})'
+                        )
+                    self._condition.wait(remaining)
+            finally:
+                self.waiting -= 1
+
+    def _open_reserved(self):
+        """Connect for a reserved slot, without holding the lock"""
+        try:
+            return self._new_connection()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, connection):
+        """Return a connection; anything left in a transaction is rolled back"""
+        try:
+            if not connection.closed:
+                connection.rollback()
+        except Exception:
+            pass
+        if connection.closed:
+            self._discard(connection)
+            return
+        with self._condition:
+            self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    def _healthy(self, connection, released_at):
+        if connection.closed:
+            return False
+        if time.monotonic() - released_at < self.check_idle_after:
+            return True
+        # Long idle connections may have been dropped by the server or a proxy
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            # Outside autocommit the SELECT opened a transaction; do not hand it out idle in it
+            connection.rollback()
+            return True
+        except Exception:
+            return False
+
+    def discard(self, connection):
+        """Close a checked-out connection instead of returning it"""
+        self._discard(connection)
+
+    def _discard(self, connection):
+        """Free a checked-out connection's slot and close it (the close happens outside the lock)"""
+        with self._condition:
+            self._size -= 1
+            self.connections_discarded += 1
+            self._condition.notify()
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def close_all(self):
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+        for connection, _ in idle:
+            self._discard(connection)
+
+    def stats(self):
+        with self._condition:
+            idle = len(self._idle)
+            size = self._size
+            waiting = self.waiting
+        return {
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'size': size,
+            'idle': idle,
+            'in_use': size - idle,
+            'waiting': waiting,
+            'connections_created': self.connections_created,
+            'connections_discarded': self.connections_discarded,
+            'acquired_total': self.acquired_total,
+            'timeouts_total': self.timeouts_total,
+            'avg_wait_ms': round(self.wait_seconds_total / self.acquired_total * 1000, 3) if self.acquired_total else 0.0,
+        }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, factory):
+    """Pool for a database alias, created on first use in each process"""
+    pool = _pools.get(alias)
+    if pool is not None and pool.pid == os.getpid():
+        return pool
+    with _pools_lock:
+        pool = _pools.get(alias)
+        # A forked worker must not reuse the parent's sockets
+        if pool is None or pool.pid != os.getpid():
+            pool = _pools[alias] = factory()
+        return pool
+
+
+def pool_stats():
+    """Statistics for every pool in this process, keyed by database alias"""
+    return {alias: pool.stats() for alias, pool in _pools.items() if pool.pid == os.getpid()}
@@ -0,0 +1,47 @@
+"""
+PostgreSQL backend that takes connections from a process-level pool.
+
+Enable with DATABASE_POOL=True (see settings.py). Pool options live in the
+database's POOL dict: MIN_SIZE, MAX_SIZE and TIMEOUT (seconds to wait for a
+free connection).
+"""
+from django.db.backends.postgresql import base as postgresql
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from careers_builder.db.pool import ConnectionPool, PoolTimeout, get_pool
+
+
+class DatabaseWrapper(postgresql.DatabaseWrapper):
+    def _create_pool(self, conn_params):
+        pool_options = self.settings_dict.get('POOL', {})
+        return ConnectionPool(
+            connect=lambda: super(DatabaseWrapper, self).get_new_connection(conn_params),
+            min_size=pool_options.get('MIN_SIZE', 1),
+            max_size=pool_options.get('MAX_SIZE', 10),
+            timeout=pool_options.get('TIMEOUT', 10),
+        )
+
+    @property
+    def pool(self):
+        return get_pool(self.alias, lambda: self._create_pool(self.get_connection_params()))
+
+    def get_new_connection(self, conn_params):
+        # The parent sets this while connecting; pooled connections skip that path
+        self.isolation_level = IsolationLevel(
+            self.settings_dict['OPTIONS'].get('isolation_level', IsolationLevel.READ_COMMITTED)
+        )
+        try:
+            return get_pool(self.alias, lambda: self._create_pool(conn_params)).acquire()
+        except PoolTimeout as e:
+            raise self.Database.OperationalError(str(e)) from e
+
+    def _close(self):
+        # Return the connection to the pool instead of closing the socket
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                if self.in_atomic_block:
+                    # Django keeps self.connection until the atomic block exits, so
+                    # it must not go to another thread; close it and free its slot
+                    self.pool.discard(self.connection)
+                else:
+                    self.pool.release(self.connection)
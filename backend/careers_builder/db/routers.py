@@ -0,0 +1,148 @@
+"""
+Read-replica routing.
+
+ReplicaRoutingMiddleware marks anonymous-safe public reads (the `public`,
+`suggestions` and `search` actions of the viewsets) for the replica.
+Everything else - writes and recruiter reads - goes to the primary. A
+successful recruiter mutation pins that recruiter's company to the primary
+for REPLICA_PIN_SECONDS so the careers page shows the change immediately
+(read-your-writes). A replica that is lagging more than
+REPLICA_MAX_LAG_SECONDS, or unreachable, is skipped until the next lag
+check.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+logger = logging.getLogger('careers_builder.db')
+
+_state = threading.local()
+_replica_health = {}  # alias -> (checked_at, usable)
+_health_lock = threading.Lock()
+
+PUBLIC_READ_ACTIONS = {'public', 'suggestions', 'search'}
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+def replica_aliases():
+    return getattr(settings, 'REPLICA_DATABASES', [])
+
+
+def _pin_key(company_slug):
+    return f'replica-pin:{company_slug}'
+
+
+def pin_to_primary(company_slug):
+    """Send public reads for this company to the primary for a short while"""
+    cache.set(_pin_key(company_slug), True, getattr(settings, 'REPLICA_PIN_SECONDS', 10))
+
+
+def is_pinned(company_slug):
+    return bool(company_slug) and cache.get(_pin_key(company_slug)) is not None
+
+
+def _check_lag(alias):
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        return 0.0
+    with connection.cursor() as cursor:
+        cursor.execute(REPLICA_LAG_SQL)
+        return float(cursor.fetchone()[0])
+
+
+def replica_usable(alias):
+    """Whether the replica is reachable and within the lag budget (checked periodically)"""
+    interval = getattr(settings, 'REPLICA_LAG_CHECK_INTERVAL', 5)
+    checked_at, usable = _replica_health.get(alias, (0.0, True))
+    now = time.monotonic()
+    if now - checked_at < interval:
+        return usable
+    with _health_lock:
+        checked_at, usable = _replica_health.get(alias, (0.0, True))
+        if now - checked_at < interval:
+            return usable
+        try:
+            lag = _check_lag(alias)
+            usable = lag <= getattr(settings, 'REPLICA_MAX_LAG_SECONDS', 5)
+            if not usable:
+                logger.warning('Replica %s is %.1fs behind, reading from primary', alias, lag)
+        except Exception:
+            logger.exception('Replica %s is unavailable, reading from primary', alias)
+            usable = False
+        _replica_health[alias] = (now, usable)
+        return usable
+
+
+def replica_status():
+    """Last known replica health, for the readiness endpoint"""
+    return {
+        alias: _replica_health.get(alias, (0.0, True))[1]
+        for alias in replica_aliases()
+    }
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if getattr(_state, 'use_replica', False):
+            for alias in replica_aliases():
+                if replica_usable(alias):
+                    return alias
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRoutingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        _state.use_replica = False
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.use_replica = False
+
+        if replica_aliases() and request.method not in SAFE_METHODS and response.status_code < 400:
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated:
+                self._pin_recruiter_company(user)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not replica_aliases() or request.method not in SAFE_METHODS:
+            return None
+        actions = getattr(view_func, 'actions', None) or {}
+        if actions.get(request.method.lower()) not in PUBLIC_READ_ACTIONS:
+            return None
+        company_slug = view_kwargs.get('slug') or request.GET.get('company')
+        if not is_pinned(company_slug):
+            _state.use_replica = True
+        return None
+
+    def _pin_recruiter_company(self, user):
+        from companies.models import Company
+
+        for slug in Company.objects.filter(recruiter=user).values_list('slug', flat=True):
+            pin_to_primary(slug)
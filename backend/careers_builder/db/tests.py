@@ -0,0 +1,119 @@
+"""
+Read-replica routing tests.
+
+careers_builder.test_settings adds a 'replica' alias that mirrors the test
+database (TEST: {'MIRROR': 'default'}), so these run locally with one server.
+The mirror is a separate connection, so TransactionTestCase is used: rows
+must be committed for the replica connection to see them.
+"""
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from companies import cache as company_cache
+from companies.models import Company
+from jobs.models import Job
+
+from . import routers
+
+
+REPLICA = 'replica'
+
+
+@skipUnless(REPLICA in settings.DATABASES, 'needs a replica alias (careers_builder.test_settings)')
+@override_settings(REPLICA_DATABASES=[REPLICA], REPLICA_LAG_CHECK_INTERVAL=0)
+class ReplicaRoutingTests(TransactionTestCase):
+    databases = {DEFAULT_DB_ALIAS, REPLICA}
+
+    def setUp(self):
+        cache.clear()
+        company_cache.clear()
+        routers._replica_health.clear()
+        self.recruiter = User.objects.create_user('recruiter', 'recruiter@example.com', 'secret-password')
+        self.company = Company.objects.create(name='Acme', slug='acme', recruiter=self.recruiter)
+        Job.objects.create(company=self.company, title='Engineer', location='Remote')
+
+    def request(self, method, url, data=None, user=None):
+        """Returns (response, primary query count, replica query count)"""
+        headers = {}
+        if user is not None:
+            headers['HTTP_AUTHORIZATION'] = f'Bearer {RefreshToken.for_user(user).access_token}'
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary, \
+                CaptureQueriesContext(connections[REPLICA]) as replica:
+            if method == 'get':
+                response = self.client.get(url, data, **headers)
+            else:
+                response = self.client.post(url, data, content_type='application/json', **headers)
+        return response, len(primary.captured_queries), len(replica.captured_queries)
+
+    def get_public_jobs(self):
+        return self.request('get', reverse('job-public'), {'company': 'acme'})
+
+    def test_public_reads_go_to_replica(self):
+        response, primary, replica = self.get_public_jobs()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+        self.assertGreater(replica, 0)
+        self.assertEqual(primary, 0)
+
+    def test_recruiter_reads_stay_on_primary(self):
+        response, primary, replica = self.request('get', reverse('job-list'), user=self.recruiter)
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+    def test_write_pins_company_to_primary(self):
+        response, _, _ = self.request(
+            'post', reverse('job-list'), {'title': 'Designer', 'location': 'Berlin'}, user=self.recruiter
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(routers.is_pinned('acme'))
+
+        response, primary, replica = self.get_public_jobs()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+    def test_pin_only_affects_the_written_company(self):
+        other = Company.objects.create(name='Other', slug='other', recruiter=self.recruiter)
+        Job.objects.create(company=other, title='Analyst', location='Paris')
+        routers.pin_to_primary('acme')
+
+        _, primary, replica = self.request('get', reverse('job-public'), {'company': 'other'})
+        self.assertGreater(replica, 0)
+        self.assertEqual(primary, 0)
+
+    @override_settings(REPLICA_MAX_LAG_SECONDS=5)
+    def test_lagging_replica_falls_back_to_primary(self):
+        with mock.patch.object(routers, '_check_lag', return_value=60.0), \
+                self.assertLogs('careers_builder.db', 'WARNING'):
+            response, primary, replica = self.get_public_jobs()
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+        self.assertEqual(routers.replica_status(), {REPLICA: False})
+
+    def test_unreachable_replica_falls_back_to_primary(self):
+        with mock.patch.object(routers, '_check_lag', side_effect=OperationalError('connection refused')), \
+                self.assertLogs('careers_builder.db', 'ERROR'):
+            response, primary, replica = self.get_public_jobs()
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+    def test_replica_is_used_again_once_caught_up(self):
+        with mock.patch.object(routers, '_check_lag', return_value=60.0), \
+                self.assertLogs('careers_builder.db', 'WARNING'):
+            self.get_public_jobs()
+        with mock.patch.object(routers, '_check_lag', return_value=0.0):
+            _, primary, replica = self.get_public_jobs()
+        self.assertGreater(replica, 0)
+        self.assertEqual(primary, 0)
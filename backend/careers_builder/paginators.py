@@ -0,0 +1,106 @@
+"""
+Paginators that avoid full COUNT(*) scans on very large tables.
+
+COUNT(*) on a multi-million row table is a full scan on PostgreSQL.
+
+EstimatedCountPaginator (admin changelists) reports the planner's estimate
+for big results: reltuples from pg_class for an unfiltered table (summed
+over partitions), or the EXPLAIN row estimate for a filtered queryset. Small
+results, other databases and non-queryset lists still get an exact count.
+
+CappedCountPagination (API lists) counts exactly, but stops at a cap, so a
+page costs at most a bounded index scan however many rows match.
+"""
+import json
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+
+# Below this estimate an exact COUNT is cheap enough and removes the guesswork
+EXACT_COUNT_LIMIT = 10000
+
+TABLE_ESTIMATE_SQL = """
+    SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint
+    FROM pg_class c
+    WHERE c.oid = %s::regclass
+       OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass)
+"""
+
+
+def estimate_count(queryset):
+    """Planner row estimate for a PostgreSQL queryset, or None when there is none"""
+    if not isinstance(queryset, QuerySet):
+        return None
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    if not queryset.query.where and not queryset.query.distinct:
+        table = queryset.model._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(TABLE_ESTIMATE_SQL, [table, table])
+            return cursor.fetchone()[0]
+
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < EXACT_COUNT_LIMIT:
+            return super().count
+        return estimate
+
+
+class CappedCountPaginator(Paginator):
+    """Counts at most `cap` rows; pages past the cap are not reachable"""
+    cap = 10000
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, QuerySet):
+            return self.object_list[:self.cap + 1].count()
+        return min(len(self.object_list), self.cap + 1)
+
+    @property
+    def capped(self):
+        return self.count > self.cap
+
+    @cached_property
+    def num_pages(self):
+        if self.capped:
+            # Serve up to the cap; filters or sorting reach the rest
+            return -(-self.cap // self.per_page)
+        return super().num_pages
+
+
+class CappedCountPagination(PageNumberPagination):
+    """
+    ?page=N&page_size=M with a capped total. The response adds count_capped:
+    true when more rows match than were counted (count is then the cap).
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def django_paginator_class(self, object_list, per_page, *args, **kwargs):
+        paginator = CappedCountPaginator(object_list, per_page, *args, **kwargs)
+        paginator.cap = getattr(settings, 'API_COUNT_CAP', CappedCountPaginator.cap)
+        return paginator
+
+    def get_paginated_response(self, data):
+        paginator = self.page.paginator
+        return Response({
+            'count': min(paginator.count, paginator.cap),
+            'count_capped': paginator.capped,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
@@ -47,9 +47,13 @@ INSTALLED_APPS = [
     'companies',
     'jobs',
     'content',
+    'monitoring',
+    'sync',
+    'backfill',
 ]
 
 MIDDLEWARE = [
+    'monitoring.middleware.RequestInstrumentationMiddleware',  # Query count and Server-Timing
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Add whitenoise for static files
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -57,6 +61,9 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'careers_builder.db.routers.ReplicaRoutingMiddleware',  # Public reads to the replica
+    'careers_builder.throttling.RateLimitHeadersMiddleware',  # RateLimit-* headers on public endpoints
+    'monitoring.profiling.ProfilingMiddleware',  # Profiles requests sent with X-Profile-Request
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -109,6 +116,45 @@ DATABASES = {
 if env('DATABASE_HOST', default='').endswith('.supabase.co') or env('DATABASE_HOST', default='').endswith('.neon.tech'):
     DATABASES['default']['OPTIONS']['sslmode'] = 'require'
 
+# Read replica - public careers-page reads go to DATABASE_REPLICA_URL when set
+# (see careers_builder.db.routers). For local testing both URLs may point at the
+# same database.
+DATABASE_REPLICA_URL = env('DATABASE_REPLICA_URL', default='')
+REPLICA_DATABASES = []
+if DATABASE_REPLICA_URL:
+    DATABASES['replica'] = dj_database_url.parse(
+        DATABASE_REPLICA_URL,
+        conn_max_age=600,
+        conn_health_checks=True,
+    )
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+    REPLICA_DATABASES = ['replica']
+DATABASE_ROUTERS = ['careers_builder.db.routers.ReplicaRouter']
+REPLICA_MAX_LAG_SECONDS = env.float('REPLICA_MAX_LAG_SECONDS', default=5.0)
+REPLICA_LAG_CHECK_INTERVAL = env.float('REPLICA_LAG_CHECK_INTERVAL', default=5.0)
+REPLICA_PIN_SECONDS = env.int('REPLICA_PIN_SECONDS', default=10)
+
+# Process-level connection pool (careers_builder.db.pooled_postgresql)
+# Connections are shared by all threads of a worker and returned to the pool at
+# the end of each request, so CONN_MAX_AGE is disabled in this mode.
+DATABASE_POOL = env.bool('DATABASE_POOL', default=False)
+for database in DATABASES.values():
+    if DATABASE_POOL and database['ENGINE'] == 'django.db.backends.postgresql':
+        database['ENGINE'] = 'careers_builder.db.pooled_postgresql'
+        database['CONN_MAX_AGE'] = 0
+        database['CONN_HEALTH_CHECKS'] = False
+        database['POOL'] = {
+            'MIN_SIZE': env.int('DATABASE_POOL_MIN_SIZE', default=1),
+            'MAX_SIZE': env.int('DATABASE_POOL_MAX_SIZE', default=10),
+            'TIMEOUT': env.float('DATABASE_POOL_TIMEOUT', default=10.0),
+        }
+
+# Cache - set CACHE_URL to a shared backend (e.g. memcached) when running
+# several workers so pins and counters are shared between processes
+CACHES = {
+    'default': env.cache_url('CACHE_URL', default='locmemcache://'),
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -155,8 +201,15 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    # Proxies in front of the app (1 behind Render's). Throttles take the client IP
+    # that many entries from the end of X-Forwarded-For, which clients cannot
+    # forge; 0 uses REMOTE_ADDR and ignores the header
+    'NUM_PROXIES': env.int('NUM_PROXIES', default=0),
 }
 
+# Paginated API lists (CappedCountPagination) count at most this many rows
+API_COUNT_CAP = env.int('API_COUNT_CAP', default=10000)
+
 # JWT Settings
 from datetime import timedelta
 SIMPLE_JWT = {
@@ -182,4 +235,106 @@ CSRF_TRUSTED_ORIGINS = [
 ]
 
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ['RateLimit-Limit', 'RateLimit-Remaining', 'RateLimit-Reset', 'Retry-After']
+
+# Public careers site, used for links in sitemaps and job feeds
+FRONTEND_URL = env('FRONTEND_URL', default='https://whitecarrot-assignment-three.vercel.app')
+
+# Job feeds (sitemaps, RSS, JSON-LD) are cached per content version; bodies
+# over FEED_CACHE_MAX_BYTES are kept in FEED_CACHE_DIR instead of the cache
+FEED_CACHE_SECONDS = env.int('FEED_CACHE_SECONDS', default=3600)
+FEED_CACHE_MAX_BYTES = env.int('FEED_CACHE_MAX_BYTES', default=5 * 1024 * 1024)
+FEED_CACHE_DIR = env('FEED_CACHE_DIR', default=os.path.join(BASE_DIR, 'feed_cache'))
+# Feeds across all companies are rebuilt at most this often
+FEED_GLOBAL_REFRESH_SECONDS = env.int('FEED_GLOBAL_REFRESH_SECONDS', default=900)
+FEED_MAX_AGE = env.int('FEED_MAX_AGE', default=900)
+
+# Token-bucket limits for anonymous public endpoints (see careers_builder/throttling.py)
+# "N/period" allows bursts of N and N per period on average; empty disables a scope
+PUBLIC_RATE_LIMITS = {
+    'ip': env('PUBLIC_RATE_LIMIT_IP', default='120/min'),
+    'company': env('PUBLIC_RATE_LIMIT_COMPANY', default='1200/min'),
+}
+PUBLIC_RATE_LIMIT_CACHE = env('PUBLIC_RATE_LIMIT_CACHE', default='default')
+
+# Online backfills (manage.py run_backfill, backfill.operations.RunBackfill)
+BACKFILL_SLEEP_SECONDS = env.float('BACKFILL_SLEEP_SECONDS', default=0.1)
+BACKFILL_LOCK_TIMEOUT = env('BACKFILL_LOCK_TIMEOUT', default='5s')
+BACKFILL_MAX_REPLICA_LAG = env.float('BACKFILL_MAX_REPLICA_LAG', default=5.0)
+# False: migrations only create the checkpoint; run the backfill after deploying
+BACKFILL_DURING_MIGRATE = env.bool('BACKFILL_DURING_MIGRATE', default=True)
+
+# Closed jobs move to the archive table this many days after closing
+JOB_ARCHIVE_AFTER_DAYS = env.int('JOB_ARCHIVE_AFTER_DAYS', default=30)
+
+# Delta sync (/api/sync/changes/)
+# Deletes are kept this long; older cursors get a 410 and must resync
+SYNC_RETENTION_DAYS = env.int('SYNC_RETENTION_DAYS', default=30)
+# Without PostgreSQL transaction ids, changes younger than this are held back
+# until concurrent writes have committed
+SYNC_SETTLE_SECONDS = env.int('SYNC_SETTLE_SECONDS', default=2)
+
+# Request instrumentation (monitoring app)
+# Requests over either budget are logged by the 'monitoring' logger
+REQUEST_QUERY_BUDGET = env.int('REQUEST_QUERY_BUDGET', default=50)
+REQUEST_LATENCY_BUDGET_MS = env.int('REQUEST_LATENCY_BUDGET_MS', default=1000)
+SERVER_TIMING_HEADER = env.bool('SERVER_TIMING_HEADER', default=True)
+
+# Metrics exposed at /internal/metrics (Prometheus text format)
+# Set METRICS_MULTIPROC_DIR when running several gunicorn workers so every
+# process's metrics are aggregated through snapshot files
+METRICS_MULTIPROC_DIR = env('METRICS_MULTIPROC_DIR', default='')
+METRICS_FLUSH_INTERVAL = env.int('METRICS_FLUSH_INTERVAL', default=5)
+# Metrics of finished management commands (imports) are kept here; defaults to
+# command-metrics.json in METRICS_MULTIPROC_DIR or the temp dir
+METRICS_COMMANDS_FILE = env('METRICS_COMMANDS_FILE', default='')
+METRICS_TOKEN = env('METRICS_TOKEN', default='')
+# Checked against REMOTE_ADDR, which is the proxy's address behind a local
+# reverse proxy, so nothing is allow-listed by default
+METRICS_ALLOWED_IPS = env.list('METRICS_ALLOWED_IPS', default=[])
+
+# Readiness probe results (/readyz) are cached for this long per process
+READINESS_CACHE_SECONDS = env.int('READINESS_CACHE_SECONDS', default=10)
+
+# Public endpoints resolve company slugs from a per-process LRU cache (companies.cache)
+# Saves evict locally; other processes see changes within TENANT_CACHE_TTL seconds
+TENANT_CACHE_SIZE = env.int('TENANT_CACHE_SIZE', default=1000)
+TENANT_CACHE_TTL = env.int('TENANT_CACHE_TTL', default=60)
+
+# On-demand request profiling
+# Send "X-Profile-Request: <PROFILING_TOKEN>" (or any value as a staff user)
+# to write a pstats profile of that request to PROFILING_DIR
+PROFILING_TOKEN = env('PROFILING_TOKEN', default='')
+PROFILING_DIR = env('PROFILING_DIR', default=os.path.join(BASE_DIR, 'profiles'))
+
+# Slow query capture - statements over the threshold are stored in the background;
+# a sample of SELECTs get EXPLAIN (ANALYZE, BUFFERS) on PostgreSQL
+SLOW_QUERY_ENABLED = env.bool('SLOW_QUERY_ENABLED', default=True)
+SLOW_QUERY_THRESHOLD_MS = env.int('SLOW_QUERY_THRESHOLD_MS', default=200)
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE = env.float('SLOW_QUERY_EXPLAIN_SAMPLE_RATE', default=0.1)
+SLOW_QUERY_EXPLAIN_TIMEOUT_MS = env.int('SLOW_QUERY_EXPLAIN_TIMEOUT_MS', default=5000)
+
+# Logging - independent of DEBUG so production keeps budget warnings
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'monitoring': {
+            'handlers': ['console'],
+            'level': env('MONITORING_LOG_LEVEL', default='INFO'),
+            'propagate': False,
+        },
+        # Deferred migration backfills (backfill.operations.RunBackfill)
+        'backfill': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
 
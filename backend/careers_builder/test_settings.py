@@ -0,0 +1,14 @@
+"""
+Settings for the test suite. `manage.py test` uses them by default; other
+runners need DJANGO_SETTINGS_MODULE=careers_builder.test_settings.
+
+Unless DATABASE_REPLICA_URL configures a real replica, a 'replica' alias
+mirrors the test database (TEST: {'MIRROR': 'default'}), so replica routing
+is exercised without a second server.
+"""
+from .settings import *  # noqa: F401,F403
+from .settings import DATABASES
+
+if 'replica' not in DATABASES:
+    DATABASES['replica'] = {**DATABASES['default'], 'TEST': {'MIRROR': 'default'}}
+    REPLICA_DATABASES = ['replica']
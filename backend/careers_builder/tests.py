@@ -0,0 +1,38 @@
+"""
+Public rate limits keyed on the client IP.
+
+X-Forwarded-For is client supplied except for the entries the proxies in
+front of the app append, so a spoofed header must not buy a fresh bucket.
+"""
+from django.core.cache import caches
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from .throttling import PublicIPThrottle, check_public_rate_limit
+
+
+@override_settings(PUBLIC_RATE_LIMITS={'ip': '2/min'})
+class SpoofedForwardedForTests(SimpleTestCase):
+    def setUp(self):
+        caches['default'].clear()
+        self.factory = RequestFactory()
+
+    def request(self, forwarded_for, remote_addr='10.0.0.1'):
+        return self.factory.get('/', REMOTE_ADDR=remote_addr, HTTP_X_FORWARDED_FOR=forwarded_for)
+
+    def assertThrottledAfterTwo(self, requests):
+        statuses = [check_public_rate_limit(request) for request in requests]
+        self.assertEqual([status is None for status in statuses], [True, True, False])
+
+    def test_header_ignored_without_proxies(self):
+        self.assertThrottledAfterTwo([self.request(f'203.0.113.{n}') for n in range(3)])
+
+    def test_throttle_class_ignores_header_without_proxies(self):
+        results = [PublicIPThrottle().allow_request(self.request(f'203.0.113.{n}'), None) for n in range(3)]
+        self.assertEqual(results, [True, True, False])
+
+    @override_settings(REST_FRAMEWORK={'NUM_PROXIES': 1})
+    def test_only_the_proxy_entry_counts_behind_one_proxy(self):
+        # The proxy appends the address it saw; anything before it is the client's
+        self.assertThrottledAfterTwo([
+            self.request(f'203.0.113.{n}, 198.51.100.7', remote_addr=f'10.0.0.{n}') for n in range(3)
+        ])
@@ -0,0 +1,210 @@
+"""
+Token-bucket rate limits for the anonymous public endpoints.
+
+Each scope ('ip', 'company') has a rate such as "120/min": a bucket of 120
+tokens that refills continuously at 2 per second, so short bursts pass and a
+sustained scraper is held to the average rate. Buckets live in the cache
+named by PUBLIC_RATE_LIMIT_CACHE, shared across workers when that is Redis
+or Memcached. If the cache errors, this process falls back to its own
+in-memory buckets.
+
+The cache round trip is a plain get/set, so concurrent requests for the same
+key can each spend the same token. Limits are approximate, not exact quotas.
+
+Every throttled request gets RateLimit-Limit/-Remaining/-Reset headers for
+its tightest bucket (added by RateLimitHeadersMiddleware). A 429 also gets
+Retry-After. Feeds only take a token when they have to be rendered, so
+cached and 304 responses stay free.
+"""
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import JsonResponse
+from rest_framework.throttling import BaseThrottle
+
+from monitoring.metrics import RATE_LIMITED
+
+
+logger = logging.getLogger('careers_builder.throttling')
+
+PERIODS = {'s': 1, 'sec': 1, 'second': 1, 'm': 60, 'min': 60, 'minute': 60, 'h': 3600, 'hour': 3600}
+LOCAL_MAX_BUCKETS = 10000
+
+# limit: bucket size; remaining: whole tokens left; reset: seconds until full;
+# retry_after: seconds until the next token (0 when allowed)
+RateLimitStatus = namedtuple('RateLimitStatus', 'scope allowed limit remaining reset retry_after')
+
+_local_buckets = OrderedDict()   # key -> (tokens, updated_at), least recently used first
+_local_lock = threading.Lock()
+
+
+def parse_rate(rate):
+    """"120/min" -> (120 tokens, 120/60 tokens per second); empty means unlimited"""
+    if not rate:
+        return None
+    count, _, period = rate.partition('/')
+    try:
+        capacity = int(count)
+        seconds = PERIODS[period.strip().lower()]
+    except (KeyError, ValueError):
+        raise ValueError(f'Invalid rate limit "{rate}", expected e.g. "120/min"')
+    return capacity, capacity / seconds
+
+
+def _refill(state, capacity, refill_rate, now):
+    tokens, updated_at = state if state else (capacity, now)
+    return min(capacity, tokens + (now - updated_at) * refill_rate)
+
+
+def _take_local(key, capacity, refill_rate, now):
+    with _local_lock:
+        tokens = _refill(_local_buckets.get(key), capacity, refill_rate, now)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        _local_buckets[key] = (tokens, now)
+        _local_buckets.move_to_end(key)
+        while len(_local_buckets) > LOCAL_MAX_BUCKETS:
+            _local_buckets.popitem(last=False)
+    return allowed, tokens
+
+
+def _take_shared(key, capacity, refill_rate, now):
+    cache = caches[getattr(settings, 'PUBLIC_RATE_LIMIT_CACHE', 'default')]
+    tokens = _refill(cache.get(key), capacity, refill_rate, now)
+    allowed = tokens >= 1
+    if allowed:
+        tokens -= 1
+    # Kept until the bucket would be full again; a missing key is a full bucket
+    cache.set(key, (tokens, now), timeout=math.ceil((capacity - tokens) / refill_rate) + 1)
+    return allowed, tokens
+
+
+def take(scope, ident, rate):
+    """Spend one token from the scope's bucket for ident; None when the scope is unlimited"""
+    parsed = parse_rate(rate)
+    if parsed is None:
+        return None
+    capacity, refill_rate = parsed
+    key = f'ratelimit:{scope}:{ident}'
+    now = time.time()
+    try:
+        allowed, tokens = _take_shared(key, capacity, refill_rate, now)
+    except Exception:
+        logger.warning('Rate limit cache unavailable, using in-process buckets', exc_info=True)
+        allowed, tokens = _take_local(key, capacity, refill_rate, now)
+
+    if not allowed:
+        RATE_LIMITED.inc(scope=scope)
+    return RateLimitStatus(
+        scope=scope,
+        allowed=allowed,
+        limit=capacity,
+        remaining=int(tokens),
+        reset=math.ceil((capacity - tokens) / refill_rate),
+        retry_after=0 if allowed else math.ceil((1 - tokens) / refill_rate),
+    )
+
+
+def _remember(request, result):
+    """Keep the tightest bucket on the request for RateLimitHeadersMiddleware"""
+    request = getattr(request, '_request', request)
+    current = getattr(request, 'rate_limit', None)
+    if current is None or (result.allowed, result.remaining) < (current.allowed, current.remaining):
+        request.rate_limit = result
+
+
+def _rates():
+    return getattr(settings, 'PUBLIC_RATE_LIMITS', {})
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Base class: subclasses set scope and return the bucket identity from get_ident_for()"""
+    scope = None
+
+    def get_ident_for(self, request, view):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        ident = self.get_ident_for(request, view)
+        if not ident:
+            return True
+        result = take(self.scope, ident, _rates().get(self.scope))
+        if result is None:
+            return True
+        _remember(request, result)
+        self.result = result
+        return result.allowed
+
+    def wait(self):
+        return self.result.retry_after
+
+
+class PublicIPThrottle(TokenBucketThrottle):
+    """Per client IP (honours REST_FRAMEWORK NUM_PROXIES for X-Forwarded-For)"""
+    scope = 'ip'
+
+    def get_ident_for(self, request, view):
+        return self.get_ident(request)
+
+
+class PublicCompanyThrottle(TokenBucketThrottle):
+    """Per careers page, from the slug in the URL or the company query parameter"""
+    scope = 'company'
+
+    def get_ident_for(self, request, view):
+        slug = view.kwargs.get('slug') or request.query_params.get('company')
+        return slug.strip().lower()[:100] if slug else None
+
+
+PUBLIC_THROTTLES = [PublicIPThrottle, PublicCompanyThrottle]
+
+
+def check_public_rate_limit(request, slug=None):
+    """
+    Rate limit a plain Django view; returns a 429 response or None.
+
+    Call it only on the expensive path (e.g. a cache miss).
+    """
+    # get_ident only reads request.META, so a plain HttpRequest works
+    ident = BaseThrottle().get_ident(request)
+
+    limited = None
+    for scope, key in (('ip', ident), ('company', slug)):
+        if not key:
+            continue
+        result = take(scope, key, _rates().get(scope))
+        if result is None:
+            continue
+        _remember(request, result)
+        if not result.allowed:
+            limited = result
+    if limited is None:
+        return None
+    return JsonResponse(
+        {'detail': f'Request was throttled. Expected available in {limited.retry_after} seconds.'},
+        status=429,
+    )
+
+
+class RateLimitHeadersMiddleware:
+    """Adds RateLimit-* headers (and Retry-After on 429) for rate-limited requests"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        result = getattr(request, 'rate_limit', None)
+        if result is not None:
+            response['RateLimit-Limit'] = str(result.limit)
+            response['RateLimit-Remaining'] = str(result.remaining)
+            response['RateLimit-Reset'] = str(result.reset)
+            if not result.allowed:
+                response['Retry-After'] = str(result.retry_after)
+        return response
@@ -6,30 +6,23 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.http import JsonResponse, FileResponse
-from django.db import connection
 from django.views.static import serve
 from django.urls import re_path
+from monitoring import views as monitoring_views
 
 def api_root(request):
-    """API root endpoint"""
-    # Test database connection
-    db_status = "unknown"
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-            db_status = "connected"
-    except Exception as e:
-        db_status = f"error: {str(e)[:100]}"
-    
+    """API root endpoint (static - use /readyz for dependency health)"""
     return JsonResponse({
         'message': 'Careers Page Builder API',
         'version': '1.0',
-        'database': db_status,
         'endpoints': {
             'auth': '/api/auth/',
             'companies': '/api/companies/',
             'jobs': '/api/jobs/',
             'content': '/api/content/',
+            'sync': '/api/sync/changes/',
+            'liveness': '/healthz',
+            'readiness': '/readyz',
         }
     })
 
@@ -37,10 +30,14 @@ urlpatterns = [
     path('', api_root, name='api-root'),
     path('api/', api_root, name='api-root-alt'),
     path('admin/', admin.site.urls),
+    path('internal/metrics', monitoring_views.metrics, name='metrics'),
+    path('healthz', monitoring_views.liveness, name='liveness'),
+    path('readyz', monitoring_views.readiness, name='readiness'),
     path('api/auth/', include('accounts.urls')),
     path('api/companies/', include('companies.urls')),
     path('api/jobs/', include('jobs.urls')),
     path('api/content/', include('content.urls')),
+    path('api/sync/', include('sync.urls')),
 ]
 
 # Serve media files (both development and production)
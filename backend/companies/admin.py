@@ -1,4 +1,9 @@
 from django.contrib import admin
+from django.contrib.auth.models import User
+from django.db.models import Q
+
+from careers_builder.paginators import EstimatedCountPaginator
+
 from .models import Company
 
 
@@ -6,5 +11,23 @@ from .models import Company
 class CompanyAdmin(admin.ModelAdmin):
     list_display = ['name', 'slug', 'recruiter', 'created_at']
     list_filter = ['created_at']
-    search_fields = ['name', 'slug', 'recruiter__username']
+    # Also used by the company autocomplete on the job and content admins
+    search_fields = ['^name', '=slug', '=recruiter__username']  # Handled by get_search_results
+    search_help_text = 'Start of the company name, exact slug or recruiter username'
+    list_select_related = ['recruiter']
+    raw_id_fields = ['recruiter']
+    ordering = ['-id']  # Primary key index instead of sorting by created_at
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
+    def get_search_results(self, request, queryset, search_term):
+        # Every branch hits an index: upper(name) text_pattern_ops (migration 0002)
+        # and the unique slug and username indexes, which iexact could not use
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        matches = Q(name__istartswith=term) | Q(slug=term.lower())
+        recruiter_id = User.objects.filter(username=term).values_list('id', flat=True).first()
+        if recruiter_id is not None:
+            matches |= Q(recruiter_id=recruiter_id)
+        return queryset.filter(matches), False
@@ -5,3 +5,5 @@ class CompaniesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'companies'
 
+    def ready(self):
+        from . import signals  # noqa: F401
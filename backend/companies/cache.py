@@ -0,0 +1,77 @@
+"""
+Process-local slug -> Company cache for the public endpoints.
+
+Every public request resolves a careers page slug before doing anything else,
+and a careers page load makes several of those requests. Companies change
+rarely, so each process keeps the most recently used ones in memory (LRU,
+TENANT_CACHE_SIZE entries) for up to TENANT_CACHE_TTL seconds. In the steady
+state, resolving the company takes no queries.
+
+Saving or deleting a Company evicts it in this process (companies.signals).
+Other processes (gunicorn workers, other hosts) keep their copy until the TTL
+runs out, so the TTL bounds how long a rename, rebrand or deletion can be
+served stale. Hits and misses are counted in the 'tenants' cache metrics.
+
+Cached instances are shared between requests: read them, never modify or
+save them.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from monitoring.metrics import record_cache
+
+from .models import Company
+
+
+_entries = OrderedDict()   # slug -> (company, expires_at), least recently used first
+_lock = threading.Lock()
+
+
+def _settings():
+    return (
+        getattr(settings, 'TENANT_CACHE_SIZE', 1000),
+        getattr(settings, 'TENANT_CACHE_TTL', 60),
+    )
+
+
+def get_company(slug):
+    """The company with this slug, or None when there is none"""
+    if not slug:
+        return None
+    max_size, ttl = _settings()
+    now = time.monotonic()
+
+    with _lock:
+        entry = _entries.get(slug)
+        if entry is not None and entry[1] > now:
+            _entries.move_to_end(slug)
+            record_cache('tenants', True)
+            return entry[0]
+
+    record_cache('tenants', False)
+    company = Company.objects.filter(slug=slug).first()
+    if company is None or not ttl:
+        # Unknown slugs are not cached, so a new company shows up at once
+        return company
+
+    with _lock:
+        _entries[slug] = (company, now + ttl)
+        _entries.move_to_end(slug)
+        while len(_entries) > max_size:
+            _entries.popitem(last=False)
+    return company
+
+
+def invalidate(company_id):
+    """Evict a company, whatever slug it was cached under"""
+    with _lock:
+        for slug in [slug for slug, (company, _) in _entries.items() if company.id == company_id]:
+            del _entries[slug]
+
+
+def clear():
+    with _lock:
+        _entries.clear()
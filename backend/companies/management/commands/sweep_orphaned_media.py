@@ -0,0 +1,138 @@
+"""
+Management command to delete media files no company references any more
+Usage: python manage.py sweep_orphaned_media [--limit N] [--batch-size N] [--min-age-minutes N] [--dry-run] [--restart]
+
+Walks the logo and banner upload directories under MEDIA_ROOT in sorted
+order and stops after --limit files, skipping directories that lie wholly
+before the position where the last run stopped. That position is kept in
+the database (backfill.Checkpoint "media-sweep"), so it survives ephemeral
+filesystems. Files are checked against the database in batches of one
+query each.
+"""
+import os
+import time
+from itertools import islice
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from backfill.models import Checkpoint
+from companies.models import Company
+
+
+CHECKPOINT_NAME = 'media-sweep'
+
+
+class Command(BaseCommand):
+    help = 'Delete logo/banner files in MEDIA_ROOT that are not referenced by any company'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=10000, help='Maximum files to examine in this run')
+        parser.add_argument('--batch-size', type=int, default=500, help='Files checked per database query')
+        parser.add_argument(
+            '--min-age-minutes',
+            type=int,
+            default=60,
+            help='Skip files newer than this (uploads may not be committed yet)',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Report orphans without deleting them')
+        parser.add_argument('--restart', action='store_true', help='Start from the beginning instead of resuming')
+
+    def handle(self, *args, **options):
+        # Dry runs read the checkpoint but never move it
+        save = not options['dry_run']
+        checkpoint, _ = Checkpoint.objects.get_or_create(name=CHECKPOINT_NAME)
+        if options['restart']:
+            checkpoint.last_key = ''
+        if not checkpoint.last_key and save:
+            checkpoint.started_at = timezone.now()
+            checkpoint.finished_at = None
+            checkpoint.processed = 0
+            checkpoint.changed = 0
+            checkpoint.save()
+        candidates = self._candidates(checkpoint.last_key, options['limit'])
+
+        if not candidates:
+            self.stdout.write(self.style.SUCCESS('Scan complete, starting from the beginning next run'))
+            if save:
+                checkpoint.last_key = ''
+                checkpoint.finished_at = timezone.now()
+                checkpoint.save()
+            return
+
+        cutoff = time.time() - options['min_age_minutes'] * 60
+        batch_size = options['batch_size']
+        orphaned = 0
+        deleted = 0
+
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start:start + batch_size]
+            deleted_before = deleted
+            referenced = set()
+            for logo, banner in Company.objects.filter(
+                Q(logo__in=batch) | Q(banner__in=batch)
+            ).values_list('logo', 'banner'):
+                referenced.update([logo, banner])
+
+            for name in batch:
+                if name in referenced:
+                    continue
+                path = os.path.join(settings.MEDIA_ROOT, name)
+                try:
+                    if os.path.getmtime(path) > cutoff:
+                        continue
+                    orphaned += 1
+                    if options['dry_run']:
+                        self.stdout.write(f'  Would delete: {name}')
+                    else:
+                        os.remove(path)
+                        deleted += 1
+                except OSError:
+                    # Removed by someone else in the meantime
+                    continue
+
+            if save:
+                checkpoint.last_key = batch[-1]
+                checkpoint.processed += len(batch)
+                checkpoint.changed += deleted - deleted_before
+                checkpoint.save()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✅ Examined {len(candidates)} files (up to {candidates[-1]})'
+            f'\n   Orphaned: {orphaned}'
+            f'\n   Deleted: {deleted}'
+        ))
+
+    def _candidates(self, after, limit):
+        """Up to `limit` relative file names in the upload directories, in walk order, after `after`"""
+        after_parts = after.split('/') if after else []
+        upload_dirs = sorted(
+            Company._meta.get_field(field_name).upload_to.strip('/') for field_name in Company.FILE_FIELDS
+        )
+
+        def walk_all():
+            for upload_dir in upload_dirs:
+                yield from self._walk(upload_dir.split('/'), after_parts)
+
+        return ['/'.join(parts) for parts in islice(walk_all(), limit)]
+
+    def _walk(self, parts, after):
+        """
+        File paths (as part lists) under MEDIA_ROOT/parts in sorted order, after
+        `after`. Part lists compare the same way the walk visits them, so a
+        directory wholly before the checkpoint is skipped without listing it.
+        """
+        if parts < after[:len(parts)]:
+            return
+        try:
+            entries = sorted(os.scandir(os.path.join(settings.MEDIA_ROOT, *parts)), key=lambda entry: entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        for entry in entries:
+            path = parts + [entry.name]
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._walk(path, after)
+            elif path > after:
+                yield path
@@ -0,0 +1,33 @@
+"""
+Deferred deletion of replaced media files.
+
+Files are only removed after the transaction that stopped referencing them
+commits, and the deletion runs on a background thread so the request does
+not wait on the storage backend.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='media-cleanup')
+
+
+def _delete_files(names):
+    for name in names:
+        try:
+            default_storage.delete(name)
+        except Exception:
+            # The orphaned media sweeper picks up anything left behind
+            logger.exception('Could not delete media file %s', name)
+
+
+def delete_after_commit(names):
+    """Delete storage files once the current transaction commits"""
+    names = [name for name in names if name]
+    if names:
+        transaction.on_commit(lambda: _executor.submit(_delete_files, names))
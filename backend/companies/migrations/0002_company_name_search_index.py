@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-19 15:02
+
+from django.db import migrations
+
+
+def create_name_index(apps, schema_editor):
+    # Serves the admin's name__istartswith, UPPER(name::text) LIKE 'X%' (PostgreSQL only)
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS company_name_upper_idx '
+        'ON companies_company (upper(name::text) text_pattern_ops)'
+    )
+
+
+def drop_name_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX CONCURRENTLY IF EXISTS company_name_upper_idx')
+
+
+class Migration(migrations.Migration):
+    # Concurrent index builds cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('companies', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_name_index, drop_name_index),
+    ]
@@ -1,7 +1,54 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.contrib.auth.models import User
 from django.utils.text import slugify
-import os
+from collections import Counter
+
+from .media import delete_after_commit
+
+
+def allocate_slugs(names):
+    """
+    Return a unique slug for each name, in order.
+
+    Looks up exact candidate slugs (each base plus as many numbered suffixes
+    as it has names) in one query that the unique slug index serves; a LIKE
+    prefix query cannot use it under a non-C collation. Further candidates
+    are only fetched when those are all taken. Slugs stay unique within the
+    list itself - also across bases, since "Acme 1" and a second "Acme" both
+    want "acme-1".
+    """
+    bases = [slugify(name)[:190] or 'company' for name in names]
+    counts = Counter(bases)
+    taken = set()
+    looked_up = set()
+
+    def look_up(candidates):
+        looked_up.update(candidates)
+        taken.update(Company.objects.filter(slug__in=candidates).values_list('slug', flat=True))
+
+    look_up([
+        slug
+        for base, count in counts.items()
+        for slug in [base] + [f'{base}-{suffix}' for suffix in range(1, count + 1)]
+    ])
+
+    slugs = []
+    next_suffix = {}
+    for base in bases:
+        slug = base
+        counter = next_suffix.get(base, 1)
+        window = counts[base]
+        while slug in taken:
+            slug = f"{base}-{counter}"
+            if slug not in looked_up:
+                # Every prefetched suffix was taken; fetch a larger window from here
+                window *= 2
+                look_up([f'{base}-{suffix}' for suffix in range(counter, counter + window)])
+            counter += 1
+        next_suffix[base] = counter
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
 
 
 class Company(models.Model):
@@ -26,37 +73,52 @@ class Company(models.Model):
     def __str__(self):
         return self.name
     
+    # File fields whose previous files are deleted when replaced
+    FILE_FIELDS = ('logo', 'banner')
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored file names so save() can detect replacements without a query
+        loaded = dict(zip(field_names, values))
+        instance._loaded_files = {
+            field: loaded[field] or '' for field in cls.FILE_FIELDS if field in loaded
+        }
+        return instance
+    
+    def _current_files(self):
+        return {
+            field: getattr(self, field).name or ''
+            for field in getattr(self, '_loaded_files', {})
+        }
+    
     def save(self, *args, **kwargs):
-        # Delete old logo/banner files if being updated
-        if self.pk:
-            try:
-                old_instance = Company.objects.get(pk=self.pk)
-                # Delete old logo if new one is uploaded
-                if old_instance.logo and self.logo != old_instance.logo:
-                    try:
-                        if old_instance.logo and os.path.isfile(old_instance.logo.path):
-                            os.remove(old_instance.logo.path)
-                    except (ValueError, OSError):
-                        # File might not exist or already deleted
-                        pass
-                # Delete old banner if new one is uploaded
-                if old_instance.banner and self.banner != old_instance.banner:
-                    try:
-                        if old_instance.banner and os.path.isfile(old_instance.banner.path):
-                            os.remove(old_instance.banner.path)
-                    except (ValueError, OSError):
-                        # File might not exist or already deleted
-                        pass
-            except Company.DoesNotExist:
-                pass
+        self._save_with_slug(*args, **kwargs)
         
+        # Old logo/banner files are deleted after the new values are committed
+        # (compared after saving, when uploads have their final storage names)
+        current_files = self._current_files()
+        replaced = [
+            old_name for field, old_name in getattr(self, '_loaded_files', {}).items()
+            if old_name and old_name != current_files[field]
+        ]
+        delete_after_commit(replaced)
+        self._loaded_files = current_files
+    
+    def _save_with_slug(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.name)
-            # Ensure uniqueness
-            original_slug = self.slug
-            counter = 1
-            while Company.objects.filter(slug=self.slug).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
+            # Allocate a free slug in one query; retry if another request took it meanwhile
+            for attempt in range(3):
+                self.slug = allocate_slugs([self.name])[0]
+                try:
+                    with transaction.atomic():
+                        super().save(*args, **kwargs)
+                    return
+                except IntegrityError:
+                    # Only a lost race for the slug is worth retrying
+                    slug_taken = Company.objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
+                    if attempt == 2 or not slug_taken:
+                        raise
+                    self.slug = ''
         super().save(*args, **kwargs)
 
@@ -0,0 +1,18 @@
+"""
+Evict saved or deleted companies from this process's slug cache.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import cache
+from .models import Company
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_company_cache(sender, instance, **kwargs):
+    company_id = instance.id
+    cache.invalidate(company_id)
+    # Again after commit: a request in between may have cached the old row
+    transaction.on_commit(lambda: cache.invalidate(company_id))
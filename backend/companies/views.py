@@ -2,9 +2,11 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.shortcuts import get_object_or_404
+from django.http import Http404
+from .cache import get_company
 from .models import Company
 from .serializers import CompanySerializer, CompanyPublicSerializer
+from careers_builder.throttling import PUBLIC_THROTTLES
 
 
 class CompanyViewSet(viewsets.ModelViewSet):
@@ -23,7 +25,7 @@ class CompanyViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get', 'put', 'patch', 'post'])
     def me(self, request):
         """Get, create, or update current user's company"""
-        company = Company.objects.filter(recruiter=request.user).first()
+        company = Company.objects.filter(recruiter=request.user).select_related('recruiter').first()
         
         if request.method == 'GET':
             if not company:
@@ -64,47 +66,19 @@ class CompanyViewSet(viewsets.ModelViewSet):
                     name=request.data.get('name', f"{request.user.username}'s Company")
                 )
             
-            # Store old file paths before update
-            old_logo_path = None
-            old_banner_path = None
-            try:
-                if company.logo:
-                    old_logo_path = company.logo.path
-                if company.banner:
-                    old_banner_path = company.banner.path
-            except (ValueError, AttributeError):
-                # Files might not exist
-                pass
-            
+            # Replaced logo/banner files are cleaned up by Company.save after commit
             serializer = self.get_serializer(company, data=request.data, partial=True)
             serializer.is_valid(raise_exception=True)
             serializer.save()
             
-            # Delete old files if new ones were uploaded (handled in model.save, but double-check here)
-            import os
-            updated_company = Company.objects.get(pk=company.pk)
-            try:
-                if old_logo_path and updated_company.logo:
-                    new_logo_path = updated_company.logo.path
-                    if old_logo_path != new_logo_path and os.path.isfile(old_logo_path):
-                        os.remove(old_logo_path)
-            except (ValueError, OSError, AttributeError):
-                pass
-            
-            try:
-                if old_banner_path and updated_company.banner:
-                    new_banner_path = updated_company.banner.path
-                    if old_banner_path != new_banner_path and os.path.isfile(old_banner_path):
-                        os.remove(old_banner_path)
-            except (ValueError, OSError, AttributeError):
-                pass
-            
             return Response(serializer.data)
     
-    @action(detail=True, methods=['get'], permission_classes=[AllowAny])
+    @action(detail=True, methods=['get'], permission_classes=[AllowAny], throttle_classes=PUBLIC_THROTTLES)
     def public(self, request, slug=None):
         """Public endpoint for careers page (no auth required)"""
-        company = get_object_or_404(Company, slug=slug)
+        company = get_company(slug)
+        if company is None:
+            raise Http404('Company not found')
         serializer = CompanyPublicSerializer(company, context={'request': request})
         return Response(serializer.data)
 
@@ -4,8 +4,9 @@ from .models import ContentSection
 
 @admin.register(ContentSection)
 class ContentSectionAdmin(admin.ModelAdmin):
-    list_display = ['title', 'company', 'section_type', 'order', 'is_active', 'created_at']
-    list_filter = ['section_type', 'is_active', 'created_at', 'company']
+    list_display = ['title', 'company', 'section_type', 'content_format', 'order', 'is_active', 'created_at']
+    list_filter = ['section_type', 'content_format', 'is_active', 'created_at']
     search_fields = ['title', 'content', 'company__name']
-    ordering = ['company', 'order']
-
+    list_select_related = ['company']
+    autocomplete_fields = ['company']
+    ordering = ['company_id', 'order']  # No join to sort by the company's own ordering
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:39
+
+from django.db import migrations, models
+
+from content.rendering import render_content
+
+
+def render_existing_sections(apps, schema_editor):
+    """Pre-render every existing section (all of them are plain text)"""
+    ContentSection = apps.get_model('content', 'ContentSection')
+    sections = ContentSection.objects.only('id', 'content', 'content_format').iterator(chunk_size=500)
+    batch = []
+    for section in sections:
+        section.content_html = render_content(section.content, section.content_format)
+        batch.append(section)
+        if len(batch) >= 500:
+            ContentSection.objects.bulk_update(batch, ['content_html'])
+            batch = []
+    if batch:
+        ContentSection.objects.bulk_update(batch, ['content_html'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0002_alter_contentsection_unique_together'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contentsection',
+            name='content_format',
+            field=models.CharField(choices=[('text', 'Plain text'), ('markdown', 'Markdown')], default='text', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='contentsection',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(render_existing_sections, migrations.RunPython.noop),
+    ]
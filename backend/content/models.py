@@ -1,5 +1,6 @@
-from django.db import models
+from django.db import models, router, transaction
 from companies.models import Company
+from .rendering import render_content
 
 
 class ContentSection(models.Model):
@@ -12,15 +13,33 @@ class ContentSection(models.Model):
         ('custom', 'Custom'),
     ]
     
+    CONTENT_FORMATS = [
+        ('text', 'Plain text'),
+        ('markdown', 'Markdown'),
+    ]
+    
     company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='content_sections')
     section_type = models.CharField(max_length=20, choices=SECTION_TYPES)
     title = models.CharField(max_length=200)
     content = models.TextField()
+    content_format = models.CharField(max_length=10, choices=CONTENT_FORMATS, default='text')
+    # Sanitized HTML rendered from content on save (see content/rendering.py)
+    content_html = models.TextField(blank=True, editable=False)
     order = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'content', 'content_format'} & set(update_fields):
+            self.content_html = render_content(self.content, self.content_format)
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'content_html'}
+        # Commit together with the post_save handlers (e.g. the sync change log entry)
+        with transaction.atomic(using=kwargs.get('using') or router.db_for_write(type(self), instance=self)):
+            super().save(*args, **kwargs)
+    
     class Meta:
         ordering = ['order', 'created_at']
     
@@ -0,0 +1,31 @@
+"""
+Render content sections to sanitized HTML once, when they are saved.
+
+Careers pages, feeds and other consumers read ContentSection.content_html
+as-is, so nothing is parsed or sanitized per view. Everything goes through
+nh3 (an allow-list sanitizer) because recruiters can type raw HTML in both
+formats.
+"""
+import markdown
+import nh3
+
+
+MARKDOWN_EXTENSIONS = ['extra', 'sane_lists']
+
+# nh3's default allow-list, without elements a careers page section has no use for
+ALLOWED_TAGS = nh3.ALLOWED_TAGS - {'area', 'map', 'nav', 'header', 'footer', 'aside', 'article'}
+
+
+def sanitize(html):
+    return nh3.clean(html, tags=ALLOWED_TAGS, link_rel='noopener noreferrer nofollow')
+
+
+def render_content(content, content_format):
+    """HTML for a section's content in the given format ('markdown' or 'text')"""
+    content = content or ''
+    if content_format == 'markdown':
+        html = markdown.markdown(content, extensions=MARKDOWN_EXTENSIONS, output_format='html')
+    else:
+        # Plain text keeps its line breaks (inline HTML was always allowed)
+        html = content.replace('\r\n', '\n').replace('\n', '<br />')
+    return sanitize(html)
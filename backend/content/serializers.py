@@ -11,16 +11,16 @@ class ContentSectionSerializer(serializers.ModelSerializer):
         model = ContentSection
         fields = [
             'id', 'company', 'company_name', 'company_slug',
-            'section_type', 'title', 'content', 'order',
+            'section_type', 'title', 'content', 'content_format', 'content_html', 'order',
             'is_active', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'company', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'company', 'content_html', 'created_at', 'updated_at']
 
 
 class ContentSectionPublicSerializer(serializers.ModelSerializer):
     """Serializer for public careers page"""
     class Meta:
         model = ContentSection
-        fields = ['id', 'section_type', 'title', 'content', 'order']
+        fields = ['id', 'section_type', 'title', 'content', 'content_format', 'content_html', 'order']
         read_only_fields = ['id']
 
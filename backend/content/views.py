@@ -5,7 +5,10 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.shortcuts import get_object_or_404
 from .models import ContentSection
 from .serializers import ContentSectionSerializer, ContentSectionPublicSerializer
+from companies.cache import get_company
 from companies.models import Company
+from careers_builder.throttling import PUBLIC_THROTTLES
+from sync.changes import record_queryset as record_changes
 
 
 class ContentSectionViewSet(viewsets.ModelViewSet):
@@ -51,13 +54,15 @@ class ContentSectionViewSet(viewsets.ModelViewSet):
                 id=section_id,
                 company=company
             ).update(order=index)
+        # update() skips the signals that write the change log
+        record_changes(ContentSection.objects.filter(id__in=section_ids, company=company))
         
         # Return updated sections
         sections = ContentSection.objects.filter(company=company).order_by('order')
         serializer = self.get_serializer(sections, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @action(detail=False, methods=['get'], permission_classes=[AllowAny], throttle_classes=PUBLIC_THROTTLES)
     def public(self, request):
         """Public endpoint for content sections"""
         company_slug = request.query_params.get('company')
@@ -68,9 +73,8 @@ class ContentSectionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            company = Company.objects.get(slug=company_slug)
-        except Company.DoesNotExist:
+        company = get_company(company_slug)
+        if company is None:
             return Response(
                 {'error': 'Company not found'},
                 status=status.HTTP_404_NOT_FOUND
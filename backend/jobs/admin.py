@@ -1,10 +1,60 @@
 from django.contrib import admin
-from .models import Job
+from django.contrib.postgres.search import SearchQuery
+from django.db import connections
+
+from careers_builder.paginators import EstimatedCountPaginator
+from companies.models import Company
+
+from .models import ArchivedJob, Job
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist settings for tables with millions of rows: estimated counts, no
+    second COUNT for filtered results, and searches that always hit an index.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_select_related = ['company']
+    # Choice filters only; a company filter would list every company
+    list_filter = ['employment_type', 'work_policy', 'experience']
+    id_field = 'id'
+    
+    def search_text(self, queryset, term):
+        return queryset.none()
+    
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        if term.isdigit():
+            return queryset.filter(**{self.id_field: int(term)}), False
+        company_id = Company.objects.filter(slug=term).values_list('id', flat=True).first()
+        if company_id is not None:
+            return queryset.filter(company_id=company_id), False
+        return self.search_text(queryset, term), False
 
 
 @admin.register(Job)
-class JobAdmin(admin.ModelAdmin):
-    list_display = ['title', 'company', 'location', 'employment_type', 'work_policy', 'posted_date']
-    list_filter = ['employment_type', 'work_policy', 'experience', 'posted_date', 'company']
-    search_fields = ['title', 'description', 'location', 'company__name']
+class JobAdmin(LargeTableAdmin):
+    list_display = ['title', 'company', 'location', 'employment_type', 'work_policy', 'status', 'posted_date']
+    list_filter = ['status'] + LargeTableAdmin.list_filter
+    search_fields = ['title']  # Handled by get_search_results
+    search_help_text = 'Job ID, company slug, or words from the title, department, location or description'
+    autocomplete_fields = ['company']
+    
+    def search_text(self, queryset, term):
+        if connections[queryset.db].vendor == 'postgresql':
+            # GIN index on the trigger-maintained search_vector (migration 0008)
+            return queryset.filter(search_vector=SearchQuery(term, search_type='websearch', config='english'))
+        return queryset.filter(title__icontains=term)
+
 
+@admin.register(ArchivedJob)
+class ArchivedJobAdmin(LargeTableAdmin):
+    list_display = ['title', 'company', 'location', 'closed_at', 'archived_at']
+    search_fields = ['original_id']  # Handled by get_search_results
+    search_help_text = 'Original job ID or company slug'
+    id_field = 'original_id'
+    raw_id_fields = ['company']
+    readonly_fields = [field.name for field in ArchivedJob._meta.fields]
@@ -5,3 +5,6 @@ class JobsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'jobs'
 
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,95 @@
+"""
+Job export to CSV and XLSX.
+
+Rows come from `.values_list().iterator()`, which uses a server-side cursor
+on PostgreSQL, so memory stays flat however many jobs a company has. CSV is
+streamed as it is produced; XLSX is written with openpyxl's write-only mode
+to a temporary file and then streamed from disk.
+
+Column headers match what import_jobs_from_excel recognises, so an XLSX
+export can be imported again.
+"""
+import csv
+import tempfile
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+
+# (header, Job field) in export order
+EXPORT_COLUMNS = [
+    ('Title', 'title'),
+    ('Description', 'description'),
+    ('Location', 'location'),
+    ('Work Policy', 'work_policy'),
+    ('Employment Type', 'employment_type'),
+    ('Department', 'department'),
+    ('Experience', 'experience'),
+    ('Salary Range', 'salary_range'),
+    ('Posted Date', 'posted_date'),
+]
+
+ITERATOR_CHUNK_SIZE = 2000
+
+# Spreadsheet apps run cells starting with these as formulas
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def export_rows(jobs):
+    """Yield one tuple of column values per job, oldest first"""
+    fields = [field for _, field in EXPORT_COLUMNS]
+    return jobs.order_by('id').values_list(*fields).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for csv.writer streaming"""
+
+    def write(self, value):
+        return value
+
+
+def _csv_safe(value):
+    if value is None:
+        return ''
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(rows):
+    """Yield the CSV export line by line (UTF-8 with BOM so Excel detects the encoding)"""
+    writer = csv.writer(_Echo())
+    yield '\ufeff' + writer.writerow([header for header, _ in EXPORT_COLUMNS])
+    for row in rows:
+        yield writer.writerow([_csv_safe(value) for value in row])
+
+
+def write_xlsx(rows, destination):
+    """Write the XLSX export to a path or binary file object"""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Jobs')
+    sheet.append([header for header, _ in EXPORT_COLUMNS])
+    for row in rows:
+        sheet.append([_xlsx_cell(sheet, value) for value in row])
+    workbook.save(destination)
+
+
+def _xlsx_cell(sheet, value):
+    if not isinstance(value, str):
+        return value
+    value = ILLEGAL_CHARACTERS_RE.sub('', value)
+    if value.startswith('='):
+        # openpyxl would store this as a formula; keep it as text
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.data_type = 's'
+        return cell
+    return value
+
+
+def xlsx_tempfile(rows):
+    """Write the XLSX export to a temporary file (deleted on close), rewound for reading"""
+    handle = tempfile.TemporaryFile(suffix='.xlsx')
+    write_xlsx(rows, handle)
+    handle.seek(0)
+    return handle
@@ -0,0 +1,418 @@
+"""
+Crawler feeds: XML sitemaps, schema.org JobPosting JSON-LD and RSS, for one
+company or across all companies.
+
+Feeds are streamed from `.iterator()` querysets and the finished output is
+cached under the content version from jobs/versions.py. Bodies up to
+FEED_CACHE_MAX_BYTES go to the shared cache; larger ones are written to
+FEED_CACHE_DIR and the cache keeps their path. The version is also the ETag,
+so repeat crawls get either the cached body or a 304 and never touch the
+listing queries.
+
+Any job write bumps the global version, so the feeds across all companies
+would rarely stay cached. They are versioned by FEED_GLOBAL_REFRESH_SECONDS
+windows instead and may lag writes by up to that long.
+
+Sitemaps and JSON-LD are split into shards of consecutive job ids once they
+outgrow one file. Shard boundaries are found once per version and cached, so
+each shard is an id-range query rather than an OFFSET.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.urls import reverse
+
+from careers_builder.throttling import check_public_rate_limit
+from companies.cache import get_company
+from monitoring.metrics import record_cache
+
+from . import versions
+from .models import Job
+
+
+SITEMAP_MAX_URLS = 50000   # protocol limit per sitemap file
+JSONLD_PAGE_SIZE = 2000    # jobs per JSON-LD shard, a few MB
+RSS_MAX_ITEMS = 200
+ITERATOR_CHUNK_SIZE = 2000
+
+JOB_FIELDS = (
+    'id', 'title', 'description', 'location', 'city', 'region', 'country', 'work_policy',
+    'department', 'employment_type', 'salary_min', 'salary_max', 'salary_currency',
+    'created_at', 'updated_at', 'company__name', 'company__slug', 'company__logo',
+)
+
+SCHEMA_EMPLOYMENT_TYPES = {
+    'full-time': 'FULL_TIME',
+    'part-time': 'PART_TIME',
+    'contract': 'CONTRACTOR',
+}
+
+# Characters that are not allowed anywhere in an XML document
+INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _xml(value):
+    return escape(INVALID_XML_CHARS.sub('', str(value)))
+
+
+def careers_url(slug):
+    return f'{settings.FRONTEND_URL.rstrip("/")}/{slug}/careers'
+
+
+def job_url(job):
+    return f'{careers_url(job["company__slug"])}?job={job["id"]}'
+
+
+def _scope(slug):
+    """(jobs queryset, company or None, cache scope, content version)"""
+    jobs = Job.objects.open()
+    if slug is None:
+        refresh = getattr(settings, 'FEED_GLOBAL_REFRESH_SECONDS', 900)
+        return jobs, None, versions.GLOBAL, int(time.time() // refresh)
+    company = get_company(slug)
+    if company is None:
+        raise Http404('Company not found')
+    return jobs.filter(company=company), company, slug, versions.get_version(company.id)
+
+
+def _cache_dir():
+    return getattr(settings, 'FEED_CACHE_DIR', os.path.join(settings.BASE_DIR, 'feed_cache'))
+
+
+def _prune_cache_dir(directory, max_age):
+    """Remove bodies (and abandoned partial writes) older than the cache timeout"""
+    cutoff = time.time() - max_age
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass   # removed by another process
+
+
+def _tee_to_cache(chunks, key):
+    """
+    Yield chunks while keeping a copy to cache once the stream completes.
+
+    Past FEED_CACHE_MAX_BYTES the copy moves to a file in FEED_CACHE_DIR,
+    which is renamed into place only when the whole body was written.
+    """
+    limit = getattr(settings, 'FEED_CACHE_MAX_BYTES', 5 * 1024 * 1024)
+    timeout = getattr(settings, 'FEED_CACHE_SECONDS', 3600)
+    parts = []
+    size = 0
+    spill = None
+    complete = False
+    try:
+        for chunk in chunks:
+            if spill is not None:
+                spill.write(chunk)
+            else:
+                parts.append(chunk)
+                size += len(chunk)
+                if size > limit:
+                    directory = _cache_dir()
+                    os.makedirs(directory, exist_ok=True)
+                    _prune_cache_dir(directory, timeout)
+                    spill = tempfile.NamedTemporaryFile(
+                        'w', encoding='utf-8', dir=directory, suffix='.tmp', delete=False
+                    )
+                    spill.write(''.join(parts))
+                    parts = None
+            yield chunk
+        complete = True
+    finally:
+        if spill is not None:
+            spill.close()
+            if not complete:
+                os.unlink(spill.name)
+    if spill is None:
+        cache.set(key, ''.join(parts), timeout)
+    else:
+        path = os.path.join(os.path.dirname(spill.name), hashlib.sha256(key.encode()).hexdigest())
+        os.replace(spill.name, path)
+        cache.set(key, {'path': path}, timeout)
+
+
+def _cached_body(cache_key):
+    """The cached body (a string or an open file), or None"""
+    body = cache.get(cache_key)
+    if isinstance(body, dict):
+        # Stored on disk, possibly by another host
+        try:
+            return open(body['path'], 'rb')
+        except FileNotFoundError:
+            return None
+    return body
+
+
+def _feed_response(request, key, content_type, generate, slug=None):
+    etag = f'"{key}"'
+    if etag in request.headers.get('If-None-Match', ''):
+        response = HttpResponseNotModified()
+    else:
+        cache_key = f'job-feed:{key}'
+        body = _cached_body(cache_key)
+        record_cache('feeds', body is not None)
+        if isinstance(body, str):
+            response = HttpResponse(body, content_type=content_type)
+        elif body is not None:
+            response = FileResponse(body, content_type=content_type)
+        else:
+            # Only renders cost anything, so cached bodies and 304s are not rate limited
+            limited = check_public_rate_limit(request, slug)
+            if limited is not None:
+                return limited
+            response = StreamingHttpResponse(_tee_to_cache(generate(), cache_key), content_type=content_type)
+    response['ETag'] = etag
+    response['Cache-Control'] = f'public, max-age={getattr(settings, "FEED_MAX_AGE", 900)}'
+    return response
+
+
+def _url_name(name, slug):
+    return f'company-job-feed-{name}' if slug else f'job-feed-{name}'
+
+
+def _url_kwargs(slug, **kwargs):
+    return {'slug': slug, **kwargs} if slug else kwargs
+
+
+def _shards(jobs, key, size, first_size=None):
+    """
+    [(after_id, last_id)] bounds of consecutive-id shards of `size` jobs
+    (`first_size` for the first one). The last shard is open ended (last_id
+    None). Cached under the feed's key, so every shard of a version agrees.
+    """
+    cache_key = f'job-feed-shards:{key}'
+    shards = cache.get(cache_key)
+    if shards is not None:
+        return shards
+    ids = jobs.order_by('id').values_list('id', flat=True)
+    shards = []
+    after = 0
+    limit = first_size or size
+    while True:
+        # Each step only skips the rows of one shard, walking from the previous bound
+        last = list(ids.filter(id__gt=after)[limit - 1:limit])
+        if not last:
+            if not shards or ids.filter(id__gt=after).exists():
+                shards.append((after, None))
+            break
+        shards.append((after, last[0]))
+        after = last[0]
+        limit = size
+    cache.set(cache_key, shards, getattr(settings, 'FEED_CACHE_SECONDS', 3600))
+    return shards
+
+
+def _shard(jobs, shards, page):
+    """The jobs of one shard (1-based), ordered by id"""
+    if page > len(shards):
+        return jobs.none()
+    after, last = shards[page - 1]
+    jobs = jobs.filter(id__gt=after)
+    if last is not None:
+        jobs = jobs.filter(id__lte=last)
+    return jobs.order_by('id')
+
+
+# Sitemaps
+
+def _sitemap_shards(jobs, company, key):
+    # The company's careers page takes one slot in its own first shard
+    reserved = 1 if company else 0
+    return _shards(jobs, key, SITEMAP_MAX_URLS, SITEMAP_MAX_URLS - reserved)
+
+
+def sitemap(request, slug=None):
+    """Sitemap, or a sitemap index when there are more jobs than one file may hold"""
+    jobs, company, scope, version = _scope(slug)
+    key = f'sitemap:{scope}:{version}'
+
+    def generate():
+        shards = _sitemap_shards(jobs, company, key)
+        if len(shards) == 1:
+            yield from _urlset(jobs, company)
+            return
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+        yield '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        for page in range(1, len(shards) + 1):
+            url = request.build_absolute_uri(
+                reverse(_url_name('sitemap-page', slug), kwargs=_url_kwargs(slug, page=page))
+            )
+            yield f'<sitemap><loc>{_xml(url)}</loc></sitemap>\n'
+        yield '</sitemapindex>\n'
+
+    return _feed_response(request, key, 'application/xml; charset=utf-8', generate, slug)
+
+
+def sitemap_page(request, page, slug=None):
+    """One shard of a sharded sitemap"""
+    jobs, company, scope, version = _scope(slug)
+    if page < 1:
+        raise Http404('Sitemap page not found')
+    index_key = f'sitemap:{scope}:{version}'
+
+    def generate():
+        shard = _shard(jobs, _sitemap_shards(jobs, company, index_key), page)
+        yield from _urlset(shard, company if page == 1 else None)
+
+    return _feed_response(request, f'{index_key}:{page}', 'application/xml; charset=utf-8', generate, slug)
+
+
+def _urlset(jobs, company):
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    if company:
+        yield f'<url><loc>{_xml(careers_url(company.slug))}</loc></url>\n'
+    if not jobs.query.order_by:
+        jobs = jobs.order_by('id')
+    for job in jobs.values('id', 'updated_at', 'company__slug').iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        lastmod = f'<lastmod>{job["updated_at"].date().isoformat()}</lastmod>' if job['updated_at'] else ''
+        yield f'<url><loc>{_xml(job_url(job))}</loc>{lastmod}</url>\n'
+    yield '</urlset>\n'
+
+
+# RSS
+
+def rss(request, slug=None):
+    """RSS 2.0 feed of the newest jobs"""
+    jobs, company, scope, version = _scope(slug)
+    key = f'rss:{scope}:{version}'
+
+    def generate():
+        title = f'{company.name} careers' if company else 'Latest jobs'
+        link = careers_url(company.slug) if company else settings.FRONTEND_URL
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>\n'
+        yield f'<title>{_xml(title)}</title><link>{_xml(link)}</link>'
+        yield f'<description>{_xml(title)}</description>\n'
+        newest = jobs.order_by('-id').values(*JOB_FIELDS)[:RSS_MAX_ITEMS]
+        for job in newest.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+            yield _rss_item(job)
+        yield '</channel></rss>\n'
+
+    return _feed_response(request, key, 'application/rss+xml; charset=utf-8', generate, slug)
+
+
+def _rss_item(job):
+    parts = [
+        f'<title>{_xml(job["title"])} - {_xml(job["company__name"])}</title>',
+        f'<link>{_xml(job_url(job))}</link>',
+        f'<guid isPermaLink="false">job-{job["id"]}</guid>',
+        f'<description>{_xml(job["description"] or job["title"])}</description>',
+    ]
+    if job['department']:
+        parts.append(f'<category>{_xml(job["department"])}</category>')
+    if job['created_at']:
+        parts.append(f'<pubDate>{format_datetime(job["created_at"])}</pubDate>')
+    return f'<item>{"".join(parts)}</item>\n'
+
+
+# JSON-LD
+
+def jsonld(request, slug=None):
+    """
+    schema.org JobPosting graph for every job, or an ItemList of the shard
+    URLs when there are more than JSONLD_PAGE_SIZE jobs
+    """
+    jobs, company, scope, version = _scope(slug)
+    key = f'jsonld:{scope}:{version}'
+    media_url = request.build_absolute_uri(settings.MEDIA_URL)
+
+    def generate():
+        shards = _shards(jobs, key, JSONLD_PAGE_SIZE)
+        if len(shards) == 1:
+            yield from _job_graph(jobs.order_by('id'), media_url)
+            return
+        yield '{"@context": "https://schema.org", "@type": "ItemList", "itemListElement": ['
+        for page in range(1, len(shards) + 1):
+            url = request.build_absolute_uri(
+                reverse(_url_name('jsonld-page', slug), kwargs=_url_kwargs(slug, page=page))
+            )
+            item = {'@type': 'ListItem', 'position': page, 'url': url}
+            yield (',' if page > 1 else '') + '\n' + json.dumps(item, ensure_ascii=False)
+        yield '\n]}\n'
+
+    return _feed_response(request, key, 'application/ld+json; charset=utf-8', generate, slug)
+
+
+def jsonld_page(request, page, slug=None):
+    """One shard of a sharded JSON-LD feed"""
+    jobs, company, scope, version = _scope(slug)
+    if page < 1:
+        raise Http404('JSON-LD page not found')
+    index_key = f'jsonld:{scope}:{version}'
+    media_url = request.build_absolute_uri(settings.MEDIA_URL)
+
+    def generate():
+        yield from _job_graph(_shard(jobs, _shards(jobs, index_key, JSONLD_PAGE_SIZE), page), media_url)
+
+    return _feed_response(request, f'{index_key}:{page}', 'application/ld+json; charset=utf-8', generate, slug)
+
+
+def _job_graph(jobs, media_url):
+    yield '{"@context": "https://schema.org", "@graph": ['
+    first = True
+    for job in jobs.values(*JOB_FIELDS).iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        yield ('' if first else ',') + '\n' + json.dumps(job_posting(job, media_url), ensure_ascii=False)
+        first = False
+    yield '\n]}\n'
+
+
+def job_posting(job, media_url):
+    """schema.org JobPosting for one job (a dict of JOB_FIELDS values)"""
+    organization = {
+        '@type': 'Organization',
+        'name': job['company__name'],
+        'sameAs': careers_url(job['company__slug']),
+    }
+    if job['company__logo']:
+        organization['logo'] = media_url + job['company__logo']
+
+    posting = {
+        '@type': 'JobPosting',
+        'identifier': {'@type': 'PropertyValue', 'name': job['company__name'], 'value': str(job['id'])},
+        'title': job['title'],
+        'description': job['description'] or job['title'],
+        'url': job_url(job),
+        'hiringOrganization': organization,
+        'employmentType': SCHEMA_EMPLOYMENT_TYPES.get(job['employment_type'], 'OTHER'),
+    }
+    if job['created_at']:
+        posting['datePosted'] = job['created_at'].date().isoformat()
+
+    address = {
+        key: value
+        for key, value in (
+            ('addressLocality', job['city']),
+            ('addressRegion', job['region']),
+            ('addressCountry', job['country']),
+        )
+        if value
+    }
+    if job['work_policy'] == 'remote':
+        posting['jobLocationType'] = 'TELECOMMUTE'
+        if job['country']:
+            posting['applicantLocationRequirements'] = {'@type': 'Country', 'name': job['country']}
+    else:
+        posting['jobLocation'] = {
+            '@type': 'Place',
+            'address': {'@type': 'PostalAddress', **(address or {'addressLocality': job['location']})},
+        }
+
+    if job['salary_max'] and job['salary_currency']:
+        value = {'@type': 'QuantitativeValue', 'maxValue': job['salary_max'], 'unitText': 'YEAR'}
+        if job['salary_min']:
+            value['minValue'] = job['salary_min']
+        posting['baseSalary'] = {'@type': 'MonetaryAmount', 'currency': job['salary_currency'], 'value': value}
+    return posting
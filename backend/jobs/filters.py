@@ -0,0 +1,174 @@
+"""
+Query-parameter filters shared by the public job endpoints.
+
+All filters use AND logic. Invalid values raise FilterError, which the views
+turn into a 400 response.
+"""
+import math
+
+from django.db.models import F, Q
+
+from .locations import bounding_box, distance_km, parse_location
+
+
+DEFAULT_RADIUS_KM = 50
+MAX_RADIUS_KM = 500
+
+# Normalize to match model choices
+EMPLOYMENT_TYPE_ALIASES = {
+    'full-time': 'full-time',
+    'fulltime': 'full-time',
+    'full time': 'full-time',
+    'part-time': 'part-time',
+    'parttime': 'part-time',
+    'part time': 'part-time',
+    'contract': 'contract',
+}
+
+WORK_POLICY_ALIASES = {
+    'remote': 'remote',
+    'hybrid': 'hybrid',
+    'onsite': 'onsite',
+    'on-site': 'onsite',
+    'on site': 'onsite',
+    'office': 'onsite',
+}
+
+EXPERIENCE_ALIASES = {
+    'senior': 'senior',
+    'junior': 'junior',
+    'mid-level': 'mid-level',
+    'mid level': 'mid-level',
+    'midlevel': 'mid-level',
+    'mid': 'mid-level',
+}
+
+
+class FilterError(ValueError):
+    pass
+
+
+def _param(params, name):
+    value = params.get(name)
+    return value.strip() if value and value.strip() else None
+
+
+def _number(params, name, cast=float):
+    value = _param(params, name)
+    if value is None:
+        return None
+    try:
+        number = float(value)
+        if not math.isfinite(number):
+            raise ValueError(value)
+        return cast(number)
+    except (ValueError, OverflowError):
+        raise FilterError(f'{name} must be a number')
+
+
+def apply_filters(jobs, params, text_search=True):
+    """
+    Filter a Job queryset by the public query parameters.
+
+    text_search: apply `search` as a title/description substring match.
+    Callers with a better text search (full-text ranking) pass False.
+    """
+    # Known places use the parsed (indexed) fields, anything else falls back to text
+    location = _param(params, 'location')
+    if location:
+        parsed = parse_location(location)
+        if parsed.city:
+            jobs = jobs.filter(city=parsed.city, country=parsed.country)
+        elif parsed.country:
+            jobs = jobs.filter(country=parsed.country)
+        else:
+            jobs = jobs.filter(location__icontains=location)
+
+    jobs = _apply_radius(jobs, params)
+
+    employment_type = _param(params, 'employment_type')
+    if employment_type:
+        employment_type = employment_type.lower()
+        jobs = jobs.filter(employment_type__iexact=EMPLOYMENT_TYPE_ALIASES.get(employment_type, employment_type))
+
+    work_policy = _param(params, 'work_policy')
+    if work_policy:
+        work_policy = work_policy.lower()
+        jobs = jobs.filter(work_policy__iexact=WORK_POLICY_ALIASES.get(work_policy, work_policy))
+
+    # Only matches jobs where experience is not NULL
+    experience = _param(params, 'experience')
+    if experience:
+        experience = experience.lower()
+        jobs = jobs.filter(experience__iexact=EXPERIENCE_ALIASES.get(experience, experience))
+
+    department = _param(params, 'department')
+    if department:
+        jobs = jobs.filter(department__icontains=department)
+
+    # Search by title or description
+    search = _param(params, 'search')
+    if search and text_search:
+        jobs = jobs.filter(Q(title__icontains=search) | Q(description__icontains=search))
+
+    # Salary range overlap: jobs paying at least salary_min / at most salary_max
+    # (annualized amounts, see jobs/salary.py)
+    salary_min = _number(params, 'salary_min', int)
+    if salary_min is not None:
+        jobs = jobs.filter(salary_max__gte=salary_min)
+    salary_max = _number(params, 'salary_max', int)
+    if salary_max is not None:
+        jobs = jobs.filter(salary_min__lte=salary_max)
+
+    currency = _param(params, 'currency')
+    if currency:
+        jobs = jobs.filter(salary_currency=currency.upper())
+
+    return jobs
+
+
+def _apply_radius(jobs, params):
+    """Radius search: ?near=Pune or ?lat=18.52&lng=73.85, with optional radius_km"""
+    near = _param(params, 'near')
+    if near:
+        parsed = parse_location(near)
+        if parsed.latitude is None:
+            raise FilterError(f'Unknown location: {near}')
+        center = (parsed.latitude, parsed.longitude)
+    elif _param(params, 'lat') and _param(params, 'lng'):
+        try:
+            center = (float(params['lat']), float(params['lng']))
+        except ValueError:
+            raise FilterError('lat and lng must be numbers')
+        if not (-90 <= center[0] <= 90 and -180 <= center[1] <= 180):
+            raise FilterError('lat/lng out of range')
+    else:
+        return jobs
+
+    radius = _number(params, 'radius_km')
+    radius = min(max(DEFAULT_RADIUS_KM if radius is None else radius, 0), MAX_RADIUS_KM)
+
+    # Index-friendly box first, exact distance only for the rows inside it
+    min_lat, max_lat, min_lng, max_lng = bounding_box(*center, radius)
+    return jobs.filter(
+        latitude__range=(min_lat, max_lat),
+        longitude__range=(min_lng, max_lng),
+    ).annotate(
+        distance_km=distance_km(*center)
+    ).filter(distance_km__lte=radius).order_by('distance_km', '-id')
+
+
+SORTS = {
+    'newest': ['-id'],
+    'oldest': ['id'],
+    'title': ['title', '-id'],
+    # Jobs without a salary go last
+    'salary': [F('salary_max').desc(nulls_last=True), '-id'],
+    'salary_asc': [F('salary_min').asc(nulls_last=True), '-id'],
+}
+
+
+def apply_sort(jobs, params):
+    """sort=newest|oldest|title|salary (highest first)|salary_asc; anything else keeps the current order"""
+    ordering = SORTS.get(params.get('sort'))
+    return jobs.order_by(*ordering) if ordering else jobs
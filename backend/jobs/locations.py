@@ -0,0 +1,133 @@
+"""
+Offline location parsing for job postings.
+
+Free-text locations ("Bangalore, India", "San Francisco, CA", "Remote - UK")
+are matched against a bundled gazetteer (jobs/data/gazetteer.csv) to get a
+normalized city, region, country and coordinates. No network calls are made.
+"""
+import csv
+import math
+import os
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), 'data', 'gazetteer.csv')
+
+EARTH_RADIUS_KM = 6371.0
+
+Location = namedtuple('Location', ['city', 'region', 'country', 'latitude', 'longitude'])
+UNKNOWN = Location(None, None, None, None, None)
+
+# Country spellings not derivable from the gazetteer
+COUNTRY_ALIASES = {
+    'usa': 'US', 'u.s.': 'US', 'u.s.a.': 'US', 'america': 'US', 'united states of america': 'US',
+    'uk': 'GB', 'u.k.': 'GB', 'england': 'GB', 'scotland': 'GB', 'wales': 'GB',
+    'britain': 'GB', 'great britain': 'GB',
+    'uae': 'AE', 'holland': 'NL', 'the netherlands': 'NL', 'deutschland': 'DE',
+    'bharat': 'IN', 'czechia': 'CZ', 'korea': 'KR',
+}
+
+# Words that often surround a place name without being part of it
+NOISE_WORDS = {'remote', 'hybrid', 'onsite', 'on-site', 'office', 'hq', 'area', 'metro', 'based', 'in', 'near'}
+
+SEPARATORS = re.compile(r'[,/|;()•]|\s[-–—]\s')
+
+
+def _normalize(text):
+    return ' '.join(text.lower().replace('.', ' ').split()) if text else ''
+
+
+@lru_cache(maxsize=1)
+def gazetteer():
+    """Return (cities by alias, countries by alias) built from the bundled CSV"""
+    aliases_by_code = {}
+    for alias, code in COUNTRY_ALIASES.items():
+        aliases_by_code.setdefault(code, set()).add(_normalize(alias))
+
+    cities = {}
+    countries = {}
+    with open(GAZETTEER_PATH, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            country_aliases = aliases_by_code.get(row['country_code'], set())
+            entry = {
+                'location': Location(
+                    row['city'], row['region'], row['country'],
+                    float(row['latitude']), float(row['longitude']),
+                ),
+                'qualifiers': {
+                    _normalize(row['region']), _normalize(row['region_code']),
+                    _normalize(row['country']), _normalize(row['country_code']),
+                } | country_aliases,
+            }
+            for name in [row['city']] + [alias for alias in row['aliases'].split('|') if alias]:
+                cities.setdefault(_normalize(name), []).append(entry)
+            for name in {_normalize(row['country']), _normalize(row['country_code'])} | country_aliases:
+                countries[name] = row['country']
+    return cities, countries
+
+
+def _segments(text):
+    segments = []
+    for part in SEPARATORS.split(text):
+        segment = _normalize(part)
+        if segment:
+            segments.append(segment)
+            stripped = ' '.join(word for word in segment.split() if word not in NOISE_WORDS)
+            if stripped and stripped != segment:
+                segments.append(stripped)
+    return segments
+
+
+@lru_cache(maxsize=4096)
+def parse_location(text):
+    """
+    Resolve free-text location to a Location.
+
+    Ambiguous city names are settled by the other parts of the string
+    ("Cambridge, UK" vs "Cambridge, MA"). Country-only strings resolve to a
+    Location without city or coordinates; unknown strings return UNKNOWN.
+    """
+    if not text:
+        return UNKNOWN
+    cities, countries = gazetteer()
+    segments = _segments(text)
+
+    for segment in segments:
+        entries = cities.get(segment)
+        if entries:
+            others = set(segments) - {segment}
+            best = max(entries, key=lambda entry: len(entry['qualifiers'] & others))
+            return best['location']
+
+    for segment in segments:
+        if segment in countries:
+            return Location(None, None, countries[segment], None, None)
+    return UNKNOWN
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """(min_lat, max_lat, min_lng, max_lng) enclosing a circle around a point"""
+    delta_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = math.cos(math.radians(latitude))
+    delta_lng = 180.0 if cos_lat < 1e-6 else min(180.0, math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat)))
+    return (
+        max(-90.0, latitude - delta_lat),
+        min(90.0, latitude + delta_lat),
+        max(-180.0, longitude - delta_lng),
+        min(180.0, longitude + delta_lng),
+    )
+
+
+def distance_km(latitude, longitude):
+    """Haversine distance from a point to each row's latitude/longitude, as an ORM expression"""
+    lat1 = Radians(Value(latitude, output_field=FloatField()))
+    lat2 = Radians(F('latitude'))
+    delta_lat = Radians(F('latitude') - Value(latitude, output_field=FloatField()))
+    delta_lng = Radians(F('longitude') - Value(longitude, output_field=FloatField()))
+    a = Power(Sin(delta_lat / 2), 2) + Cos(lat1) * Cos(lat2) * Power(Sin(delta_lng / 2), 2)
+    return Value(2 * EARTH_RADIUS_KM, output_field=FloatField()) * ASin(Sqrt(a))
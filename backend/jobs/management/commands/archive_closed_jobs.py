@@ -0,0 +1,65 @@
+"""
+Management command to move closed jobs out of the live table
+Usage: python manage.py archive_closed_jobs [--days N] [--batch-size N]
+
+Jobs closed more than --days ago (default JOB_ARCHIVE_AFTER_DAYS) are copied
+to ArchivedJob and deleted from Job, one batch per transaction. Rows are
+locked while they move, so a job reopened at the same moment stays live.
+"""
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from jobs.models import ArchivedJob, Job, JobFields
+
+
+# Copied as-is; the archive adds original_id and archived_at
+ARCHIVE_FIELDS = [field.name for field in JobFields._meta.fields] + [
+    'company_id', 'created_at', 'updated_at', 'closed_at',
+]
+
+
+class Command(BaseCommand):
+    help = 'Move jobs closed more than N days ago to the archive table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None, help='Archive jobs closed at least this many days ago')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Jobs moved per transaction')
+
+    def handle(self, *args, **options):
+        days = options['days']
+        if days is None:
+            days = getattr(settings, 'JOB_ARCHIVE_AFTER_DAYS', 30)
+        cutoff = timezone.now() - timedelta(days=days)
+        batch_size = options['batch_size']
+
+        started = time.monotonic()
+        archived = 0
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    Job.objects.filter(status=Job.CLOSED, closed_at__lt=cutoff)
+                    .select_for_update(skip_locked=True)
+                    .order_by('closed_at')
+                    .values('id', *ARCHIVE_FIELDS)[:batch_size]
+                )
+                if not rows:
+                    break
+                ids = [row['id'] for row in rows]
+                ArchivedJob.objects.bulk_create([
+                    ArchivedJob(original_id=row.pop('id'), **row) for row in rows
+                ])
+                # A regular delete, so the change log and suggestions signals run
+                Job.objects.filter(id__in=ids).delete()
+            archived += len(rows)
+            self.stdout.write(f'  {archived} jobs archived')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✅ Archiving complete!'
+            f'\n   Archived: {archived} jobs closed before {cutoff:%Y-%m-%d}'
+            f'\n   Time: {time.monotonic() - started:.1f}s'
+        ))
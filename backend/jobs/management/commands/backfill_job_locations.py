@@ -0,0 +1,29 @@
+"""
+Management command to fill the structured location fields of existing jobs
+Usage: python manage.py backfill_job_locations [--batch-size N] [--all] [--restart]
+
+Shortcut for `run_backfill job-locations` (see jobs/backfills.py): resumable
+primary-key batches with a checkpoint, throttled between batches.
+"""
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Parse Job.location into city/region/country/coordinates for existing jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000, help='Jobs read per batch')
+        parser.add_argument('--all', action='store_true', help='Re-parse jobs that already have a city or country')
+        parser.add_argument('--restart', action='store_true', help='Ignore the checkpoint and start from the first job')
+
+    def handle(self, *args, **options):
+        call_command(
+            'run_backfill',
+            'job-locations',
+            batch_size=options['batch_size'],
+            all=options['all'],
+            restart=options['restart'],
+            stdout=self.stdout,
+            stderr=self.stderr,
+        )
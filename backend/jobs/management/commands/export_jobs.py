@@ -0,0 +1,61 @@
+"""
+Management command to export a company's jobs to CSV or Excel
+Usage: python manage.py export_jobs <company_slug> <output_file.csv|output_file.xlsx>
+
+The XLSX output uses the column headers import_jobs_from_excel expects, so it
+can be imported again. Rows are read with a server-side cursor and written
+as they arrive, so memory use does not grow with the number of jobs.
+"""
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from companies.models import Company
+from jobs.export import export_rows, stream_csv, write_xlsx
+from jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = 'Export all jobs of a company to a CSV or XLSX file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('company_slug', type=str, help='Company slug (e.g., accenture)')
+        parser.add_argument('output_file', type=str, help='Path of the .csv or .xlsx file to write')
+
+    def handle(self, *args, **options):
+        output_file = options['output_file']
+        extension = os.path.splitext(output_file)[1].lower()
+        if extension not in ('.csv', '.xlsx'):
+            raise CommandError('Output file must end in .csv or .xlsx')
+
+        try:
+            company = Company.objects.get(slug=options['company_slug'])
+        except Company.DoesNotExist:
+            raise CommandError(f'Company with slug "{options["company_slug"]}" not found')
+
+        jobs = Job.objects.filter(company=company)
+        count = 0
+
+        def counted(rows):
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield row
+
+        started = time.monotonic()
+        rows = counted(export_rows(jobs))
+        if extension == '.csv':
+            with open(output_file, 'w', newline='', encoding='utf-8') as f:
+                for line in stream_csv(rows):
+                    f.write(line)
+        else:
+            write_xlsx(rows, output_file)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✅ Export complete!'
+            f'\n   Company: {company.name}'
+            f'\n   Exported: {count} jobs to {output_file}'
+            f'\n   Time: {elapsed:.1f}s'
+        ))
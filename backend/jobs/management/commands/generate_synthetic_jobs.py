@@ -0,0 +1,296 @@
+"""
+Management command to generate large volumes of synthetic jobs for benchmarking
+Usage: python manage.py generate_synthetic_jobs [--companies N] [--jobs N] [--seed N] [--batch-size N]
+
+Jobs are loaded with PostgreSQL COPY FROM STDIN. Other databases (SQLite)
+fall back to bulk_create. The same seed always produces the same data.
+"""
+import csv
+import io
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.text import slugify
+
+from companies.models import Company
+from jobs.locations import parse_location
+from jobs.models import Job
+from jobs.salary import parse_salary
+from jobs.suggestions import invalidate as invalidate_suggestions
+from sync.changes import record_queryset as record_changes
+
+
+COMPANY_PREFIXES = [
+    'Acme', 'Blue', 'Bright', 'Cloud', 'Core', 'Delta', 'Echo', 'Nova', 'Orbit',
+    'Pixel', 'Quantum', 'Red', 'Silver', 'Summit', 'Terra', 'Vertex', 'Zen',
+]
+COMPANY_SUFFIXES = [
+    'Labs', 'Systems', 'Technologies', 'Works', 'Solutions', 'Analytics',
+    'Networks', 'Health', 'Finance', 'Logistics', 'Retail', 'Studios',
+]
+
+# (department, weight, roles)
+DEPARTMENTS = [
+    ('Engineering', 35, ['Software Engineer', 'Backend Engineer', 'Frontend Engineer',
+                         'Data Engineer', 'DevOps Engineer', 'QA Engineer', 'Engineering Manager']),
+    ('Product', 8, ['Product Manager', 'Product Owner', 'Technical Program Manager']),
+    ('Design', 6, ['Product Designer', 'UX Researcher', 'Visual Designer']),
+    ('Data Science', 7, ['Data Scientist', 'Machine Learning Engineer', 'Data Analyst']),
+    ('Sales', 14, ['Account Executive', 'Sales Development Representative', 'Sales Manager']),
+    ('Marketing', 8, ['Marketing Manager', 'Content Writer', 'Growth Marketer', 'SEO Specialist']),
+    ('Customer Success', 9, ['Customer Success Manager', 'Support Engineer', 'Support Specialist']),
+    ('Operations', 6, ['Operations Analyst', 'Business Analyst', 'Project Manager']),
+    ('Finance', 4, ['Accountant', 'Financial Analyst', 'Finance Manager']),
+    ('People', 3, ['Recruiter', 'HR Business Partner', 'People Operations Specialist']),
+]
+
+SENIORITY = [
+    # (title prefix, experience level, weight)
+    ('', 'mid-level', 40),
+    ('Senior ', 'senior', 25),
+    ('Junior ', 'junior', 15),
+    ('Lead ', 'senior', 8),
+    ('Staff ', 'senior', 4),
+    ('Associate ', 'junior', 8),
+]
+
+# (location, weight, salary style)
+LOCATIONS = [
+    ('Bangalore, India', 14, 'inr'),
+    ('Pune, India', 8, 'inr'),
+    ('Hyderabad, India', 7, 'inr'),
+    ('Mumbai, India', 6, 'inr'),
+    ('Gurgaon, India', 5, 'inr'),
+    ('Chennai, India', 4, 'inr'),
+    ('Remote', 12, 'usd'),
+    ('San Francisco, CA', 8, 'usd'),
+    ('New York, NY', 7, 'usd'),
+    ('Austin, TX', 4, 'usd'),
+    ('Seattle, WA', 4, 'usd'),
+    ('London, UK', 6, 'gbp'),
+    ('Berlin, Germany', 4, 'eur'),
+    ('Amsterdam, Netherlands', 3, 'eur'),
+    ('Singapore', 4, 'sgd'),
+    ('Toronto, Canada', 4, 'cad'),
+]
+
+EMPLOYMENT_TYPES = [('full-time', 85), ('contract', 10), ('part-time', 5)]
+WORK_POLICIES = [('onsite', 40), ('hybrid', 40), ('remote', 20)]
+POSTED_DATES = ['Just now', '1 hour ago', '5 hours ago', '1 day ago', '2 days ago',
+                '3 days ago', '1 week ago', '2 weeks ago', '1 month ago', '2 months ago']
+
+SENTENCES = [
+    'You will work closely with cross-functional teams to deliver high quality outcomes.',
+    'We are looking for someone who is curious, pragmatic and eager to learn.',
+    'You will own projects end to end, from discovery through to launch.',
+    'Our team values clear communication, ownership and thoughtful collaboration.',
+    'Experience with modern tooling and a bias for action are highly valued.',
+    'You will mentor teammates and help raise the bar for the whole organisation.',
+    'We offer flexible working hours, a learning budget and comprehensive health cover.',
+    'You will help shape our roadmap by talking directly with customers.',
+    'Strong analytical skills and attention to detail are essential for this role.',
+    'You will be part of a fast growing team with plenty of room for growth.',
+    'Familiarity with agile practices and iterative delivery is a plus.',
+    'We care deeply about diversity, inclusion and building a supportive culture.',
+]
+
+# Job columns written by COPY, in order. Django keeps model defaults out of
+# the database, so every NOT NULL column must be listed (search_vector is
+# filled by its trigger)
+JOB_COLUMNS = [
+    'company_id', 'title', 'description', 'location', 'work_policy', 'department',
+    'employment_type', 'experience', 'salary_range', 'posted_date', 'job_type',
+    'city', 'region', 'country', 'latitude', 'longitude',
+    'salary_min', 'salary_max', 'salary_currency', 'salary_period',
+    'status', 'closed_at', 'created_at', 'updated_at',
+]
+
+NULL_MARKER = '\\N'
+
+
+class Command(BaseCommand):
+    help = 'Generate synthetic companies and jobs for benchmarking (COPY on PostgreSQL)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--companies', type=int, default=100, help='Number of companies to create')
+        parser.add_argument('--jobs', type=int, default=10000, help='Total number of jobs to create')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for reproducible data')
+        parser.add_argument('--batch-size', type=int, default=10000, help='Rows per COPY/bulk_create batch')
+        parser.add_argument(
+            '--no-copy',
+            action='store_true',
+            help='Use bulk_create even on PostgreSQL',
+        )
+
+    def handle(self, *args, **options):
+        num_companies = options['companies']
+        num_jobs = options['jobs']
+        batch_size = options['batch_size']
+        seed = options['seed']
+
+        if num_companies < 1 or num_jobs < 0 or batch_size < 1:
+            raise CommandError('--companies and --batch-size must be positive, --jobs must not be negative')
+
+        rng = random.Random(seed)
+        use_copy = connection.vendor == 'postgresql' and not options['no_copy']
+
+        started = time.monotonic()
+        company_ids = self._create_companies(rng, seed, num_companies)
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {len(company_ids)} companies in {time.monotonic() - started:.1f}s'
+        ))
+
+        # Skewed tenant sizes: a few large companies, a long tail of small ones
+        company_weights = [1.0 / (rank ** 1.1) for rank in range(1, len(company_ids) + 1)]
+
+        started = time.monotonic()
+        created = 0
+        last_existing_id = Job.objects.aggregate(last=Max('id'))['last'] or 0
+        while created < num_jobs:
+            size = min(batch_size, num_jobs - created)
+            company_batch = rng.choices(company_ids, weights=company_weights, k=size)
+            now = timezone.now()
+            rows = [self._job_row(rng, company_id, now) for company_id in company_batch]
+            if use_copy:
+                self._copy_jobs(rows)
+            else:
+                self._bulk_create_jobs(rows, batch_size)
+            created += size
+            elapsed = time.monotonic() - started
+            self.stdout.write(f'  {created}/{num_jobs} jobs ({created / elapsed:,.0f} rows/s)')
+
+        # Bulk loads skip the Job signals that keep typeahead suggestions and the change log current
+        for company_id in company_ids:
+            invalidate_suggestions(company_id)
+        record_changes(Job.objects.filter(id__gt=last_existing_id))
+
+        method = 'COPY' if use_copy else 'bulk_create'
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✅ Generated {created} jobs with {method} in {time.monotonic() - started:.1f}s (seed={seed})'
+        ))
+
+    def _create_companies(self, rng, seed, count):
+        """Create recruiters and companies in bulk, with slugs assigned up front"""
+        prefix = f'synthetic-{seed}'
+        existing = set(
+            Company.objects.filter(slug__startswith=f'{prefix}-').values_list('slug', flat=True)
+        )
+        # One shared unusable hash instead of hashing a password per user
+        password = make_password(None)
+
+        users = []
+        companies = []
+        for index in range(count):
+            name = f'{rng.choice(COMPANY_PREFIXES)} {rng.choice(COMPANY_SUFFIXES)} {index + 1}'
+            slug = f'{prefix}-{slugify(name)}'
+            if slug in existing:
+                continue
+            users.append(User(username=slug[:150], email=f'{slug}@example.com', password=password))
+            companies.append(Company(
+                name=name,
+                slug=slug,
+                primary_color=f'#{rng.randrange(0x1000000):06x}',
+                secondary_color='#ffffff',
+            ))
+
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=1000)
+            # bulk_create does not return PKs on every backend, so look them up again
+            user_ids = dict(
+                User.objects.filter(username__in=[u.username for u in users]).values_list('username', 'id')
+            )
+            for user, company in zip(users, companies):
+                company.recruiter_id = user_ids[user.username]
+            # bulk_create skips Company.save, so no per-row slug lookups
+            Company.objects.bulk_create(companies, batch_size=1000)
+
+        return list(
+            Company.objects.filter(slug__startswith=f'{prefix}-').order_by('id').values_list('id', flat=True)
+        )
+
+    def _job_row(self, rng, company_id, now):
+        """Build one job as a dict of column values"""
+        department, _, roles = rng.choices(DEPARTMENTS, weights=[d[1] for d in DEPARTMENTS])[0]
+        title_prefix, experience, _ = rng.choices(SENIORITY, weights=[s[2] for s in SENIORITY])[0]
+        location, _, salary_style = rng.choices(LOCATIONS, weights=[l[1] for l in LOCATIONS])[0]
+        employment_type = rng.choices(*zip(*EMPLOYMENT_TYPES))[0]
+        work_policy = 'remote' if location == 'Remote' else rng.choices(*zip(*WORK_POLICIES))[0]
+
+        # Description length is roughly log-normal; ~10% of jobs have none
+        description = None
+        if rng.random() > 0.1:
+            sentence_count = max(1, min(60, int(rng.lognormvariate(2.0, 0.6))))
+            description = ' '.join(rng.choice(SENTENCES) for _ in range(sentence_count))
+
+        row = {
+            'company_id': company_id,
+            'title': f'{title_prefix}{rng.choice(roles)}',
+            'description': description,
+            'location': location,
+            'work_policy': work_policy,
+            'department': department if rng.random() > 0.05 else None,
+            'employment_type': employment_type,
+            'experience': experience if rng.random() > 0.15 else None,
+            'salary_range': self._salary_range(rng, salary_style, experience),
+            'posted_date': rng.choice(POSTED_DATES),
+            'job_type': None,
+            'status': Job.OPEN,
+            'closed_at': None,
+            'created_at': now,
+            'updated_at': now,
+        }
+        # COPY and bulk_create skip Job.save, so parse here
+        row.update(parse_location(location)._asdict())
+        row.update(parse_salary(row['salary_range'])._asdict())
+        return row
+
+    def _salary_range(self, rng, style, experience):
+        """Return a salary string in one of the formats seen in real postings, or None"""
+        if rng.random() < 0.35:
+            return None
+        multiplier = {'junior': 0.6, 'mid-level': 1.0, 'senior': 1.6}.get(experience, 1.0)
+        if style == 'inr':
+            low = max(3, int(rng.uniform(8, 20) * multiplier))
+            high = low + rng.randint(2, 10)
+            return rng.choice([f'₹{low}-{high} LPA', f'{low} - {high} LPA', f'INR {low},00,000 - {high},00,000'])
+        symbol = {'usd': '$', 'gbp': '£', 'eur': '€', 'sgd': 'S$', 'cad': 'C$'}[style]
+        base = {'usd': 120, 'gbp': 60, 'eur': 65, 'sgd': 90, 'cad': 100}[style]
+        low = int(rng.uniform(0.7, 1.2) * base * multiplier)
+        high = low + rng.randint(10, 60)
+        if rng.random() < 0.1:
+            hourly = max(15, low // 2)
+            return f'{symbol}{hourly}/hr'
+        return rng.choice([
+            f'{symbol}{low}k - {symbol}{high}k',
+            f'{symbol}{low}k–{symbol}{high}k',
+            f'{symbol}{low},000 - {symbol}{high},000',
+        ])
+
+    def _copy_jobs(self, rows):
+        """Stream a batch of rows into jobs_job with COPY FROM STDIN"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([
+                NULL_MARKER if row[column] is None else row[column]
+                for column in JOB_COLUMNS
+            ])
+        buffer.seek(0)
+
+        sql = (
+            f'COPY {Job._meta.db_table} ({", ".join(JOB_COLUMNS)}) '
+            f"FROM STDIN WITH (FORMAT csv, NULL '{NULL_MARKER}')"
+        )
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.copy_expert(sql, buffer)
+
+    def _bulk_create_jobs(self, rows, batch_size):
+        """Fallback for databases without COPY support"""
+        Job.objects.bulk_create([Job(**row) for row in rows], batch_size=min(batch_size, 2000))
@@ -5,8 +5,10 @@ Usage: python manage.py import_jobs_from_excel <company_slug> <excel_file_path>
 from django.core.management.base import BaseCommand, CommandError
 from companies.models import Company
 from jobs.models import Job
+from monitoring import metrics
 import openpyxl
 import os
+import time
 
 
 class Command(BaseCommand):
@@ -112,6 +114,7 @@ class Command(BaseCommand):
                 raise CommandError('Could not find "title" or "job title" column in Excel file')
             
             # Read data rows
+            started = time.monotonic()
             imported_count = 0
             skipped_count = 0
             total_rows = sheet.max_row - 1  # Exclude header
@@ -178,10 +181,18 @@ class Command(BaseCommand):
                     skipped_count += 1
                     self.stdout.write(self.style.WARNING(f'  - Skipped (already exists): {job.title}'))
             
+            elapsed = time.monotonic() - started
+            metrics.IMPORT_ROWS.inc(imported_count, source='excel', result='imported')
+            metrics.IMPORT_ROWS.inc(skipped_count, source='excel', result='skipped')
+            metrics.IMPORT_DURATION.observe(elapsed, source='excel')
+            # This process exits right after, before any scrape could see them
+            metrics.registry.save_command_metrics()
+            
             self.stdout.write(self.style.SUCCESS(
                 f'\n✅ Import complete!'
                 f'\n   Imported: {imported_count} jobs'
                 f'\n   Skipped: {skipped_count} jobs'
+                f'\n   Throughput: {imported_count / elapsed if elapsed else 0:.1f} jobs/s'
             ))
             
         except ImportError:
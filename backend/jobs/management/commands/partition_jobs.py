@@ -0,0 +1,299 @@
+"""
+Management command to move jobs_job to a hash-partitioned table online (PostgreSQL only)
+Usage:
+    python manage.py partition_jobs prepare [--partitions 16]
+    python manage.py partition_jobs copy [--batch-size 10000] [--sleep 0.1]
+    python manage.py partition_jobs swap
+    python manage.py partition_jobs status
+    python manage.py partition_jobs cleanup
+
+prepare  creates jobs_job_partitioned (PARTITION BY HASH (company_id)) with the
+         same columns, indexes, triggers and foreign key, a non-unique index
+         on id (the primary key becomes (company_id, id)), plus a trigger that
+         mirrors every write on jobs_job into it.
+copy     copies existing rows in primary-key batches. It is resumable and can
+         run while the site is live. Each batch holds FOR SHARE locks on its
+         source rows, so a concurrent delete waits for the batch and its
+         mirrored DELETE then removes the copied row.
+swap     takes a short exclusive lock, copies any stragglers and renames the
+         tables, so jobs_job becomes the partitioned table. The old table is
+         kept as jobs_job_unpartitioned.
+cleanup  drops jobs_job_unpartitioned once you are satisfied.
+
+prepare and swap refuse to run while migrations are unapplied: do not run
+migrations on jobs_job between prepare and swap. After the swap, unique
+constraints on jobs_job must include company_id, and PostgreSQL cannot build
+an index CONCURRENTLY on the partitioned table. New indexes need CREATE
+INDEX ON ONLY jobs_job, a concurrent build on each partition, then ALTER
+INDEX ... ATTACH PARTITION, instead of AddIndexConcurrently.
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+
+from jobs.models import Job
+
+
+SOURCE = Job._meta.db_table
+TARGET = f'{SOURCE}_partitioned'
+OLD = f'{SOURCE}_unpartitioned'
+STATE = f'{SOURCE}_partition_state'
+SEQUENCE = f'{TARGET}_id_seq'
+TRIGGER = f'{SOURCE}_partition_sync'
+ID_INDEX = f'{SOURCE}_id_idx'
+
+
+class Command(BaseCommand):
+    help = 'Partition jobs_job by company (hash) without taking the site down'
+
+    def add_arguments(self, parser):
+        parser.add_argument('phase', choices=['prepare', 'copy', 'swap', 'status', 'cleanup'])
+        parser.add_argument('--partitions', type=int, default=16, help='Number of hash partitions (prepare)')
+        parser.add_argument('--batch-size', type=int, default=10000, help='Rows per copy batch')
+        parser.add_argument('--sleep', type=float, default=0.1, help='Seconds to pause between copy batches')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Table partitioning is only supported on PostgreSQL')
+        getattr(self, f'_{options["phase"]}')(options)
+
+    # Helpers
+
+    def _query(self, sql, params=None):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall() if cursor.description else None
+
+    def _table_exists(self, name):
+        return self._query('SELECT to_regclass(%s) IS NOT NULL', [name])[0][0]
+
+    def _columns(self, table):
+        return [row[0] for row in self._query(
+            """
+            SELECT attname FROM pg_attribute
+            WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+            ORDER BY attnum
+            """,
+            [table],
+        )]
+
+    def _is_partitioned(self, table):
+        return bool(self._query(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [table]
+        ))
+
+    def _get_state(self):
+        return self._query(f'SELECT copied_up_to, max_id FROM {STATE}')[0]
+
+    def _check_migrations_applied(self):
+        # Pending migrations may build indexes CONCURRENTLY, which fails on a partitioned table
+        executor = MigrationExecutor(connection)
+        plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+        if plan:
+            pending = ', '.join(f'{migration.app_label}.{migration.name}' for migration, _ in plan)
+            raise CommandError(f'Unapplied migrations ({pending}); run "migrate" first')
+
+    # Phases
+
+    def _prepare(self, options):
+        if self._table_exists(TARGET):
+            raise CommandError(f'{TARGET} already exists; run "copy" or "status"')
+        if self._is_partitioned(SOURCE):
+            raise CommandError(f'{SOURCE} is already partitioned')
+        self._check_migrations_applied()
+
+        inbound = self._query(
+            "SELECT conname FROM pg_constraint WHERE contype = 'f' AND confrelid = %s::regclass", [SOURCE]
+        )
+        if inbound:
+            raise CommandError(
+                f'Foreign keys reference {SOURCE} ({", ".join(r[0] for r in inbound)}); '
+                f'partitioned tables need them to include company_id'
+            )
+
+        partitions = options['partitions']
+        columns = self._columns(SOURCE)
+        column_list = ', '.join(columns)
+        updates = ', '.join(f'{column} = EXCLUDED.{column}' for column in columns if column not in ('id', 'company_id'))
+        new_values = ', '.join(f'NEW.{column}' for column in columns)
+
+        with transaction.atomic():
+            self._query(
+                f'CREATE TABLE {TARGET} (LIKE {SOURCE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+                f'PARTITION BY HASH (company_id)'
+            )
+            self._query(f'ALTER TABLE {TARGET} ADD PRIMARY KEY (company_id, id)')
+            # The primary key leads with company_id; id order, id__in and pk__gt batching
+            # (search keysets, global feeds, archiving, backfills) need an index of their own
+            self._query(f'CREATE INDEX {ID_INDEX} ON {TARGET} (id)')
+            for remainder in range(partitions):
+                self._query(
+                    f'CREATE TABLE {SOURCE}_p{remainder} PARTITION OF {TARGET} '
+                    f'FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})'
+                )
+
+            # Own id sequence; set past the old table's ids during the swap
+            self._query(f'CREATE SEQUENCE {SEQUENCE} OWNED BY {TARGET}.id')
+            self._query(f"ALTER TABLE {TARGET} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}')")
+
+            # Foreign keys, renamed to their original names during the swap
+            for name, definition in self._query(
+                "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                "WHERE contype = 'f' AND conrelid = %s::regclass",
+                [SOURCE],
+            ):
+                self._query(f'ALTER TABLE {TARGET} ADD CONSTRAINT {name}_p {definition}')
+
+            # Non-unique indexes (unique ones cannot exist without company_id)
+            for name, definition, unique in self._query(
+                """
+                SELECT i.relname, pg_get_indexdef(i.oid), ix.indisunique
+                FROM pg_index ix JOIN pg_class i ON i.oid = ix.indexrelid
+                WHERE ix.indrelid = %s::regclass AND NOT ix.indisprimary
+                """,
+                [SOURCE],
+            ):
+                if unique:
+                    self.stdout.write(self.style.WARNING(f'  Skipping unique index {name}'))
+                    continue
+                definition = definition.replace(f'INDEX {name} ON', f'INDEX {name}_p ON', 1)
+                definition = definition.replace(f' ON public.{SOURCE} ', f' ON public.{TARGET} ', 1)
+                definition = definition.replace(f' ON {SOURCE} ', f' ON {TARGET} ', 1)
+                self._query(definition)
+
+            # Other row triggers (e.g. the search_vector trigger) carry over as well
+            for _, definition in self._query(
+                "SELECT tgname, pg_get_triggerdef(oid) FROM pg_trigger "
+                "WHERE tgrelid = %s::regclass AND NOT tgisinternal",
+                [SOURCE],
+            ):
+                definition = definition.replace(f' ON public.{SOURCE} ', f' ON public.{TARGET} ', 1)
+                self._query(definition.replace(f' ON {SOURCE} ', f' ON {TARGET} ', 1))
+
+            max_id = self._query(f'SELECT COALESCE(MAX(id), 0) FROM {SOURCE}')[0][0]
+            self._query(f'CREATE TABLE {STATE} (copied_up_to bigint NOT NULL, max_id bigint NOT NULL)')
+            self._query(f'INSERT INTO {STATE} VALUES (0, %s)', [max_id])
+
+            # Mirror live writes; rows copied later never overwrite newer mirrored versions
+            self._query(f"""
+                CREATE FUNCTION {TRIGGER}() RETURNS trigger AS $$
+                BEGIN
+                    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                        DELETE FROM {TARGET} WHERE company_id = OLD.company_id AND id = OLD.id;
+                    END IF;
+                    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                        INSERT INTO {TARGET} ({column_list}) VALUES ({new_values})
+                        ON CONFLICT (company_id, id) DO UPDATE SET {updates};
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql
+            """)
+            self._query(
+                f'CREATE TRIGGER {TRIGGER} AFTER INSERT OR UPDATE OR DELETE ON {SOURCE} '
+                f'FOR EACH ROW EXECUTE FUNCTION {TRIGGER}()'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Created {TARGET} with {partitions} hash partitions; live writes are mirrored.'
+            f'\n   Next: python manage.py partition_jobs copy'
+        ))
+
+    def _copy(self, options):
+        if not self._table_exists(STATE):
+            raise CommandError('Run "prepare" first')
+        copied_up_to, max_id = self._get_state()
+        column_list = ', '.join(self._columns(SOURCE))
+        batch_size = options['batch_size']
+        started = time.monotonic()
+
+        while copied_up_to < max_id:
+            upper = min(copied_up_to + batch_size, max_id)
+            with transaction.atomic():
+                # FOR SHARE: a row deleted during the batch would otherwise be read
+                # from the snapshot and re-inserted after the trigger removed it
+                self._query(
+                    f'INSERT INTO {TARGET} ({column_list}) SELECT {column_list} FROM {SOURCE} '
+                    f'WHERE id > %s AND id <= %s FOR SHARE ON CONFLICT (company_id, id) DO NOTHING',
+                    [copied_up_to, upper],
+                )
+                self._query(f'UPDATE {STATE} SET copied_up_to = %s', [upper])
+            copied_up_to = upper
+            rate = copied_up_to / max(time.monotonic() - started, 1e-6)
+            self.stdout.write(f'  Copied ids up to {copied_up_to}/{max_id} ({rate:,.0f} ids/s)')
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Copy complete. Next: python manage.py partition_jobs swap'
+        ))
+
+    def _swap(self, options):
+        if not self._table_exists(STATE):
+            raise CommandError('Run "prepare" and "copy" first')
+        copied_up_to, max_id = self._get_state()
+        if copied_up_to < max_id:
+            raise CommandError(f'Copy is not finished ({copied_up_to}/{max_id}); run "copy" first')
+        self._check_migrations_applied()
+
+        column_list = ', '.join(self._columns(SOURCE))
+        old_names = [row[0] for row in self._query(
+            "SELECT i.relname FROM pg_index ix JOIN pg_class i ON i.oid = ix.indexrelid "
+            "WHERE ix.indrelid = %s::regclass",
+            [SOURCE],
+        )]
+        old_foreign_keys = [row[0] for row in self._query(
+            "SELECT conname FROM pg_constraint WHERE contype = 'f' AND conrelid = %s::regclass", [SOURCE]
+        )]
+
+        with transaction.atomic():
+            self._query(f'LOCK TABLE {SOURCE} IN ACCESS EXCLUSIVE MODE')
+            # Anything the trigger has not mirrored (none expected)
+            self._query(
+                f'INSERT INTO {TARGET} ({column_list}) SELECT {column_list} FROM {SOURCE} '
+                f'WHERE id > %s ON CONFLICT (company_id, id) DO NOTHING',
+                [max_id],
+            )
+            self._query(f"SELECT setval('{SEQUENCE}', (SELECT COALESCE(MAX(id), 0) + 1 FROM {SOURCE}), false)")
+            self._query(f'DROP TRIGGER {TRIGGER} ON {SOURCE}')
+            self._query(f'DROP FUNCTION {TRIGGER}()')
+
+            self._query(f'ALTER TABLE {SOURCE} RENAME TO {OLD}')
+            for name in old_names:
+                self._query(f'ALTER INDEX {name} RENAME TO {name}_old')
+                if self._table_exists(f'{name}_p'):
+                    self._query(f'ALTER INDEX {name}_p RENAME TO {name}')
+            for name in old_foreign_keys:
+                self._query(f'ALTER TABLE {OLD} RENAME CONSTRAINT {name} TO {name}_old')
+                self._query(f'ALTER TABLE {TARGET} RENAME CONSTRAINT {name}_p TO {name}')
+            self._query(f'ALTER TABLE {TARGET} RENAME TO {SOURCE}')
+            self._query(f'DROP TABLE {STATE}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {SOURCE} is now partitioned by company. The old table is kept as {OLD}.'
+            f'\n   Run "cleanup" to drop it.'
+        ))
+
+    def _status(self, options):
+        if self._is_partitioned(SOURCE):
+            partitions = self._query(
+                "SELECT c.relname, c.reltuples::bigint FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = %s::regclass ORDER BY c.relname",
+                [SOURCE],
+            )
+            self.stdout.write(self.style.SUCCESS(f'{SOURCE} is partitioned ({len(partitions)} partitions)'))
+            for name, estimate in partitions:
+                self.stdout.write(f'  {name}: ~{max(estimate, 0)} rows')
+        elif self._table_exists(STATE):
+            copied_up_to, max_id = self._get_state()
+            self.stdout.write(f'Partitioning in progress: copied ids up to {copied_up_to}/{max_id}')
+        else:
+            self.stdout.write(f'{SOURCE} is not partitioned')
+
+    def _cleanup(self, options):
+        if not self._table_exists(OLD):
+            raise CommandError(f'{OLD} does not exist')
+        self._query(f'DROP TABLE {OLD}')
+        self.stdout.write(self.style.SUCCESS(f'✅ Dropped {OLD}'))
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:24
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+from backfill.operations import RunBackfill
+
+
+class Migration(migrations.Migration):
+    # Batched backfill and concurrent index builds cannot run inside one transaction
+    atomic = False
+
+    dependencies = [
+        ('jobs', '0005_change_posted_date_to_string'),
+        ('backfill', '0001_initial'),
+        ('sync', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='job',
+            options={'ordering': ['-id']},
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='city',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='country',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='region',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='job',
+            name='experience',
+            field=models.CharField(blank=True, choices=[('senior', 'Senior'), ('junior', 'Junior'), ('mid-level', 'Mid-level')], max_length=20, null=True),
+        ),
+        RunBackfill('job-locations'),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['company', 'city'], name='job_company_city_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['company', 'latitude', 'longitude'], name='job_company_geo_idx'),
+        ),
+    ]
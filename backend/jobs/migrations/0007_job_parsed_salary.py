@@ -0,0 +1,49 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:25
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+from backfill.operations import RunBackfill
+
+
+class Migration(migrations.Migration):
+    # Batched backfill and concurrent index builds cannot run inside one transaction
+    atomic = False
+
+    dependencies = [
+        ('jobs', '0006_job_structured_location'),
+        ('backfill', '0001_initial'),
+        ('sync', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='salary_currency',
+            field=models.CharField(blank=True, max_length=3, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='salary_max',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='salary_min',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='salary_period',
+            field=models.CharField(blank=True, choices=[('year', 'Per year'), ('month', 'Per month'), ('week', 'Per week'), ('day', 'Per day'), ('hour', 'Per hour')], max_length=10, null=True),
+        ),
+        RunBackfill('job-salaries'),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['company', 'salary_max'], name='job_company_salary_max_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['company', 'salary_min'], name='job_company_salary_min_idx'),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:28
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+from backfill.operations import RunBackfill
+
+
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce({row}.title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce({row}.department, '') || ' ' || coalesce({row}.location, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce({row}.description, '')), 'C')
+"""
+
+
+def create_search_trigger(apps, schema_editor):
+    """Keep search_vector current on every write, including COPY and bulk loads (PostgreSQL only)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f"""
+        CREATE FUNCTION jobs_job_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_SQL.format(row='NEW')};
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    schema_editor.execute(
+        'CREATE TRIGGER jobs_job_search_vector_update '
+        'BEFORE INSERT OR UPDATE OF title, department, location, description ON jobs_job '
+        'FOR EACH ROW EXECUTE FUNCTION jobs_job_search_vector_update()'
+    )
+    # Existing rows are filled by the job-search-vectors backfill, in batches
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP TRIGGER IF EXISTS jobs_job_search_vector_update ON jobs_job')
+    schema_editor.execute('DROP FUNCTION IF EXISTS jobs_job_search_vector_update()')
+
+
+def create_search_index(apps, schema_editor):
+    # Built without blocking writes; a failed build leaves an INVALID index to drop before retrying
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS job_search_vector_idx ON jobs_job USING gin (search_vector)'
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX CONCURRENTLY IF EXISTS job_search_vector_idx')
+
+
+class Migration(migrations.Migration):
+    # Batched backfill and concurrent index builds cannot run inside one transaction
+    atomic = False
+
+    dependencies = [
+        ('jobs', '0007_job_parsed_salary'),
+        ('backfill', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+        RunBackfill('job-search-vectors'),
+        migrations.RunPython(create_search_index, drop_search_index),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['country', 'city'], name='job_country_city_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['latitude', 'longitude'], name='job_geo_idx'),
+        ),
+    ]
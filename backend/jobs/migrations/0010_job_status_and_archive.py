@@ -0,0 +1,77 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:36
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    # Indexes on jobs_job are built concurrently, which cannot run in a transaction
+    atomic = False
+
+    dependencies = [
+        ('companies', '0001_initial'),
+        ('jobs', '0009_job_timestamps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('location', models.CharField(max_length=200)),
+                ('work_policy', models.CharField(choices=[('remote', 'Remote'), ('hybrid', 'Hybrid'), ('onsite', 'Onsite')], default='onsite', max_length=20)),
+                ('department', models.CharField(blank=True, max_length=100, null=True)),
+                ('employment_type', models.CharField(choices=[('full-time', 'Full Time'), ('part-time', 'Part Time'), ('contract', 'Contract')], default='full-time', max_length=20)),
+                ('experience', models.CharField(blank=True, choices=[('senior', 'Senior'), ('junior', 'Junior'), ('mid-level', 'Mid-level')], max_length=20, null=True)),
+                ('salary_range', models.CharField(blank=True, max_length=100, null=True)),
+                ('posted_date', models.CharField(default='Just now', max_length=100)),
+                ('city', models.CharField(blank=True, max_length=100, null=True)),
+                ('region', models.CharField(blank=True, max_length=100, null=True)),
+                ('country', models.CharField(blank=True, max_length=100, null=True)),
+                ('latitude', models.FloatField(blank=True, null=True)),
+                ('longitude', models.FloatField(blank=True, null=True)),
+                ('salary_min', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('salary_max', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('salary_currency', models.CharField(blank=True, max_length=3, null=True)),
+                ('salary_period', models.CharField(blank=True, choices=[('year', 'Per year'), ('month', 'Per month'), ('week', 'Per week'), ('day', 'Per day'), ('hour', 'Per hour')], max_length=10, null=True)),
+                ('original_id', models.BigIntegerField(help_text='Job.id before archiving', unique=True)),
+                ('created_at', models.DateTimeField(null=True)),
+                ('updated_at', models.DateTimeField(null=True)),
+                ('closed_at', models.DateTimeField(null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-closed_at', '-id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='closed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='status',
+            field=models.CharField(choices=[('open', 'Open'), ('closed', 'Closed')], default='open', max_length=10),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'open')), fields=['company', '-id'], name='job_company_open_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'closed')), fields=['closed_at'], name='job_closed_at_idx'),
+        ),
+        migrations.AddField(
+            model_name='archivedjob',
+            name='company',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_jobs', to='companies.company'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedjob',
+            index=models.Index(fields=['company', '-closed_at'], name='archivedjob_company_closed_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:44
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('jobs', '0010_job_status_and_archive'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['company', 'title'], name='job_company_title_idx'),
+        ),
+    ]
@@ -1,8 +1,12 @@
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, router, transaction
 from companies.models import Company
+from .locations import parse_location
+from .salary import parse_salary
 
 
-class Job(models.Model):
+class JobFields(models.Model):
+    """Posting fields shared by live and archived jobs"""
     EMPLOYMENT_TYPES = [
         ('full-time', 'Full Time'),
         ('part-time', 'Part Time'),
@@ -15,13 +19,20 @@ class Job(models.Model):
         ('onsite', 'Onsite'),
     ]
     
+    SALARY_PERIODS = [
+        ('year', 'Per year'),
+        ('month', 'Per month'),
+        ('week', 'Per week'),
+        ('day', 'Per day'),
+        ('hour', 'Per hour'),
+    ]
+    
     EXPERIENCE_LEVELS = [
         ('senior', 'Senior'),
         ('junior', 'Junior'),
         ('mid-level', 'Mid-level'),
     ]
     
-    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='jobs')
     title = models.CharField(max_length=200)
     description = models.TextField(null=True, blank=True)
     location = models.CharField(max_length=200)
@@ -32,9 +43,82 @@ class Job(models.Model):
     salary_range = models.CharField(max_length=100, null=True, blank=True)
     posted_date = models.CharField(max_length=100, default='Just now')
     
+    # Parsed from location on save (see jobs/locations.py)
+    city = models.CharField(max_length=100, null=True, blank=True)
+    region = models.CharField(max_length=100, null=True, blank=True)
+    country = models.CharField(max_length=100, null=True, blank=True)
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    
+    # Parsed from salary_range on save (see jobs/salary.py); annualized amounts
+    salary_min = models.PositiveBigIntegerField(null=True, blank=True)
+    salary_max = models.PositiveBigIntegerField(null=True, blank=True)
+    salary_currency = models.CharField(max_length=3, null=True, blank=True)
+    salary_period = models.CharField(max_length=10, choices=SALARY_PERIODS, null=True, blank=True)
+    
+    class Meta:
+        abstract = True
+
+
+class JobQuerySet(models.QuerySet):
+    def open(self):
+        """Jobs shown on careers pages, feeds and search (served by partial indexes)"""
+        return self.filter(status=Job.OPEN)
+
+
+class Job(JobFields):
+    OPEN = 'open'
+    CLOSED = 'closed'
+    STATUSES = [
+        (OPEN, 'Open'),
+        (CLOSED, 'Closed'),
+    ]
+    
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='jobs')
+    
+    # Closed jobs leave every public listing; archive_closed_jobs later moves
+    # them to ArchivedJob
+    status = models.CharField(max_length=10, choices=STATUSES, default=OPEN)
+    closed_at = models.DateTimeField(null=True, blank=True)
+    
+    # Null for jobs created before these fields existed
+    created_at = models.DateTimeField(auto_now_add=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True)
+    
     # Legacy field - kept for backward compatibility during migration
     job_type = models.CharField(max_length=20, null=True, blank=True)
     
+    # Weighted title/department/location/description document, maintained by a
+    # database trigger on PostgreSQL (see migration 0008); unused elsewhere
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    
+    objects = JobQuerySet.as_manager()
+    
+    # Source field -> (parser, fields it fills)
+    DERIVED_FIELDS = {
+        'location': (parse_location, ('city', 'region', 'country', 'latitude', 'longitude')),
+        'salary_range': (parse_salary, ('salary_min', 'salary_max', 'salary_currency', 'salary_period')),
+    }
+    
+    def parse_derived_fields(self, sources=None):
+        """Fill the structured fields parsed from free-text location and salary_range"""
+        updated = set()
+        for source, (parser, fields) in self.DERIVED_FIELDS.items():
+            if sources is not None and source not in sources:
+                continue
+            parsed = parser(getattr(self, source))
+            for field in fields:
+                setattr(self, field, getattr(parsed, field))
+            updated.update(fields)
+        return updated
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored values so change handlers can see what was replaced without a query
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+    
     def save(self, *args, **kwargs):
         # Auto-populate employment_type from job_type if job_type exists and employment_type is default
         if self.job_type and not self.employment_type:
@@ -46,11 +130,61 @@ class Job(models.Model):
                 'internship': 'full-time',  # Map internship to full-time
             }
             self.employment_type = job_type_mapping.get(self.job_type, 'full-time')
-        super().save(*args, **kwargs)
+        
+        update_fields = kwargs.get('update_fields')
+        updated = self.parse_derived_fields(update_fields)
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | updated
+        # Commit together with the post_save handlers (e.g. the sync change log entry)
+        with transaction.atomic(using=kwargs.get('using') or router.db_for_write(type(self), instance=self)):
+            super().save(*args, **kwargs)
     
     class Meta:
         ordering = ['-id']  # Order by ID since posted_date is now a string
+        indexes = [
+            models.Index(fields=['company', 'city'], name='job_company_city_idx'),
+            # Bounding-box prefilter for radius search
+            models.Index(fields=['company', 'latitude', 'longitude'], name='job_company_geo_idx'),
+            # Salary range filters and sort=salary
+            models.Index(fields=['company', 'salary_max'], name='job_company_salary_max_idx'),
+            models.Index(fields=['company', 'salary_min'], name='job_company_salary_min_idx'),
+            # Cross-company search (GIN index on search_vector is created in migration 0008)
+            models.Index(fields=['country', 'city'], name='job_country_city_idx'),
+            models.Index(fields=['latitude', 'longitude'], name='job_geo_idx'),
+            # Recruiter dashboard sorted by title (newest first uses the company FK index)
+            models.Index(fields=['company', 'title'], name='job_company_title_idx'),
+            # Public listings only read open jobs
+            models.Index(
+                fields=['company', '-id'],
+                name='job_company_open_idx',
+                condition=models.Q(status='open'),
+            ),
+            # archive_closed_jobs
+            models.Index(
+                fields=['closed_at'],
+                name='job_closed_at_idx',
+                condition=models.Q(status='closed'),
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.company.name}"
 
+
+class ArchivedJob(JobFields):
+    """A closed job moved out of the live table by archive_closed_jobs, kept for reporting"""
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='archived_jobs')
+    original_id = models.BigIntegerField(unique=True, help_text='Job.id before archiving')
+    created_at = models.DateTimeField(null=True)
+    updated_at = models.DateTimeField(null=True)
+    closed_at = models.DateTimeField(null=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-closed_at', '-id']
+        indexes = [
+            models.Index(fields=['company', '-closed_at'], name='archivedjob_company_closed_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.title} - {self.company.name} (archived)"
@@ -0,0 +1,133 @@
+"""
+Salary range parsing for job postings.
+
+Turns strings such as "₹12-18 LPA", "$120k–$150k", "£45,000 - £55,000 per
+annum" or "$50/hr" into numeric bounds. Bounds are stored annualized in whole
+units of the currency, so ranges with different periods sort together; the
+original period is kept alongside.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+
+Salary = namedtuple('Salary', ['salary_min', 'salary_max', 'salary_currency', 'salary_period'])
+UNKNOWN = Salary(None, None, None, None)
+
+# Multipliers to turn an amount per period into an amount per year
+PERIOD_FACTORS = {
+    'year': 1,
+    'month': 12,
+    'week': 52,
+    'day': 260,
+    'hour': 2080,
+}
+
+# Annual amounts above this are typos or not salaries; the columns are 64-bit
+MAX_ANNUAL_AMOUNT = 10 ** 10
+
+# Below this, a number without a currency or unit ("5+ years") is not a salary
+MIN_BARE_AMOUNT = 1000
+
+# Checked in order, so multi-character symbols come before '$' (and 'US$' before 'S$')
+CURRENCY_MARKERS = [
+    ('US$', 'USD'),
+    ('S$', 'SGD'), ('SGD', 'SGD'),
+    ('C$', 'CAD'), ('CA$', 'CAD'), ('CAD', 'CAD'),
+    ('A$', 'AUD'), ('AU$', 'AUD'), ('AUD', 'AUD'),
+    ('₹', 'INR'), ('INR', 'INR'), ('RS', 'INR'), ('LPA', 'INR'), ('LAKH', 'INR'), ('CRORE', 'INR'),
+    ('£', 'GBP'), ('GBP', 'GBP'),
+    ('€', 'EUR'), ('EUR', 'EUR'),
+    ('USD', 'USD'), ('$', 'USD'),
+]
+
+PERIOD_PATTERNS = [
+    ('hour', re.compile(r'/\s*h(ou)?r|per\s+hour|hourly|\bph\b', re.I)),
+    ('day', re.compile(r'/\s*day|per\s+day|daily', re.I)),
+    ('week', re.compile(r'/\s*w(ee)?k|per\s+week|weekly', re.I)),
+    ('month', re.compile(r'/\s*mo(nth)?|per\s+month|monthly|\bp\.?m\b', re.I)),
+]
+
+UNIT_MULTIPLIERS = {
+    'k': 1_000,
+    'm': 1_000_000,
+    'mn': 1_000_000,
+    'l': 100_000,
+    'lpa': 100_000,
+    'lac': 100_000,
+    'lakh': 100_000,
+    'lakhs': 100_000,
+    'cr': 10_000_000,
+    'crore': 10_000_000,
+}
+
+AMOUNT = re.compile(
+    r'(\d[\d,]*(?:\.\d+)?)\s*(k|mn|m|lpa|lakhs|lakh|lac|l|crore|cr)?\b',
+    re.I,
+)
+
+
+def _currency(text):
+    upper = text.upper()
+    for marker, code in CURRENCY_MARKERS:
+        if marker.isalpha():
+            if re.search(rf'\b{marker}\b', upper):
+                return code
+        elif marker in upper:
+            return code
+    return None
+
+
+def _period(text):
+    for period, pattern in PERIOD_PATTERNS:
+        if pattern.search(text):
+            return period
+    return 'year'
+
+
+@lru_cache(maxsize=4096)
+def parse_salary(text):
+    """
+    Parse a salary string into a Salary, or UNKNOWN when no amount is found.
+
+    Implausible amounts are UNKNOWN: bare small numbers without a currency or
+    unit ("5+ years experience") and anything above MAX_ANNUAL_AMOUNT a year.
+
+    A unit on the last amount applies to earlier bare amounts ("12-18 LPA").
+    "Up to X" has no minimum; a single amount is both minimum and maximum.
+    """
+    if not text:
+        return UNKNOWN
+
+    amounts = []
+    for number, unit in AMOUNT.findall(text):
+        try:
+            value = float(number.replace(',', ''))
+        except ValueError:
+            continue
+        amounts.append((value, unit.lower() if unit else None))
+    if not amounts:
+        return UNKNOWN
+    amounts = amounts[:2]
+
+    last_unit = amounts[-1][1]
+    currency = _currency(text)
+    if currency is None and last_unit is None and max(value for value, _ in amounts) < MIN_BARE_AMOUNT:
+        return UNKNOWN
+
+    values = []
+    for value, unit in amounts:
+        unit = unit or last_unit
+        values.append(value * UNIT_MULTIPLIERS.get(unit, 1))
+
+    period = _period(text)
+    values = [round(value * PERIOD_FACTORS[period]) for value in values]
+    if max(values) > MAX_ANNUAL_AMOUNT:
+        return UNKNOWN
+    low, high = min(values), max(values)
+    if re.search(r'\bup\s*to\b', text, re.I):
+        low = None
+
+    if last_unit in ('lpa', 'l', 'lac', 'lakh', 'lakhs', 'cr', 'crore') and currency is None:
+        currency = 'INR'
+    return Salary(low, high, currency, period)
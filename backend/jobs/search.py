@@ -0,0 +1,121 @@
+"""
+Cross-company job search for the aggregated job board.
+
+On PostgreSQL `q` is matched against the trigger-maintained search_vector
+(GIN index) and results are ranked with ts_rank; other databases fall back
+to substring matching ordered by newest. Pages are keyset-paginated with an
+opaque cursor.
+
+Newest-first pages are id keysets on the primary key index. The relevance
+keyset (rank, id) is a computed expression with no index behind it, so
+every page ranks all of its candidates again. To bound that, only the
+newest JOB_SEARCH_MAX_CANDIDATES matches (default 1000) are ranked and
+paged through; older matches do not appear in relevance results.
+"""
+import base64
+import hashlib
+import json
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Count, F, IntegerField, Q
+from django.db.models.functions import Cast
+
+from companies.models import Company
+
+
+# ts_rank is a float; scaled to an integer so cursors compare exactly
+RANK_SCALE = 1_000_000
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(',', ':')).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise InvalidCursor('Invalid cursor')
+    if not isinstance(values, list) or not all(isinstance(value, int) for value in values):
+        raise InvalidCursor('Invalid cursor')
+    return values
+
+
+def uses_full_text(jobs):
+    return connections[jobs.db].vendor == 'postgresql'
+
+
+def rank_jobs(jobs, query):
+    """Filter by the search text and order by relevance (or newest without full-text support)"""
+    if not query:
+        return jobs.order_by('-id'), False
+    if uses_full_text(jobs):
+        search_query = SearchQuery(query, search_type='websearch', config='english')
+        jobs = jobs.filter(search_vector=search_query).annotate(
+            rank=Cast(SearchRank(F('search_vector'), search_query) * RANK_SCALE, IntegerField())
+        )
+        return jobs.order_by('-rank', '-id'), True
+    jobs = jobs.filter(Q(title__icontains=query) | Q(description__icontains=query))
+    return jobs.order_by('-id'), False
+
+
+def paginate(jobs, ranked, cursor, limit):
+    """Return (page of jobs, next cursor or None)"""
+    if ranked:
+        # Rank at most this many matches per page (see the module docstring)
+        max_candidates = getattr(settings, 'JOB_SEARCH_MAX_CANDIDATES', 1000)
+        jobs = jobs.filter(id__in=jobs.order_by('-id').values('id')[:max_candidates])
+    if cursor:
+        values = decode_cursor(cursor)
+        if ranked:
+            if len(values) != 2:
+                raise InvalidCursor('Invalid cursor')
+            rank, last_id = values
+            jobs = jobs.filter(Q(rank__lt=rank) | Q(rank=rank, id__lt=last_id))
+        else:
+            if len(values) != 1:
+                raise InvalidCursor('Invalid cursor')
+            jobs = jobs.filter(id__lt=values[0])
+
+    page = list(jobs[:limit + 1])
+    if len(page) <= limit:
+        return page, None
+    page = page[:limit]
+    last = page[-1]
+    return page, encode_cursor([last.rank, last.id] if ranked else [last.id])
+
+
+def company_facets(jobs, cache_key_params, limit=20):
+    """Top companies by matching job count, cached briefly per filter combination"""
+    key = 'job-search-facets:' + hashlib.sha256(
+        json.dumps(sorted(cache_key_params.items())).encode()
+    ).hexdigest()
+    facets = cache.get(key)
+    if facets is not None:
+        return facets
+
+    counts = list(
+        jobs.order_by().values('company_id').annotate(count=Count('id')).order_by('-count', 'company_id')[:limit]
+    )
+    companies = Company.objects.using(jobs.db).only('id', 'slug', 'name').in_bulk(
+        [row['company_id'] for row in counts]
+    )
+    facets = [
+        {
+            'slug': companies[row['company_id']].slug,
+            'name': companies[row['company_id']].name,
+            'count': row['count'],
+        }
+        for row in counts
+        if row['company_id'] in companies
+    ]
+    cache.set(key, facets, getattr(settings, 'JOB_SEARCH_FACET_CACHE_SECONDS', 60))
+    return facets
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Job
+from .models import ArchivedJob, Job
 from companies.serializers import CompanyPublicSerializer
 
 
@@ -15,21 +15,50 @@ class JobSerializer(serializers.ModelSerializer):
             'id', 'company', 'company_name', 'company_slug',
             'title', 'description', 'location', 'work_policy',
             'department', 'employment_type', 'job_type', 'experience',
-            'salary_range', 'posted_date'
+            'salary_range', 'posted_date',
+            'city', 'region', 'country', 'latitude', 'longitude',
+            'salary_min', 'salary_max', 'salary_currency', 'salary_period',
+            'status', 'closed_at'
+        ]
+        # status changes go through the close/reopen actions
+        read_only_fields = [
+            'id', 'company', 'city', 'region', 'country', 'latitude', 'longitude',
+            'salary_min', 'salary_max', 'salary_currency', 'salary_period',
+            'status', 'closed_at'
         ]
-        read_only_fields = ['id', 'company']
 
 
 class JobPublicSerializer(serializers.ModelSerializer):
     """Serializer for public job listings"""
     company = CompanyPublicSerializer(read_only=True)
     job_type = serializers.CharField(source='employment_type', read_only=True)  # Backward compatibility
+    distance_km = serializers.SerializerMethodField()  # Only set for radius searches
     
     class Meta:
         model = Job
         fields = [
             'id', 'company', 'title', 'description', 'location',
             'work_policy', 'department', 'employment_type', 'job_type',
-            'experience', 'salary_range', 'posted_date'
+            'experience', 'salary_range', 'posted_date',
+            'city', 'region', 'country', 'latitude', 'longitude', 'distance_km',
+            'salary_min', 'salary_max', 'salary_currency', 'salary_period'
         ]
+    
+    def get_distance_km(self, obj):
+        distance = getattr(obj, 'distance_km', None)
+        return round(distance, 1) if distance is not None else None
+
 
+class ArchivedJobSerializer(serializers.ModelSerializer):
+    """Read-only serializer for archived jobs (recruiter reporting)"""
+    class Meta:
+        model = ArchivedJob
+        fields = [
+            'id', 'original_id', 'title', 'description', 'location',
+            'work_policy', 'department', 'employment_type', 'experience',
+            'salary_range', 'posted_date',
+            'city', 'region', 'country',
+            'salary_min', 'salary_max', 'salary_currency', 'salary_period',
+            'created_at', 'closed_at', 'archived_at'
+        ]
+        read_only_fields = fields
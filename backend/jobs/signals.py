@@ -0,0 +1,64 @@
+"""
+Keep job-derived data current: the typeahead index and the content versions
+that feeds and other caches are keyed on.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from companies.models import Company
+
+from . import suggestions, versions
+from .models import Job
+
+
+# Fields whose old values decide how the typeahead index changes
+TRACKED_FIELDS = suggestions.KINDS + ('status',)
+
+
+def _suggestion_values(values):
+    # Closed jobs are not in the index
+    if values.get('status', Job.OPEN) != Job.OPEN:
+        return None
+    return {kind: values.get(kind) for kind in suggestions.KINDS}
+
+
+@receiver(post_save, sender=Job)
+def record_job_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    loaded = getattr(instance, '_loaded_values', None)
+    new_values = _suggestion_values(instance.__dict__)
+    if created:
+        old_values = None
+    elif loaded is None or not all(field in loaded for field in TRACKED_FIELDS):
+        # Old values unknown (instance not loaded from the database); rebuild instead
+        transaction.on_commit(lambda: suggestions.invalidate(instance.company_id))
+        return
+    else:
+        # Recorded even when unchanged: other fields changed the company's content version
+        old_values = _suggestion_values(loaded)
+    company_id = instance.company_id
+    transaction.on_commit(lambda: suggestions.record_change(company_id, old_values, new_values))
+    instance._loaded_values = {
+        **(loaded or {}),
+        **{field: instance.__dict__.get(field) for field in TRACKED_FIELDS},
+    }
+
+
+@receiver(post_delete, sender=Job)
+def record_job_delete(sender, instance, **kwargs):
+    loaded = getattr(instance, '_loaded_values', None) or instance.__dict__
+    old_values = _suggestion_values(loaded)
+    company_id = instance.company_id
+    transaction.on_commit(lambda: suggestions.record_change(company_id, old_values, None))
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def bump_version_on_company_change(sender, instance, raw=False, **kwargs):
+    # Company name, slug and logo appear in feeds and nested job payloads
+    if raw:
+        return
+    company_id = instance.id
+    transaction.on_commit(lambda: versions.bump(company_id))
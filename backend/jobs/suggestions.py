@@ -0,0 +1,161 @@
+"""
+Typeahead suggestions for the careers page search box.
+
+Each process keeps a prefix index per company, built from one query over the
+company's jobs. An index maps every word-start prefix of a title, department
+or location to the values containing it, and caches the top-N answers per
+prefix, so a keystroke is a couple of dict lookups.
+
+Job saves and deletes update the local index in place and bump the company's
+content version (jobs/versions.py). Other processes see the new version on
+their next lookup and rebuild their copy. Writes that skip signals
+(bulk_create, queryset.update) should call invalidate().
+"""
+import heapq
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from . import versions
+
+
+KINDS = ('title', 'department', 'location')
+MAX_PREFIX_LENGTH = 20
+MAX_LIMIT = 20
+
+_indexes = OrderedDict()   # company_id -> CompanySuggestions, least recently used first
+_lock = threading.Lock()
+
+
+def _prefixes(value):
+    """Prefixes of the value starting at each word, lowercased and length-capped"""
+    normalized = ' '.join(value.lower().split())
+    words = normalized.split(' ')
+    prefixes = set()
+    for index in range(len(words)):
+        tail = ' '.join(words[index:])[:MAX_PREFIX_LENGTH]
+        prefixes.update(tail[:length] for length in range(1, len(tail) + 1))
+    return prefixes
+
+
+def _matches(value, query):
+    words = value.lower().split()
+    return any(' '.join(words[index:]).startswith(query) for index in range(len(words)))
+
+
+class PrefixIndex:
+    """Values of one kind for one company, with counts and per-prefix top lists"""
+
+    def __init__(self):
+        self.counts = {}
+        self.by_prefix = {}
+        self._top = {}
+
+    def add(self, value, delta=1):
+        if not value or not value.strip():
+            return
+        value = value.strip()
+        count = self.counts.get(value, 0) + delta
+        prefixes = _prefixes(value)
+        if count > 0:
+            if value not in self.counts:
+                for prefix in prefixes:
+                    self.by_prefix.setdefault(prefix, set()).add(value)
+            self.counts[value] = count
+        elif value in self.counts:
+            del self.counts[value]
+            for prefix in prefixes:
+                values = self.by_prefix.get(prefix)
+                if values is not None:
+                    values.discard(value)
+                    if not values:
+                        del self.by_prefix[prefix]
+        # Only answers for this value's prefixes can have changed
+        for prefix in prefixes:
+            self._top.pop(prefix, None)
+        self._top.pop('', None)
+
+    def top(self, query, limit):
+        query = ' '.join(query.lower().split())
+        key = query[:MAX_PREFIX_LENGTH]
+        results = self._top.get(key)
+        if results is None:
+            candidates = self.by_prefix.get(key, ()) if key else self.counts
+            results = heapq.nlargest(MAX_LIMIT, candidates, key=lambda value: (self.counts[value], value))
+            self._top[key] = results
+        if len(query) > MAX_PREFIX_LENGTH:
+            results = [value for value in results if _matches(value, query)]
+        return [{'value': value, 'count': self.counts[value]} for value in results[:limit]]
+
+
+class CompanySuggestions:
+    def __init__(self, version):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.kinds = {kind: PrefixIndex() for kind in KINDS}
+
+    def apply(self, values, delta):
+        for kind in KINDS:
+            self.kinds[kind].add(values.get(kind), delta)
+
+
+def _build(company_id, version):
+    from .models import Job
+
+    index = CompanySuggestions(version)
+    for values in Job.objects.open().filter(company_id=company_id).values(*KINDS).iterator():
+        index.apply(values, 1)
+    return index
+
+
+def get_index(company_id):
+    """The up-to-date suggestion index for a company, rebuilt if stale"""
+    version = versions.get_version(company_id)
+    max_age = getattr(settings, 'JOB_SUGGESTIONS_MAX_AGE', 3600)
+    with _lock:
+        index = _indexes.get(company_id)
+        if index is not None and index.version == version and time.monotonic() - index.built_at < max_age:
+            _indexes.move_to_end(company_id)
+            return index
+
+    index = _build(company_id, version)
+    with _lock:
+        _indexes[company_id] = index
+        _indexes.move_to_end(company_id)
+        while len(_indexes) > getattr(settings, 'JOB_SUGGESTIONS_MAX_COMPANIES', 1000):
+            _indexes.popitem(last=False)
+    return index
+
+
+def suggest(company_id, query, limit=8, kinds=KINDS):
+    index = get_index(company_id)
+    with _lock:
+        return {kind: index.kinds[kind].top(query, limit) for kind in kinds}
+
+
+def record_change(company_id, old_values=None, new_values=None):
+    """Apply a job change to this process's index and tell the others"""
+    version = versions.bump(company_id)
+    with _lock:
+        index = _indexes.get(company_id)
+        if index is None:
+            return
+        if version is None or index.version != version - 1:
+            # Another process changed this company in between; rebuild on next use
+            del _indexes[company_id]
+            return
+        if old_values != new_values:
+            if old_values:
+                index.apply(old_values, -1)
+            if new_values:
+                index.apply(new_values, 1)
+        index.version = version
+
+
+def invalidate(company_id):
+    """Force every process to rebuild the company's index on next use"""
+    versions.bump(company_id)
+    with _lock:
+        _indexes.pop(company_id, None)
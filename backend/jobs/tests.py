@@ -0,0 +1,36 @@
+"""
+Bulk loading jobs with generate_synthetic_jobs.
+
+The COPY branch needs PostgreSQL and a schema built by the migrations (the
+NOT NULL columns and search trigger they create), so it only runs there.
+"""
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from jobs.management.commands.generate_synthetic_jobs import JOB_COLUMNS
+from jobs.models import Job
+
+
+class GenerateSyntheticJobsTests(TestCase):
+    def generate(self, *args):
+        call_command('generate_synthetic_jobs', '--companies', '3', '--jobs', '50', '--batch-size', '20', *args,
+                     stdout=StringIO())
+
+    def test_copy_columns_cover_every_job_column(self):
+        columns = {field.column for field in Job._meta.concrete_fields} - {'id', 'search_vector'}
+        self.assertEqual(columns, set(JOB_COLUMNS))
+
+    @skipUnless(connection.vendor == 'postgresql', 'COPY needs PostgreSQL')
+    def test_copy_after_all_migrations(self):
+        self.generate()
+        self.assertEqual(Job.objects.count(), 50)
+        self.assertEqual(Job.objects.open().count(), 50)
+        self.assertFalse(Job.objects.filter(search_vector__isnull=True).exists())
+
+    def test_bulk_create(self):
+        self.generate('--no-copy')
+        self.assertEqual(Job.objects.open().count(), 50)
@@ -1,11 +1,22 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from . import feeds
 from .views import JobViewSet
 
 router = DefaultRouter()
 router.register(r'', JobViewSet, basename='job')
 
 urlpatterns = [
+    # Crawler feeds, for all companies and per company
+    path('feeds/sitemap.xml', feeds.sitemap, name='job-feed-sitemap'),
+    path('feeds/sitemap-<int:page>.xml', feeds.sitemap_page, name='job-feed-sitemap-page'),
+    path('feeds/jobs.rss', feeds.rss, name='job-feed-rss'),
+    path('feeds/jobs.jsonld', feeds.jsonld, name='job-feed-jsonld'),
+    path('feeds/jobs-<int:page>.jsonld', feeds.jsonld_page, name='job-feed-jsonld-page'),
+    path('feeds/<slug:slug>/sitemap.xml', feeds.sitemap, name='company-job-feed-sitemap'),
+    path('feeds/<slug:slug>/sitemap-<int:page>.xml', feeds.sitemap_page, name='company-job-feed-sitemap-page'),
+    path('feeds/<slug:slug>/jobs.rss', feeds.rss, name='company-job-feed-rss'),
+    path('feeds/<slug:slug>/jobs.jsonld', feeds.jsonld, name='company-job-feed-jsonld'),
+    path('feeds/<slug:slug>/jobs-<int:page>.jsonld', feeds.jsonld_page, name='company-job-feed-jsonld-page'),
     path('', include(router.urls)),
 ]
-
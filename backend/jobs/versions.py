@@ -0,0 +1,50 @@
+"""
+Content versions for per-company and global job data.
+
+A version is a number in the shared cache that changes whenever a company's
+jobs (or the company itself) change. Anything derived from the jobs - the
+typeahead index, feeds - keys its caches on it. Writes that skip signals
+(bulk_create, queryset.update) should call bump().
+"""
+import time
+
+from django.core.cache import cache
+
+
+GLOBAL = 'all'
+
+
+def _key(company_id):
+    return f'jobs-version:{company_id}'
+
+
+def _fresh_version():
+    # Never reuse a number an older cache entry might still carry after eviction
+    return time.time_ns() // 1000
+
+
+def get_version(company_id=GLOBAL):
+    version = cache.get(_key(company_id))
+    if version is None:
+        cache.add(_key(company_id), _fresh_version(), timeout=None)
+        version = cache.get(_key(company_id))
+    return version
+
+
+def _incr(company_id):
+    try:
+        return cache.incr(_key(company_id))
+    except ValueError:
+        # Key missing or evicted: start over, every reader sees a new version
+        cache.set(_key(company_id), _fresh_version(), timeout=None)
+        return None
+
+
+def bump(company_id):
+    """
+    Mark a company's jobs (and the global set) as changed.
+
+    Returns the company's new version, or None if it had to be reset.
+    """
+    _incr(GLOBAL)
+    return _incr(company_id)
@@ -1,25 +1,61 @@
 from rest_framework import viewsets, status, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.db.models import Q
-from .models import Job
-from .serializers import JobSerializer, JobPublicSerializer
+from django.utils import timezone
+from django.http import FileResponse, StreamingHttpResponse
+from . import export as job_export
+from . import search as job_search
+from . import suggestions as job_suggestions
+from .filters import FilterError, apply_filters, apply_sort
+from .models import ArchivedJob, Job
+from .serializers import ArchivedJobSerializer, JobSerializer, JobPublicSerializer
+from companies.cache import get_company
 from companies.models import Company
+from careers_builder.paginators import CappedCountPagination
+from careers_builder.throttling import PUBLIC_THROTTLES
+
+
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
 
 
 class JobViewSet(viewsets.ModelViewSet):
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = None  # Disable pagination for list view
+    pagination_class = CappedCountPagination
     
     def get_queryset(self):
         """Recruiters can only see jobs from their company"""
         company = Company.objects.filter(recruiter=self.request.user).first()
         if company:
-            return Job.objects.filter(company=company)
+            # company_name/company_slug are serialized for every job
+            return Job.objects.filter(company=company).select_related('company')
         return Job.objects.none()
     
+    def filter_queryset(self, queryset):
+        """
+        The list takes the public filters and sort, plus status=open|closed.
+        Defaults to newest first.
+        """
+        if self.action != 'list':
+            return queryset
+        params = self.request.query_params
+        job_status = params.get('status')
+        if job_status:
+            valid = [value for value, _ in Job.STATUSES]
+            if job_status not in valid:
+                raise FilterError(f'status must be one of: {", ".join(valid)}')
+            queryset = queryset.filter(status=job_status)
+        return apply_sort(apply_filters(queryset.defer('search_vector'), params), params)
+    
+    def list(self, request, *args, **kwargs):
+        try:
+            return super().list(request, *args, **kwargs)
+        except FilterError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
     def perform_create(self, serializer):
         """Automatically assign company when creating job"""
         company = Company.objects.filter(recruiter=self.request.user).first()
@@ -27,7 +63,65 @@ class JobViewSet(viewsets.ModelViewSet):
             raise serializers.ValidationError("You must create a company first")
         serializer.save(company=company)
     
-    @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @action(detail=True, methods=['post'])
+    def close(self, request, pk=None):
+        """Mark a job as filled; it leaves all public listings"""
+        job = self.get_object()
+        if job.status != Job.CLOSED:
+            job.status = Job.CLOSED
+            job.closed_at = timezone.now()
+            job.save(update_fields=['status', 'closed_at', 'updated_at'])
+        return Response(self.get_serializer(job).data)
+    
+    @action(detail=True, methods=['post'])
+    def reopen(self, request, pk=None):
+        """Publish a closed (not yet archived) job again"""
+        job = self.get_object()
+        if job.status != Job.OPEN:
+            job.status = Job.OPEN
+            job.closed_at = None
+            job.save(update_fields=['status', 'closed_at', 'updated_at'])
+        return Response(self.get_serializer(job).data)
+    
+    @action(detail=False, methods=['get'])
+    def archived(self, request):
+        """Archived jobs of the recruiter's company, most recently closed first (paginated)"""
+        company = Company.objects.filter(recruiter=request.user).first()
+        if not company:
+            return Response(
+                {'error': 'You must create a company first'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        archived = ArchivedJob.objects.filter(company=company)
+        paginator = PageNumberPagination()
+        page = paginator.paginate_queryset(archived, request, view=self)
+        return paginator.get_paginated_response(ArchivedJobSerializer(page, many=True).data)
+    
+    @action(detail=False, methods=['get'], url_path=r'export/(?P<file_format>csv|xlsx)')
+    def export(self, request, file_format):
+        """Download all of the recruiter's jobs as CSV (streamed) or XLSX"""
+        company = Company.objects.filter(recruiter=request.user).first()
+        if not company:
+            return Response(
+                {'error': 'You must create a company first'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        rows = job_export.export_rows(Job.objects.filter(company=company))
+        filename = f'{company.slug}-jobs.{file_format}'
+        if file_format == 'csv':
+            response = StreamingHttpResponse(job_export.stream_csv(rows), content_type='text/csv; charset=utf-8')
+            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+            return response
+        return FileResponse(
+            job_export.xlsx_tempfile(rows),
+            as_attachment=True,
+            filename=filename,
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        )
+    
+    @action(detail=False, methods=['get'], permission_classes=[AllowAny], throttle_classes=PUBLIC_THROTTLES)
     def public(self, request):
         """Public endpoint for job listings with filters"""
         company_slug = request.query_params.get('company')
@@ -38,89 +132,94 @@ class JobViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            company = Company.objects.get(slug=company_slug)
-        except Company.DoesNotExist:
+        company = get_company(company_slug)
+        if company is None:
             return Response(
                 {'error': 'Company not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Get jobs for the company
-        jobs = Job.objects.filter(company=company)
+        # Get jobs for the company (company is nested in every serialized job)
+        jobs = Job.objects.open().filter(company=company).select_related('company').defer('search_vector')
+        
+        try:
+            jobs = apply_sort(apply_filters(jobs, request.query_params), request.query_params)
+        except FilterError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Apply filters - all filters use AND logic (all must match)
-        # Each filter is applied independently and correctly
+        serializer = JobPublicSerializer(jobs, many=True, context={'request': request})
+        return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'], permission_classes=[AllowAny], throttle_classes=PUBLIC_THROTTLES)
+    def search(self, request):
+        """Job search across all companies, with company facets and cursor pagination"""
+        params = request.query_params
+        try:
+            limit = min(max(int(params.get('limit', SEARCH_DEFAULT_LIMIT)), 1), SEARCH_MAX_LIMIT)
+        except ValueError:
+            return Response(
+                {'error': 'limit must be a number'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        location = request.query_params.get('location')
-        if location and location.strip():
-            jobs = jobs.filter(location__icontains=location.strip())
+        # Same filters as the per-company endpoint; q (or search) is ranked full-text
+        query = (params.get('q') or params.get('search') or '').strip()
+        jobs = Job.objects.open().select_related('company').defer('search_vector')
+        try:
+            jobs, ranked = job_search.rank_jobs(apply_filters(jobs, params, text_search=False), query)
+            # Facets ignore the company filter so every company keeps its count
+            facet_jobs = jobs
+            slugs = [slug.strip() for slug in (params.get('company') or '').split(',') if slug.strip()]
+            if slugs:
+                jobs = jobs.filter(company__slug__in=slugs)
+            page, next_cursor = job_search.paginate(jobs, ranked, params.get('cursor'), limit)
+        except (FilterError, job_search.InvalidCursor) as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Employment Type - normalize and use exact match (case-insensitive)
-        employment_type = request.query_params.get('employment_type')
-        if employment_type and employment_type.strip():
-            emp_type = employment_type.strip().lower()
-            # Normalize to match model choices
-            emp_type_mapping = {
-                'full-time': 'full-time',
-                'fulltime': 'full-time',
-                'full time': 'full-time',
-                'part-time': 'part-time',
-                'parttime': 'part-time',
-                'part time': 'part-time',
-                'contract': 'contract',
-            }
-            normalized_emp_type = emp_type_mapping.get(emp_type, emp_type)
-            jobs = jobs.filter(employment_type__iexact=normalized_emp_type)
+        data = {
+            'results': JobPublicSerializer(page, many=True, context={'request': request}).data,
+            'next_cursor': next_cursor,
+        }
+        # Facets only on the first page; they do not change while paging
+        if not params.get('cursor'):
+            facet_params = {key: value for key, value in params.items() if key not in ('cursor', 'limit', 'company')}
+            data['facets'] = {'companies': job_search.company_facets(facet_jobs, facet_params)}
+        return Response(data)
+    
+    @action(detail=False, methods=['get'], permission_classes=[AllowAny], throttle_classes=PUBLIC_THROTTLES)
+    def suggestions(self, request):
+        """Typeahead: most frequent titles, departments and locations starting with q"""
+        company_slug = request.query_params.get('company')
         
-        # Work Policy - normalize and use exact match (case-insensitive)
-        work_policy = request.query_params.get('work_policy')
-        if work_policy and work_policy.strip():
-            policy = work_policy.strip().lower()
-            # Normalize to match model choices
-            policy_mapping = {
-                'remote': 'remote',
-                'hybrid': 'hybrid',
-                'onsite': 'onsite',
-                'on-site': 'onsite',
-                'on site': 'onsite',
-                'office': 'onsite',
-            }
-            normalized_policy = policy_mapping.get(policy, policy)
-            jobs = jobs.filter(work_policy__iexact=normalized_policy)
+        if not company_slug:
+            return Response(
+                {'error': 'Company slug is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Experience - normalize and use exact match (case-insensitive)
-        # Note: experience can be NULL, so we need to handle that
-        experience = request.query_params.get('experience')
-        if experience and experience.strip():
-            exp = experience.strip().lower()
-            # Normalize to match model choices
-            exp_mapping = {
-                'senior': 'senior',
-                'junior': 'junior',
-                'mid-level': 'mid-level',
-                'mid level': 'mid-level',
-                'midlevel': 'mid-level',
-                'mid': 'mid-level',
-            }
-            normalized_exp = exp_mapping.get(exp, exp)
-            # Use exact match (case-insensitive) for experience filter
-            # This will only match jobs where experience is not NULL and matches
-            jobs = jobs.filter(experience__iexact=normalized_exp)
+        company = get_company(company_slug)
+        if company is None:
+            return Response(
+                {'error': 'Company not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
         
-        department = request.query_params.get('department')
-        if department and department.strip():
-            jobs = jobs.filter(department__icontains=department.strip())
+        try:
+            limit = min(max(int(request.query_params.get('limit', 8)), 1), job_suggestions.MAX_LIMIT)
+        except ValueError:
+            return Response(
+                {'error': 'limit must be a number'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Search by title or description
-        search = request.query_params.get('search')
-        if search and search.strip():
-            search_term = search.strip()
-            jobs = jobs.filter(
-                Q(title__icontains=search_term) | 
-                Q(description__icontains=search_term)
+        kind = request.query_params.get('kind')
+        if kind and kind not in job_suggestions.KINDS:
+            return Response(
+                {'error': f'kind must be one of: {", ".join(job_suggestions.KINDS)}'},
+                status=status.HTTP_400_BAD_REQUEST
             )
         
-        serializer = JobPublicSerializer(jobs, many=True, context={'request': request})
-        return Response(serializer.data)
-
+        query = request.query_params.get('q', '')
+        return Response(job_suggestions.suggest(
+            company.id, query, limit=limit, kinds=(kind,) if kind else job_suggestions.KINDS
+        ))
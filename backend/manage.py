@@ -6,7 +6,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'careers_builder.settings')
+    # Tests run with a mirrored replica alias (careers_builder/test_settings.py)
+    settings_module = 'careers_builder.test_settings' if sys.argv[1:2] == ['test'] else 'careers_builder.settings'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
@@ -0,0 +1,57 @@
+import os
+
+from django.contrib import admin
+from django.http import FileResponse, Http404
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils.html import format_html
+
+from .models import RequestProfile, SlowQuery
+from .profiling import profiling_dir
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    list_display = ['created_at', 'method', 'path', 'view', 'status_code', 'duration_ms', 'query_count', 'download']
+    list_filter = ['method', 'status_code', 'created_at']
+    search_fields = ['path', 'view']
+    readonly_fields = [field.name for field in RequestProfile._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_urls(self):
+        return [
+            path(
+                '<int:pk>/download/',
+                self.admin_site.admin_view(self.download_view),
+                name='monitoring_requestprofile_download',
+            ),
+        ] + super().get_urls()
+
+    @admin.display(description='Profile')
+    def download(self, obj):
+        url = reverse('admin:monitoring_requestprofile_download', args=[obj.pk])
+        return format_html('<a href="{}">{}</a>', url, obj.file_name)
+
+    def download_view(self, request, pk):
+        profile = get_object_or_404(RequestProfile, pk=pk)
+        file_path = os.path.join(profiling_dir(), os.path.basename(profile.file_name))
+        if not os.path.isfile(file_path):
+            raise Http404('Profile file no longer exists')
+        return FileResponse(open(file_path, 'rb'), as_attachment=True, filename=profile.file_name)
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(admin.ModelAdmin):
+    list_display = ['created_at', 'view', 'duration_ms', 'fingerprint', 'has_plan']
+    list_filter = ['view', 'created_at']
+    search_fields = ['fingerprint', 'sql', 'view']
+    readonly_fields = [field.name for field in SlowQuery._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.display(boolean=True, description='Plan')
+    def has_plan(self, obj):
+        return bool(obj.plan)
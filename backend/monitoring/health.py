@@ -0,0 +1,97 @@
+"""
+Readiness probes with cached results.
+
+Load balancers and uptime checkers call the readiness endpoint constantly;
+probe results are cached in process memory for READINESS_CACHE_SECONDS so
+that health checking does not turn into database traffic.
+"""
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.files.storage import default_storage
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+from careers_builder.db.pool import pool_stats
+from careers_builder.db.routers import replica_status
+
+
+_lock = threading.Lock()
+_cached = {'checked_at': 0.0, 'result': None}
+
+
+def _probe(check):
+    started = time.perf_counter()
+    try:
+        detail = check()
+        status = 'ok'
+    except Exception as e:
+        detail = str(e)[:200]
+        status = 'error'
+    return {'status': status, 'detail': detail, 'duration_ms': round((time.perf_counter() - started) * 1000, 2)}
+
+
+def check_database():
+    with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+        cursor.execute('SELECT 1')
+    return 'connected'
+
+
+def check_migrations():
+    connection = connections[DEFAULT_DB_ALIAS]
+    executor = MigrationExecutor(connection)
+    plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    if plan:
+        raise RuntimeError(f'{len(plan)} unapplied migrations')
+    return 'up to date'
+
+
+def check_media_storage():
+    location = getattr(default_storage, 'location', None)
+    if location is None:
+        # Remote storage backends are checked by their own providers
+        return type(default_storage).__name__
+    if not os.path.isdir(location):
+        os.makedirs(location, exist_ok=True)
+    if not os.access(location, os.W_OK):
+        raise RuntimeError(f'{location} is not writable')
+    return 'writable'
+
+
+def check_cache():
+    cache = caches['default']
+    cache.set('readiness-probe', 1, 30)
+    if cache.get('readiness-probe') != 1:
+        raise RuntimeError('cache round trip failed')
+    return type(cache).__name__
+
+
+def run_probes():
+    probes = {
+        'database': _probe(check_database),
+        'migrations': _probe(check_migrations),
+        'media_storage': _probe(check_media_storage),
+        'cache': _probe(check_cache),
+    }
+    # The cache is not required for serving traffic, so it does not affect readiness
+    ready = all(probes[name]['status'] == 'ok' for name in ('database', 'migrations', 'media_storage'))
+    return {'ready': ready, 'probes': probes}
+
+
+def readiness(force=False):
+    """Cached probe results plus live (in-memory) pool and replica status"""
+    interval = getattr(settings, 'READINESS_CACHE_SECONDS', 10)
+    now = time.monotonic()
+    if force or _cached['result'] is None or now - _cached['checked_at'] >= interval:
+        with _lock:
+            if force or _cached['result'] is None or now - _cached['checked_at'] >= interval:
+                _cached['result'] = run_probes()
+                _cached['checked_at'] = time.monotonic()
+    result = dict(_cached['result'])
+    result['checked_seconds_ago'] = round(time.monotonic() - _cached['checked_at'], 1)
+    result['database_pool'] = pool_stats()
+    result['replicas'] = replica_status()
+    return result
@@ -0,0 +1,86 @@
+"""
+Management command to report the worst slow query shapes
+Usage: python manage.py slow_query_report [--hours 24] [--limit 10] [--order-by total|max|avg|count] [--plans]
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Avg, Count, Max, Sum
+from django.utils import timezone
+
+from monitoring.models import SlowQuery
+from monitoring.slow_queries import normalize_sql
+
+
+ORDERINGS = {
+    'total': '-total_ms',
+    'max': '-max_ms',
+    'avg': '-avg_ms',
+    'count': '-count',
+}
+
+
+class Command(BaseCommand):
+    help = 'Report the slowest query shapes captured by the slow query recorder'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24, help='Only include queries from the last N hours')
+        parser.add_argument('--limit', type=int, default=10, help='Number of query shapes to show')
+        parser.add_argument('--order-by', choices=sorted(ORDERINGS), default='total', help='Ranking criterion')
+        parser.add_argument('--plans', action='store_true', help='Show the latest EXPLAIN plan for each shape')
+        parser.add_argument(
+            '--purge-days',
+            type=int,
+            default=None,
+            help='Delete captured queries older than N days and exit',
+        )
+
+    def handle(self, *args, **options):
+        if options['purge_days'] is not None:
+            cutoff = timezone.now() - timedelta(days=options['purge_days'])
+            deleted, _ = SlowQuery.objects.filter(created_at__lt=cutoff).delete()
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} slow queries older than {cutoff:%Y-%m-%d}'))
+            return
+
+        since = timezone.now() - timedelta(hours=options['hours'])
+        queries = SlowQuery.objects.filter(created_at__gte=since)
+        shapes = (
+            queries.values('fingerprint')
+            .annotate(
+                count=Count('id'),
+                total_ms=Sum('duration_ms'),
+                avg_ms=Avg('duration_ms'),
+                max_ms=Max('duration_ms'),
+            )
+            .order_by(ORDERINGS[options['order_by']])[:options['limit']]
+        )
+
+        if not shapes:
+            self.stdout.write(self.style.WARNING(f'No slow queries captured in the last {options["hours"]} hours'))
+            return
+
+        self.stdout.write(self.style.SUCCESS('=' * 60))
+        self.stdout.write(self.style.SUCCESS(f'Slowest query shapes (last {options["hours"]} hours)'))
+        self.stdout.write(self.style.SUCCESS('=' * 60))
+
+        for rank, shape in enumerate(shapes, start=1):
+            latest = queries.filter(fingerprint=shape['fingerprint']).first()
+            views = sorted(set(
+                queries.filter(fingerprint=shape['fingerprint']).values_list('view', flat=True)[:100]
+            ))
+            self.stdout.write(
+                f'\n{rank}. {shape["fingerprint"]}  count={shape["count"]}  '
+                f'total={shape["total_ms"]:.0f}ms  avg={shape["avg_ms"]:.0f}ms  max={shape["max_ms"]:.0f}ms'
+            )
+            self.stdout.write(f'   Views: {", ".join(views)}')
+            self.stdout.write(f'   SQL: {normalize_sql(latest.sql)[:500]}')
+            self.stdout.write(f'   Example params: {latest.params[:200]}')
+
+            if options['plans']:
+                planned = queries.filter(fingerprint=shape['fingerprint']).exclude(plan='').first()
+                if planned:
+                    self.stdout.write(f'   Plan (on {planned.database}):')
+                    for line in planned.plan.splitlines():
+                        self.stdout.write(f'     {line}')
+                else:
+                    self.stdout.write('   Plan: not sampled yet')
@@ -0,0 +1,305 @@
+"""
+In-process metrics registry with Prometheus text exposition.
+
+Each process keeps its own counters and histograms in memory. With several
+gunicorn workers, set METRICS_MULTIPROC_DIR: every process then periodically
+writes a snapshot to <dir>/metrics-<pid>.json and the exposition endpoint
+sums the snapshots of all processes. Snapshots of processes that no longer
+exist are deleted when collecting, so a recycled worker's counts drop out
+(Prometheus sees that as a counter reset). The directory must be local to
+the host, since liveness is checked by PID.
+
+Short-lived processes (management commands) call save_command_metrics()
+before exiting. It adds their metrics to a shared file (METRICS_COMMANDS_FILE,
+by default command-metrics.json in METRICS_MULTIPROC_DIR or the temp dir),
+which every collect() merges in and nothing deletes.
+"""
+import atexit
+import fcntl
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metric:
+    type = None
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self.registry.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Histogram(Metric):
+    type = 'histogram'
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self.registry.lock:
+            # [count per bucket..., +Inf count, sum]
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+                    break
+            else:
+                state[len(self.buckets)] += 1
+            state[-1] += value
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = {}
+        self.last_flush = 0.0
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(self, name, documentation, labelnames, buckets))
+
+    def _register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def snapshot(self):
+        """JSON-serialisable copy of every metric in this process"""
+        with self.lock:
+            return self._snapshot_unlocked()
+
+    def _snapshot_unlocked(self):
+        return {
+            name: {
+                'type': metric.type,
+                'help': metric.documentation,
+                'labelnames': list(metric.labelnames),
+                'buckets': list(getattr(metric, 'buckets', [])),
+                'values': [[list(key), value] for key, value in metric.values.items()],
+            }
+            for name, metric in self.metrics.items()
+        }
+
+    # Multi-process support
+
+    def _snapshot_path(self, directory):
+        return os.path.join(directory, f'metrics-{os.getpid()}.json')
+
+    def flush(self, force=False):
+        """Write this process's snapshot when running in multi-process mode"""
+        directory = getattr(settings, 'METRICS_MULTIPROC_DIR', None)
+        if not directory:
+            return
+        now = time.monotonic()
+        if not force and now - self.last_flush < getattr(settings, 'METRICS_FLUSH_INTERVAL', 5):
+            return
+        self.last_flush = now
+        os.makedirs(directory, exist_ok=True)
+        path = self._snapshot_path(directory)
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'w') as snapshot_file:
+            json.dump(self.snapshot(), snapshot_file)
+        os.replace(temp_path, path)
+
+    def collect(self):
+        """Snapshots of all processes (or just this one) and finished commands merged together"""
+        directory = getattr(settings, 'METRICS_MULTIPROC_DIR', None)
+        merged = {}
+        if not directory:
+            _merge(merged, self.snapshot())
+        else:
+            self.flush(force=True)
+            for path in glob.glob(os.path.join(directory, 'metrics-*.json')):
+                if not _is_running(_snapshot_pid(path)):
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass   # removed by another collector
+                    continue
+                _merge(merged, _read_snapshot(path))
+        _merge(merged, _read_snapshot(_commands_path()))
+        for data in merged.values():
+            data['values'] = [[list(key), value] for key, value in data['values'].items()]
+        return merged
+
+    def save_command_metrics(self):
+        """
+        Add this process's metrics to the commands file and reset them, so they
+        outlive the process and are not also counted from its own snapshot.
+        """
+        path = _commands_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f'{path}.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            merged = {}
+            _merge(merged, _read_snapshot(path))
+            with self.lock:
+                _merge(merged, self._snapshot_unlocked())
+                for metric in self.metrics.values():
+                    metric.values.clear()
+            for data in merged.values():
+                data['values'] = [[list(key), value] for key, value in data['values'].items()]
+            temp_path = f'{path}.tmp'
+            with open(temp_path, 'w') as snapshot_file:
+                json.dump(merged, snapshot_file)
+            os.replace(temp_path, path)
+        self.flush(force=True)
+
+
+def _commands_path():
+    path = getattr(settings, 'METRICS_COMMANDS_FILE', '')
+    if path:
+        return path
+    directory = getattr(settings, 'METRICS_MULTIPROC_DIR', None) or tempfile.gettempdir()
+    return os.path.join(directory, 'command-metrics.json')
+
+
+def _read_snapshot(path):
+    try:
+        with open(path) as snapshot_file:
+            return json.load(snapshot_file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        # Snapshot being replaced or truncated; the next scrape picks it up
+        return {}
+
+
+def _merge(merged, snapshot):
+    """Add a snapshot's values into merged ({name: data with a {key tuple: value} dict})"""
+    for name, data in snapshot.items():
+        target = merged.setdefault(name, dict(data, values={}))
+        for key, value in data['values']:
+            key = tuple(key)
+            if key not in target['values']:
+                target['values'][key] = value
+            elif isinstance(value, list):
+                target['values'][key] = [a + b for a, b in zip(target['values'][key], value)]
+            else:
+                target['values'][key] += value
+
+
+def _snapshot_pid(path):
+    try:
+        return int(os.path.basename(path)[len('metrics-'):-len('.json')])
+    except ValueError:
+        return None
+
+
+def _is_running(pid):
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass   # exists, owned by another user
+    return True
+
+
+def _format_labels(labelnames, key, extra=None):
+    pairs = list(zip(labelnames, key))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    escaped = (
+        (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in pairs
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def render_prometheus(snapshot):
+    """Render a collected snapshot in the Prometheus text exposition format"""
+    lines = []
+    for name, data in sorted(snapshot.items()):
+        lines.append(f'# HELP {name} {data["help"]}')
+        lines.append(f'# TYPE {name} {data["type"]}')
+        labelnames = data['labelnames']
+        for key, value in sorted(data['values']):
+            if data['type'] == 'histogram':
+                cumulative = 0
+                for bound, count in zip(data['buckets'] + ['+Inf'], value[:-1]):
+                    cumulative += count
+                    labels = _format_labels(labelnames, key, ('le', bound))
+                    lines.append(f'{name}_bucket{labels} {cumulative}')
+                labels = _format_labels(labelnames, key)
+                lines.append(f'{name}_sum{labels} {value[-1]}')
+                lines.append(f'{name}_count{labels} {cumulative}')
+            else:
+                lines.append(f'{name}{_format_labels(labelnames, key)} {value}')
+    return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+atexit.register(registry.flush, force=True)
+
+REQUEST_LATENCY = registry.histogram(
+    'http_request_duration_seconds', 'Request latency by view', ['view', 'method'],
+)
+REQUESTS = registry.counter(
+    'http_requests_total', 'Requests by view and status code', ['view', 'method', 'status'],
+)
+REQUEST_DB_TIME = registry.histogram(
+    'http_request_db_seconds', 'Database time per request by view', ['view'],
+)
+REQUEST_QUERIES = registry.counter(
+    'http_request_queries_total', 'Database queries executed by view', ['view'],
+)
+CACHE_REQUESTS = registry.counter(
+    'cache_requests_total', 'Cache lookups by cache name and result (hit/miss)', ['cache', 'result'],
+)
+RATE_LIMITED = registry.counter(
+    'rate_limited_requests_total', 'Requests rejected by the public rate limits', ['scope'],
+)
+IMPORT_ROWS = registry.counter(
+    'job_import_rows_total', 'Rows processed by imports', ['source', 'result'],
+)
+IMPORT_DURATION = registry.histogram(
+    'job_import_duration_seconds', 'Wall time of import runs', ['source'],
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+)
+
+
+def observe_request(view, method, status, timings):
+    """Record one finished request (called by RequestInstrumentationMiddleware)"""
+    REQUEST_LATENCY.observe(timings.total, view=view, method=method)
+    REQUESTS.inc(view=view, method=method, status=status)
+    REQUEST_DB_TIME.observe(timings.queries.duration, view=view)
+    REQUEST_QUERIES.inc(timings.queries.count, view=view)
+    registry.flush()
+
+
+def record_cache(cache, hit):
+    """Record a cache lookup so hit/miss ratios show up in /internal/metrics"""
+    CACHE_REQUESTS.inc(cache=cache, result='hit' if hit else 'miss')
@@ -0,0 +1,127 @@
+"""
+Lightweight request instrumentation that is safe to run in production.
+
+Counts queries and database time through connection.execute_wrapper (no
+DEBUG needed), adds a Server-Timing header and logs requests that go over
+the configured query or latency budgets. Statements slower than
+SLOW_QUERY_THRESHOLD_MS are handed to the slow query recorder.
+"""
+import logging
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from . import metrics, slow_queries
+
+
+logger = logging.getLogger('monitoring')
+
+
+class QueryStats:
+    """execute_wrapper that counts queries and accumulates their duration"""
+
+    def __init__(self, request=None, slow_threshold=None):
+        self.count = 0
+        self.duration = 0.0
+        self.request = request
+        self.slow_threshold = slow_threshold
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.duration += elapsed
+            if self.slow_threshold is not None and elapsed > self.slow_threshold and not many:
+                slow_queries.recorder.record(
+                    sql, params, view_name(self.request), elapsed, context['connection'].alias
+                )
+
+
+class RequestTimings:
+    """Per-request measurements, available as request.timings"""
+
+    def __init__(self, request=None, slow_threshold=None):
+        self.queries = QueryStats(request, slow_threshold)
+        self.started = time.perf_counter()
+        self.render_started = None
+        self.render_duration = 0.0
+        self.total = 0.0
+
+    def render_finished(self, response):
+        if self.render_started is not None:
+            self.render_duration = time.perf_counter() - self.render_started
+        return response
+
+    def server_timing(self):
+        return ', '.join([
+            f'db;desc="{self.queries.count} queries";dur={self.queries.duration * 1000:.1f}',
+            f'serialize;dur={self.render_duration * 1000:.1f}',
+            f'total;dur={self.total * 1000:.1f}',
+        ])
+
+
+def view_name(request):
+    """Readable view label such as "JobViewSet.public" or "api_root" """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    func = match.func
+    cls = getattr(func, 'cls', None)
+    actions = getattr(func, 'actions', None)
+    if cls is not None and actions:
+        action = actions.get(request.method.lower(), request.method.lower())
+        return f'{cls.__name__}.{action}'
+    return getattr(func, '__name__', match.view_name)
+
+
+class RequestInstrumentationMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.query_budget = getattr(settings, 'REQUEST_QUERY_BUDGET', 50)
+        self.latency_budget = getattr(settings, 'REQUEST_LATENCY_BUDGET_MS', 1000) / 1000
+        self.server_timing = getattr(settings, 'SERVER_TIMING_HEADER', True)
+        self.slow_threshold = None
+        if getattr(settings, 'SLOW_QUERY_ENABLED', True):
+            self.slow_threshold = getattr(settings, 'SLOW_QUERY_THRESHOLD_MS', 200) / 1000
+
+    def __call__(self, request):
+        timings = RequestTimings(request, self.slow_threshold)
+        request.timings = timings
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timings.queries))
+            response = self.get_response(request)
+
+        timings.total = time.perf_counter() - timings.started
+        if self.server_timing:
+            response['Server-Timing'] = timings.server_timing()
+
+        view = view_name(request)
+        metrics.observe_request(view, request.method, response.status_code, timings)
+
+        if timings.queries.count > self.query_budget or timings.total > self.latency_budget:
+            logger.warning(
+                'Request over budget: %s %s view=%s status=%s queries=%d db=%.1fms total=%.1fms',
+                request.method,
+                request.path,
+                view,
+                response.status_code,
+                timings.queries.count,
+                timings.queries.duration * 1000,
+                timings.total * 1000,
+            )
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses render after the view returns; time that separately
+        timings = getattr(request, 'timings', None)
+        if timings is not None:
+            timings.render_started = time.perf_counter()
+            response.add_post_render_callback(timings.render_finished)
+        return response
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlowQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(db_index=True, help_text='Hash of the normalized query shape', max_length=32)),
+                ('sql', models.TextField()),
+                ('params', models.TextField(blank=True)),
+                ('view', models.CharField(max_length=200)),
+                ('duration_ms', models.FloatField()),
+                ('plan', models.TextField(blank=True, help_text='EXPLAIN (ANALYZE, BUFFERS) output when sampled')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Slow queries',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
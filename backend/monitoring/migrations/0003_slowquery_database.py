@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-19 14:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0002_slowquery'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='slowquery',
+            name='database',
+            field=models.CharField(default='default', help_text='Database alias the statement ran on', max_length=100),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import models
+
+
+class RequestProfile(models.Model):
+    """A profile captured for a single request by ProfilingMiddleware"""
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=500)
+    query_string = models.TextField(blank=True)
+    view = models.CharField(max_length=200)
+    status_code = models.PositiveSmallIntegerField()
+    duration_ms = models.FloatField()
+    query_count = models.PositiveIntegerField(default=0)
+    file_name = models.CharField(max_length=255, help_text='pstats file inside PROFILING_DIR')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
+
+
+class SlowQuery(models.Model):
+    """A statement that exceeded SLOW_QUERY_THRESHOLD_MS, with an optional EXPLAIN plan"""
+    fingerprint = models.CharField(max_length=32, db_index=True, help_text='Hash of the normalized query shape')
+    sql = models.TextField()
+    params = models.TextField(blank=True)
+    view = models.CharField(max_length=200)
+    database = models.CharField(max_length=100, default='default', help_text='Database alias the statement ran on')
+    duration_ms = models.FloatField()
+    plan = models.TextField(blank=True, help_text='EXPLAIN (ANALYZE, BUFFERS) output when sampled')
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name_plural = 'Slow queries'
+
+    def __str__(self):
+        return f"{self.view} ({self.duration_ms:.0f} ms)"
@@ -0,0 +1,87 @@
+"""
+On-demand profiling of individual requests.
+
+A request is profiled only when it carries the X-Profile-Request header and
+either the header value matches PROFILING_TOKEN or the session user is
+staff. Other requests pay for a single header lookup.
+
+Profiles are written as pstats files to PROFILING_DIR and listed in the
+admin. Inspect them with `python -m pstats <file>` or snakeviz.
+"""
+import cProfile
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare
+from django.utils.text import slugify
+
+from .middleware import view_name
+
+
+logger = logging.getLogger('monitoring')
+
+PROFILE_HEADER = 'HTTP_X_PROFILE_REQUEST'
+
+
+def profiling_dir():
+    return getattr(settings, 'PROFILING_DIR', os.path.join(settings.BASE_DIR, 'profiles'))
+
+
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        header = request.META.get(PROFILE_HEADER)
+        if header is None or not self._allowed(request, header):
+            return self.get_response(request)
+        return self._profile(request)
+
+    def _allowed(self, request, header):
+        token = getattr(settings, 'PROFILING_TOKEN', '')
+        if token and constant_time_compare(header, token):
+            return True
+        user = getattr(request, 'user', None)
+        return bool(user and user.is_active and user.is_staff)
+
+    def _profile(self, request):
+        from .models import RequestProfile
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        directory = profiling_dir()
+        view = view_name(request)
+        file_name = '{}-{}-{}.prof'.format(
+            timezone.now().strftime('%Y%m%dT%H%M%S%f'),
+            request.method.lower(),
+            slugify(view)[:80] or 'request',
+        )
+        try:
+            os.makedirs(directory, exist_ok=True)
+            profiler.dump_stats(os.path.join(directory, file_name))
+            timings = getattr(request, 'timings', None)
+            profile = RequestProfile.objects.create(
+                method=request.method,
+                path=request.path[:500],
+                query_string=request.META.get('QUERY_STRING', ''),
+                view=view[:200],
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+                query_count=timings.queries.count if timings else 0,
+                file_name=file_name,
+            )
+            response['X-Profile-Id'] = str(profile.pk)
+        except Exception:
+            # Never fail the request because the profile could not be stored
+            logger.exception('Could not store request profile for %s', request.path)
+        return response
@@ -0,0 +1,114 @@
+"""
+Slow query capture.
+
+RequestInstrumentationMiddleware hands every statement slower than
+SLOW_QUERY_THRESHOLD_MS to the recorder below. The recorder only puts it on
+a bounded queue; a background thread stores it as a SlowQuery row and, for a
+sample of SELECTs on PostgreSQL, runs EXPLAIN (ANALYZE, BUFFERS) first, on
+the database alias the statement ran on (a replica's plan and cache state
+differ from the primary's). The request never waits on either. Use `manage.py slow_query_report` to see the
+worst query shapes.
+"""
+import hashlib
+import logging
+import queue
+import random
+import re
+import threading
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections, transaction
+
+
+logger = logging.getLogger('monitoring')
+
+_PLACEHOLDER_LIST = re.compile(r'\(\s*%s(?:\s*,\s*%s)+\s*\)')
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_sql(sql):
+    """Query shape with literals and placeholder lists collapsed"""
+    shape = _STRING_LITERAL.sub('?', sql)
+    shape = _NUMBER.sub('?', shape)
+    shape = _PLACEHOLDER_LIST.sub('(%s, ...)', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+
+def fingerprint(sql):
+    return hashlib.md5(normalize_sql(sql).encode('utf-8')).hexdigest()
+
+
+class SlowQueryRecorder:
+    def __init__(self, maxsize=1000):
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.lock = threading.Lock()
+        self.thread = None
+        self.dropped = 0
+
+    def record(self, sql, params, view, duration, using=DEFAULT_DB_ALIAS):
+        """Queue a slow statement that ran on database `using`; never blocks the caller"""
+        self._ensure_worker()
+        try:
+            self.queue.put_nowait((sql, params, view, duration, using))
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_worker(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name='slow-query-recorder', daemon=True)
+                self.thread.start()
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                self._store(*item)
+            except Exception:
+                logger.exception('Could not store slow query')
+            finally:
+                close_old_connections()
+                self.queue.task_done()
+
+    def _store(self, sql, params, view, duration, using):
+        from .models import SlowQuery
+
+        plan = ''
+        sample_rate = getattr(settings, 'SLOW_QUERY_EXPLAIN_SAMPLE_RATE', 0.1)
+        if random.random() < sample_rate:
+            plan = self._explain(sql, params, using)
+
+        SlowQuery.objects.create(
+            fingerprint=fingerprint(sql),
+            sql=sql,
+            params=repr(params)[:2000],
+            view=view[:200],
+            database=using[:100],
+            duration_ms=duration * 1000,
+            plan=plan,
+        )
+
+    def _explain(self, sql, params, using=DEFAULT_DB_ALIAS):
+        """EXPLAIN (ANALYZE, BUFFERS) for read-only statements on PostgreSQL, on the alias they ran on"""
+        connection = connections[using]
+        if connection.vendor != 'postgresql' or not sql.lstrip().upper().startswith('SELECT'):
+            return ''
+        timeout_ms = getattr(settings, 'SLOW_QUERY_EXPLAIN_TIMEOUT_MS', 5000)
+        try:
+            with transaction.atomic(using=using):
+                with connection.cursor() as cursor:
+                    cursor.execute(f'SET LOCAL statement_timeout = {int(timeout_ms)}')
+                    cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS) {sql}', params)
+                    plan = '\n'.join(row[0] for row in cursor.fetchall())
+                    # Roll back anything EXPLAIN ANALYZE may have touched
+                    transaction.set_rollback(True, using=using)
+                    return plan
+        except Exception as e:
+            return f'EXPLAIN failed: {e}'
+
+
+recorder = SlowQueryRecorder()
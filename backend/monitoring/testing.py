@@ -0,0 +1,59 @@
+"""
+Test helpers for asserting query budgets on endpoints.
+
+Usage in a TestCase:
+
+    class PublicEndpointTests(QueryBudgetTestMixin, TestCase):
+        def test_jobs_public(self):
+            self.assertQueryBudget('job-public', query={'company': 'acme'})
+"""
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+# Maximum queries per public endpoint, keyed by URL name
+PUBLIC_ENDPOINT_QUERY_BUDGETS = {
+    'job-public': 2,             # company lookup + jobs (company is select_related)
+    'company-public': 1,         # company lookup
+    'content-section-public': 2,  # company lookup + sections
+    'job-suggestions': 2,        # company lookup + index rebuild when stale (usually 1)
+    'job-search': 3,             # jobs page + facet counts + facet companies (facets cached)
+    'sync-changes': 4,           # company lookup + change entries + jobs + sections
+}
+
+
+@contextmanager
+def assert_max_queries(limit, using=None):
+    """
+    Fail if the block runs more than `limit` queries.
+
+    Counts every configured database (primary and replicas) unless `using`
+    names one alias. Yields {alias: CaptureQueriesContext}.
+    """
+    aliases = [using] if using else list(connections)
+    with ExitStack() as stack:
+        contexts = {alias: stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in aliases}
+        yield contexts
+    queries = [(alias, query) for alias, context in contexts.items() for query in context.captured_queries]
+    if len(queries) > limit:
+        statements = '\n'.join(
+            f'{index}. [{alias}] {query["sql"]}' for index, (alias, query) in enumerate(queries, start=1)
+        )
+        raise AssertionError(f'{len(queries)} queries executed, budget is {limit}:\n{statements}')
+
+
+class QueryBudgetTestMixin:
+    """Mixin for django.test.TestCase classes that checks endpoint query budgets"""
+    query_budgets = PUBLIC_ENDPOINT_QUERY_BUDGETS
+
+    def assertQueryBudget(self, url_name, budget=None, args=None, kwargs=None, query=None, status_code=200):
+        if budget is None:
+            budget = self.query_budgets[url_name]
+        url = reverse(url_name, args=args, kwargs=kwargs)
+        with assert_max_queries(budget):
+            response = self.client.get(url, query or {})
+        self.assertEqual(response.status_code, status_code)
+        return response
@@ -0,0 +1,142 @@
+"""
+Query budgets for the public endpoints (PUBLIC_ENDPOINT_QUERY_BUDGETS), and
+metrics collection across processes.
+
+Public reads are routed to the replica alias from careers_builder.test_settings,
+so queries are counted on every connection. TransactionTestCase commits the
+fixtures, which the mirrored replica connection needs to see them.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connections
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from companies import cache as company_cache
+from companies.models import Company
+from content.models import ContentSection
+from jobs.models import Job
+
+from . import metrics, slow_queries
+from .testing import PUBLIC_ENDPOINT_QUERY_BUDGETS, QueryBudgetTestMixin, assert_max_queries
+
+
+JOBS = [
+    ('Software Engineer', 'Engineering', 'San Francisco, CA', '$120k - $150k'),
+    ('Senior Software Engineer', 'Engineering', 'Remote', '$150k - $180k'),
+    ('Product Designer', 'Design', 'London, UK', '£60,000 - £70,000'),
+    ('Data Analyst', 'Data', 'Bangalore, India', '₹12-18 LPA'),
+    ('Engineering Manager', 'Engineering', 'Berlin, Germany', '€90k - €110k'),
+]
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0, PUBLIC_RATE_LIMITS={})
+class PublicEndpointQueryBudgetTests(QueryBudgetTestMixin, TransactionTestCase):
+    databases = '__all__'
+
+    def setUp(self):
+        cache.clear()
+        company_cache.clear()
+        recruiter = User.objects.create_user('recruiter', 'recruiter@example.com', 'secret-password')
+        company = Company.objects.create(name='Acme', slug='acme', recruiter=recruiter)
+        for title, department, location, salary_range in JOBS:
+            Job.objects.create(
+                company=company, title=title, department=department, location=location, salary_range=salary_range,
+            )
+        for order, section_type in enumerate(['about', 'life', 'benefits']):
+            ContentSection.objects.create(
+                company=company, section_type=section_type, title=section_type.title(), content='Text', order=order,
+            )
+
+    def test_every_budgeted_endpoint_is_tested(self):
+        tested = {name[len('test_'):].replace('_', '-') for name in dir(self) if name.startswith('test_')}
+        self.assertLessEqual(set(PUBLIC_ENDPOINT_QUERY_BUDGETS), tested)
+
+    def test_job_public(self):
+        response = self.assertQueryBudget('job-public', query={'company': 'acme'})
+        self.assertEqual(len(response.json()), len(JOBS))
+
+    def test_company_public(self):
+        self.assertQueryBudget('company-public', kwargs={'slug': 'acme'})
+
+    def test_content_section_public(self):
+        response = self.assertQueryBudget('content-section-public', query={'company': 'acme'})
+        self.assertEqual(len(response.json()), 3)
+
+    def test_job_suggestions(self):
+        self.assertQueryBudget('job-suggestions', query={'company': 'acme', 'q': 'eng'})
+
+    def test_job_search(self):
+        response = self.assertQueryBudget('job-search', query={'q': 'engineer'})
+        self.assertTrue(response.json()['results'])
+
+    def test_sync_changes(self):
+        response = self.assertQueryBudget('sync-changes', query={'company': 'acme'})
+        self.assertEqual(len(response.json()['changes']), len(JOBS) + 3)
+
+    @skipUnless('replica' in settings.DATABASES, 'needs a replica alias (careers_builder.test_settings)')
+    def test_assert_max_queries_counts_replica_queries(self):
+        with self.assertRaises(AssertionError):
+            with assert_max_queries(0):
+                list(Company.objects.using('replica').all())
+
+
+class CommandMetricsTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.registry = metrics.Registry()
+        self.rows = self.registry.counter('rows_total', 'Rows', ['result'])
+
+    def run_command(self):
+        """Record like a command process: save_command_metrics(), then a final snapshot at exit"""
+        process = subprocess.Popen([sys.executable, '-c', ''])
+        process.wait()
+        self.rows.inc(3, result='imported')
+        self.registry.save_command_metrics()
+        with open(os.path.join(self.directory, f'metrics-{process.pid}.json'), 'w') as snapshot_file:
+            json.dump(self.registry.snapshot(), snapshot_file)
+
+    def collected_rows(self):
+        return dict((tuple(key), value) for key, value in self.registry.collect()['rows_total']['values'])
+
+    def test_finished_command_survives_collect_in_multiprocess_mode(self):
+        with override_settings(METRICS_MULTIPROC_DIR=self.directory, METRICS_COMMANDS_FILE=''):
+            self.run_command()
+            self.run_command()
+            self.assertEqual(self.collected_rows(), {('imported',): 6})
+            # The dead process's own snapshot is gone, the command metrics stay
+            self.assertEqual(self.collected_rows(), {('imported',): 6})
+            self.assertEqual(os.listdir(self.directory).count('command-metrics.json'), 1)
+
+    def test_finished_command_survives_collect_in_single_process_mode(self):
+        commands_file = os.path.join(self.directory, 'commands.json')
+        with override_settings(METRICS_MULTIPROC_DIR='', METRICS_COMMANDS_FILE=commands_file):
+            self.run_command()
+            self.rows.inc(1, result='skipped')
+            self.assertEqual(self.collected_rows(), {('imported',): 3, ('skipped',): 1})
+
+
+@skipUnless('replica' in settings.DATABASES, 'needs a replica alias (careers_builder.test_settings)')
+class SlowQueryExplainTests(SimpleTestCase):
+    databases = {'default', 'replica'}
+
+    def test_replica_statement_is_explained_on_the_replica(self):
+        recorder = slow_queries.SlowQueryRecorder()
+        # EXPLAIN only runs on PostgreSQL; elsewhere it is attempted and fails, which is enough here
+        with mock.patch.object(connections['replica'], 'vendor', 'postgresql'), \
+                CaptureQueriesContext(connections['default']) as primary, \
+                CaptureQueriesContext(connections['replica']) as replica:
+            recorder._explain('SELECT 1', [], 'replica')
+        self.assertTrue(any('EXPLAIN' in query['sql'] or 'statement_timeout' in query['sql']
+                            for query in replica.captured_queries))
+        self.assertEqual(primary.captured_queries, [])
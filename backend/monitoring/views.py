@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
+from django.utils.crypto import constant_time_compare
+
+from . import health
+from .metrics import registry, render_prometheus
+
+
+def is_internal_request(request):
+    """Staff users, a matching METRICS_TOKEN bearer token or an allow-listed IP"""
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    auth_header = request.headers.get('Authorization', '')
+    if token and auth_header.startswith('Bearer ') and constant_time_compare(auth_header[7:], token):
+        return True
+    if request.META.get('REMOTE_ADDR') in getattr(settings, 'METRICS_ALLOWED_IPS', []):
+        return True
+    user = getattr(request, 'user', None)
+    return bool(user and user.is_active and user.is_staff)
+
+
+def metrics(request):
+    """Prometheus metrics for all worker processes"""
+    if not is_internal_request(request):
+        return HttpResponseForbidden('Forbidden')
+    return HttpResponse(
+        render_prometheus(registry.collect()),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+    )
+
+
+def liveness(request):
+    """Process is up and serving requests; does no I/O"""
+    return JsonResponse({'status': 'alive'})
+
+
+def readiness(request):
+    """Database, migrations, media storage and cache probes (cached)"""
+    result = health.readiness()
+    return JsonResponse(result, status=200 if result['ready'] else 503)
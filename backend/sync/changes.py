@@ -0,0 +1,78 @@
+"""
+Writing to the change log.
+
+Model saves and deletes are recorded by signals (sync/signals.py). Job and
+ContentSection saves run in a transaction of their own (and deletes always
+do), so the entry commits together with the write. Bulk writes that skip
+signals (queryset.update, bulk_create, COPY) should call record_queryset()
+for the rows they touched, inside the same atomic block as the write.
+
+Every entry stores the id of the transaction that wrote it; readers use
+completed_before() to only hand out entries whose transaction has finished.
+"""
+from django.db import connections
+from django.db.models import BigIntegerField, Expression
+from django.utils import timezone
+
+from .models import Change
+
+
+MODEL_KEYS = {
+    'jobs.Job': 'job',
+    'content.ContentSection': 'content_section',
+}
+
+
+def model_key(model):
+    return MODEL_KEYS[model._meta.label]
+
+
+def _txid_sql(connection):
+    return 'pg_current_xact_id()::text::bigint' if connection.vendor == 'postgresql' else '0'
+
+
+class CurrentTransactionId(Expression):
+    """The writing transaction's id on PostgreSQL, 0 on databases without one"""
+    output_field = BigIntegerField()
+
+    def as_sql(self, compiler, connection):
+        return _txid_sql(connection), []
+
+
+def completed_before(using):
+    """
+    Every transaction with a lower id has committed or rolled back, so no entry
+    below it can appear later. None on databases without transaction ids.
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint')
+        return cursor.fetchone()[0]
+
+
+def record(instance, action=Change.UPSERT):
+    Change.objects.using(instance._state.db).create(
+        company_id=instance.company_id,
+        model=model_key(type(instance)),
+        object_id=instance.pk,
+        action=action,
+        txid=CurrentTransactionId(),
+    )
+
+
+def record_queryset(queryset, action=Change.UPSERT):
+    """Record a change for every row of a Job/ContentSection queryset with one INSERT ... SELECT"""
+    select_sql, params = queryset.order_by().values('company_id', 'id').query.sql_with_params()
+    connection = connections[queryset.db]
+    qn = connection.ops.quote_name
+    table = qn(Change._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {table} ({qn("company_id")}, {qn("model")}, {qn("object_id")}, '
+            f'{qn("action")}, {qn("created_at")}, {qn("txid")}) '
+            f'SELECT source.company_id, %s, source.id, %s, %s, {_txid_sql(connection)} FROM ({select_sql}) source',
+            [model_key(queryset.model), action, timezone.now(), *params],
+        )
+        return cursor.rowcount
@@ -0,0 +1,60 @@
+"""
+Management command to compact the delta sync change log
+Usage: python manage.py compact_changes [--retention-days N]
+
+Removes entries superseded by a later change to the same object, tombstones
+older than the retention period and entries of deleted companies. The
+latest upsert of every live object is always kept, so a sync without a
+cursor still returns the full current state.
+"""
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from companies.models import Company
+from sync.models import Change
+
+
+class Command(BaseCommand):
+    help = 'Delete superseded change log entries and expired tombstones'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=None,
+            help='Keep tombstones this long (default: SYNC_RETENTION_DAYS)',
+        )
+
+    def handle(self, *args, **options):
+        retention_days = options['retention_days']
+        if retention_days is None:
+            retention_days = getattr(settings, 'SYNC_RETENTION_DAYS', 30)
+        started = time.monotonic()
+
+        newer = Change.objects.filter(
+            company_id=OuterRef('company_id'),
+            model=OuterRef('model'),
+            object_id=OuterRef('object_id'),
+            id__gt=OuterRef('id'),
+        )
+        superseded, _ = Change.objects.filter(Exists(newer)).delete()
+
+        cutoff = timezone.now() - timedelta(days=retention_days)
+        tombstones, _ = Change.objects.filter(action=Change.DELETE, created_at__lt=cutoff).delete()
+
+        orphaned, _ = Change.objects.filter(
+            ~Exists(Company.objects.filter(id=OuterRef('company_id')))
+        ).delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✅ Change log compaction complete!'
+            f'\n   Superseded: {superseded} entries'
+            f'\n   Expired tombstones: {tombstones}'
+            f'\n   Deleted companies: {orphaned} entries'
+            f'\n   Time: {time.monotonic() - started:.1f}s'
+        ))
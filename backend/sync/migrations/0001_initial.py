@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Change',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('company_id', models.BigIntegerField()),
+                ('model', models.CharField(choices=[('job', 'Job'), ('content_section', 'Content section')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('action', models.CharField(choices=[('upsert', 'Created or updated'), ('delete', 'Deleted')], max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['company_id', 'id'], name='sync_change_company_idx'), models.Index(fields=['company_id', 'model', 'object_id'], name='sync_change_object_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:36
+
+from django.db import migrations
+from django.utils import timezone
+
+
+SEED_SQL = """
+    INSERT INTO sync_change (company_id, model, object_id, action, created_at)
+    SELECT company_id, %s, id, 'upsert', %s FROM {table} ORDER BY id
+"""
+
+
+def seed_changes(apps, schema_editor):
+    """One upsert per existing job and content section, so a first sync returns everything"""
+    now = timezone.now()
+    for table, model in (('jobs_job', 'job'), ('content_contentsection', 'content_section')):
+        schema_editor.execute(SEED_SQL.format(table=table), [model, now])
+
+
+def clear_changes(apps, schema_editor):
+    schema_editor.execute('DELETE FROM sync_change')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sync', '0001_initial'),
+        ('jobs', '0009_job_timestamps'),
+        ('content', '0002_alter_contentsection_unique_together'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_changes, clear_changes),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:59
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Concurrent index builds cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('sync', '0002_seed_existing_rows'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='change',
+            options={'ordering': ['txid', 'id']},
+        ),
+        # Existing entries are all committed; 0 sorts them before every new one
+        migrations.AddField(
+            model_name='change',
+            name='txid',
+            field=models.BigIntegerField(default=0),
+        ),
+        AddIndexConcurrently(
+            model_name='change',
+            index=models.Index(fields=['company_id', 'txid', 'id'], name='sync_change_company_txid_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='change',
+            name='sync_change_company_idx',
+        ),
+    ]
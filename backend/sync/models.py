@@ -0,0 +1,43 @@
+from django.db import models
+
+
+class Change(models.Model):
+    """
+    One create, update or delete of a job or content section.
+
+    (txid, id) is the sync sequence: clients ask for every change after the
+    last one they have seen. Deletes are kept as tombstones for
+    SYNC_RETENTION_DAYS (see compact_changes).
+    """
+    MODELS = [
+        ('job', 'Job'),
+        ('content_section', 'Content section'),
+    ]
+    UPSERT = 'upsert'
+    DELETE = 'delete'
+    ACTIONS = [
+        (UPSERT, 'Created or updated'),
+        (DELETE, 'Deleted'),
+    ]
+
+    # Not a foreign key: entries are written while a company's jobs are being
+    # cascade-deleted, and orphans are removed by compact_changes
+    company_id = models.BigIntegerField()
+    model = models.CharField(max_length=20, choices=MODELS)
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTIONS)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Id of the writing transaction on PostgreSQL (0 elsewhere). Clients page in
+    # (txid, id) order and only below the oldest running transaction, so an entry
+    # that commits late cannot fall behind a cursor (see sync.views)
+    txid = models.BigIntegerField(default=0)
+
+    class Meta:
+        ordering = ['txid', 'id']
+        indexes = [
+            models.Index(fields=['company_id', 'txid', 'id'], name='sync_change_company_txid_idx'),
+            models.Index(fields=['company_id', 'model', 'object_id'], name='sync_change_object_idx'),
+        ]
+
+    def __str__(self):
+        return f"#{self.id} {self.action} {self.model} {self.object_id}"
@@ -0,0 +1,25 @@
+"""
+Record every job and content section save and delete in the change log.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from content.models import ContentSection
+from jobs.models import Job
+
+from .changes import record
+from .models import Change
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_save, sender=ContentSection)
+def record_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    record(instance, Change.UPSERT)
+
+
+@receiver(post_delete, sender=Job)
+@receiver(post_delete, sender=ContentSection)
+def record_delete(sender, instance, **kwargs):
+    record(instance, Change.DELETE)
@@ -0,0 +1,154 @@
+"""
+Delta sync: everything that changed for a company since a cursor.
+
+GET /api/sync/changes/?company=<slug>&since=<cursor>&limit=<n>
+
+Returns the jobs and content sections created, updated or deleted after the
+cursor, oldest first, with only the latest change per object. Start with no
+`since` for a full snapshot, then pass `next_since` back on each poll; keep
+polling right away while `has_more` is true. A 410 means the cursor is older
+than the tombstone retention (or from an older format) and the client must
+start over.
+
+Entries are paged in (transaction id, id) order and only up to the oldest
+transaction still running on PostgreSQL, so a write that commits late is
+never behind a cursor that already moved on. Other databases hold back
+entries younger than SYNC_SETTLE_SECONDS instead.
+
+Only what the public careers page shows is sent: closed jobs and inactive
+sections are reported as deletes.
+"""
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import router
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from careers_builder.throttling import PUBLIC_THROTTLES
+from companies.cache import get_company
+from content.models import ContentSection
+from content.serializers import ContentSectionPublicSerializer
+from jobs.models import Job
+from jobs.search import InvalidCursor, decode_cursor, encode_cursor
+from jobs.serializers import JobPublicSerializer
+
+from .changes import completed_before
+from .models import Change
+
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 2000
+
+
+def _public_objects(company, model, ids):
+    """{id: serialized public payload} for the objects that are still publicly visible"""
+    if not ids:
+        return {}
+    if model == 'job':
+        objects = Job.objects.open().filter(company=company, id__in=ids).select_related('company').defer('search_vector')
+        serializer = JobPublicSerializer
+    else:
+        objects = ContentSection.objects.filter(company=company, id__in=ids, is_active=True)
+        serializer = ContentSectionPublicSerializer
+    return {obj.id: serializer(obj).data for obj in objects}
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+@throttle_classes(PUBLIC_THROTTLES)
+def changes(request):
+    company_slug = request.query_params.get('company')
+    if not company_slug:
+        return Response(
+            {'error': 'Company slug is required'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    since = None
+    cursor = request.query_params.get('since')
+    if cursor:
+        try:
+            values = decode_cursor(cursor)
+            if len(values) not in (2, 3):
+                raise InvalidCursor('Invalid cursor')
+        except InvalidCursor:
+            return Response({'error': 'Invalid since cursor'}, status=status.HTTP_400_BAD_REQUEST)
+        retention = getattr(settings, 'SYNC_RETENTION_DAYS', 30) * 86400
+        # Two values: an id-only cursor from before transaction ordering
+        if len(values) == 2 or values[-1] < time.time() - retention:
+            return Response(
+                {'error': 'Cursor expired, sync again without since'},
+                status=status.HTTP_410_GONE
+            )
+        since = values[:2]
+
+    try:
+        limit = min(max(int(request.query_params.get('limit', DEFAULT_LIMIT)), 1), MAX_LIMIT)
+    except ValueError:
+        return Response({'error': 'limit must be a number'}, status=status.HTTP_400_BAD_REQUEST)
+
+    company = get_company(company_slug)
+    if company is None:
+        return Response(
+            {'error': 'Company not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    using = router.db_for_read(Change)
+    entries = Change.objects.using(using).filter(company_id=company.id)
+    if since is not None:
+        since_txid, since_id = since
+        entries = entries.filter(Q(txid__gt=since_txid) | Q(txid=since_txid, id__gt=since_id))
+    horizon = completed_before(using)
+    if horizon is not None:
+        # Transactions at or above the horizon may still be running, and one of them
+        # could commit entries that sort before the ones already visible
+        entries = entries.filter(txid__lt=horizon)
+    else:
+        settled = timezone.now() - timedelta(seconds=getattr(settings, 'SYNC_SETTLE_SECONDS', 2))
+        entries = entries.filter(created_at__lte=settled)
+    entries = list(
+        entries.order_by('txid', 'id').values_list('txid', 'id', 'model', 'object_id', 'action')[:limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    # Latest entry per object wins
+    latest = {}
+    for _, seq, model, object_id, action in entries:
+        latest.pop((model, object_id), None)
+        latest[(model, object_id)] = (seq, action)
+
+    payloads = {
+        model: _public_objects(company, model, [
+            object_id for (key_model, object_id), (_, action) in latest.items()
+            if key_model == model and action == Change.UPSERT
+        ])
+        for model, _ in Change.MODELS
+    }
+
+    results = []
+    for (model, object_id), (seq, action) in latest.items():
+        data = payloads[model].get(object_id)
+        results.append({
+            'seq': seq,
+            'type': model,
+            'id': object_id,
+            # Gone or hidden since this entry was written: the client should drop it
+            'action': Change.UPSERT if data is not None else Change.DELETE,
+            'data': data,
+        })
+
+    if entries:
+        since = entries[-1][:2]
+    return Response({
+        'changes': results,
+        'next_since': encode_cursor([*(since or (0, 0)), int(time.time())]),
+        'has_more': has_more,
+    })
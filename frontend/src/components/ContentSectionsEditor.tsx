@@ -3,6 +3,7 @@ import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { Company } from '../services/company';
 import {
   contentService,
+  ContentFormat,
   ContentSection,
   SectionType,
 } from '../services/content';
@@ -184,6 +185,7 @@ const ContentSectionsEditor = ({}: ContentSectionsEditorProps) => {
       section_type: formData.get('section_type') as SectionType,
       title: formData.get('title') as string,
       content: formData.get('content') as string,
+      content_format: formData.get('content_format') as ContentFormat,
       order: editingSection
         ? editingSection.order
         : sections.length > 0
@@ -318,6 +320,19 @@ const ContentSectionsEditor = ({}: ContentSectionsEditorProps) => {
                   required
                 />
               </div>
+              <div>
+                <label className="block text-sm font-medium text-gray-700 mb-2">
+                  Format
+                </label>
+                <select
+                  name="content_format"
+                  defaultValue={editingSection?.content_format || 'markdown'}
+                  className="w-full px-3 py-2 border border-gray-300 rounded-md"
+                >
+                  <option value="markdown">Markdown</option>
+                  <option value="text">Plain text</option>
+                </select>
+              </div>
               <div>
                 <label className="block text-sm font-medium text-gray-700 mb-2">
                   Content
@@ -1,8 +1,11 @@
-import { useState } from 'react';
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useEffect, useState } from 'react';
+import { useQuery, useMutation, useQueryClient, keepPreviousData } from '@tanstack/react-query';
 import { Company } from '../services/company';
-import { jobService, Job } from '../services/jobs';
-import { Plus, Trash2, Edit2 } from 'lucide-react';
+import { jobService, Job, JobSort, JobStatus } from '../services/jobs';
+import { Plus, Trash2, Edit2, ChevronLeft, ChevronRight } from 'lucide-react';
+
+const PAGE_SIZE = 20;
+const SEARCH_DEBOUNCE_MS = 300;
 
 interface JobsEditorProps {
   company: Company;
@@ -11,13 +14,41 @@ interface JobsEditorProps {
 const JobsEditor = ({ company: _company }: JobsEditorProps) => {
   const [showModal, setShowModal] = useState(false);
   const [editingJob, setEditingJob] = useState<Job | null>(null);
+  const [page, setPage] = useState(1);
+  const [search, setSearch] = useState('');
+  const [debouncedSearch, setDebouncedSearch] = useState('');
+  const [statusFilter, setStatusFilter] = useState<JobStatus | ''>('');
+  const [sort, setSort] = useState<JobSort>('newest');
   const queryClient = useQueryClient();
 
-  const { data: jobs = [], isLoading, error } = useQuery({
-    queryKey: ['jobs'],
-    queryFn: () => jobService.getJobs(),
+  // Fetch once typing pauses rather than on every keystroke
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      setDebouncedSearch(search);
+      setPage(1);
+    }, SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [search]);
+
+  const listParams = {
+    page,
+    page_size: PAGE_SIZE,
+    search: debouncedSearch,
+    status: statusFilter || undefined,
+    sort,
+  };
+
+  // One page at a time; the previous page stays on screen while the next loads
+  const { data, isLoading, isFetching, error } = useQuery({
+    queryKey: ['jobs', listParams],
+    queryFn: () => jobService.getJobs(listParams),
+    placeholderData: keepPreviousData,
     retry: 1,
   });
+  const jobs = data?.results ?? [];
+  const totalCount = data?.count ?? 0;
+  const totalPages = Math.max(1, Math.ceil(totalCount / PAGE_SIZE));
+  const hasFilters = Boolean(debouncedSearch.trim() || statusFilter);
 
   const createMutation = useMutation({
     mutationFn: jobService.createJob,
@@ -48,6 +79,10 @@ const JobsEditor = ({ company: _company }: JobsEditorProps) => {
   const deleteMutation = useMutation({
     mutationFn: jobService.deleteJob,
     onSuccess: () => {
+      // Deleting the last job on a page would leave an empty (invalid) page
+      if (jobs.length === 1 && page > 1) {
+        setPage(page - 1);
+      }
       queryClient.invalidateQueries({ queryKey: ['jobs'] });
     },
     onError: (error) => {
@@ -151,9 +186,45 @@ const JobsEditor = ({ company: _company }: JobsEditorProps) => {
         </button>
       </div>
 
+      <div className="flex flex-wrap gap-3 mb-4">
+        <input
+          type="text"
+          value={search}
+          onChange={(e) => setSearch(e.target.value)}
+          placeholder="Search title or description"
+          className="flex-1 min-w-[200px] px-3 py-2 border border-gray-300 rounded-md text-sm"
+        />
+        <select
+          value={statusFilter}
+          onChange={(e) => {
+            setStatusFilter(e.target.value as JobStatus | '');
+            setPage(1);
+          }}
+          className="px-3 py-2 border border-gray-300 rounded-md text-sm"
+        >
+          <option value="">All statuses</option>
+          <option value="open">Open</option>
+          <option value="closed">Closed</option>
+        </select>
+        <select
+          value={sort}
+          onChange={(e) => {
+            setSort(e.target.value as JobSort);
+            setPage(1);
+          }}
+          className="px-3 py-2 border border-gray-300 rounded-md text-sm"
+        >
+          <option value="newest">Newest first</option>
+          <option value="oldest">Oldest first</option>
+          <option value="title">Title (A-Z)</option>
+          <option value="salary">Salary (highest first)</option>
+          <option value="salary_asc">Salary (lowest first)</option>
+        </select>
+      </div>
+
       {jobs.length === 0 ? (
         <p className="text-gray-500 text-center py-8">
-          No jobs yet. Add your first job posting!
+          {hasFilters ? 'No jobs match these filters.' : 'No jobs yet. Add your first job posting!'}
         </p>
       ) : (
         <div className="space-y-4">
@@ -165,6 +236,9 @@ const JobsEditor = ({ company: _company }: JobsEditorProps) => {
               <div className="flex-1">
                 <div className="flex items-center gap-3 mb-2">
                   <h3 className="font-semibold text-lg">{job.title}</h3>
+                  {job.status === 'closed' && (
+                    <span className="px-2 py-0.5 text-xs rounded bg-gray-100 text-gray-600">Closed</span>
+                  )}
                 </div>
                 <p className="text-sm text-gray-600 mb-2">{job.location}</p>
                 <p className="text-sm text-gray-500">
@@ -198,6 +272,35 @@ const JobsEditor = ({ company: _company }: JobsEditorProps) => {
         </div>
       )}
 
+      {totalCount > PAGE_SIZE && (
+        <div className="flex items-center justify-between mt-6 text-sm text-gray-600">
+          <span>
+            Page {page} of {data?.count_capped ? `${totalPages}+` : totalPages}
+            {' • '}
+            {data?.count_capped ? `${totalCount.toLocaleString()}+` : totalCount.toLocaleString()} jobs
+            {isFetching && ' • Loading...'}
+          </span>
+          <div className="flex gap-2">
+            <button
+              onClick={() => setPage((p) => Math.max(1, p - 1))}
+              disabled={!data?.previous}
+              className="flex items-center gap-1 px-3 py-1 border border-gray-300 rounded-md hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+            >
+              <ChevronLeft className="w-4 h-4" />
+              Previous
+            </button>
+            <button
+              onClick={() => setPage((p) => p + 1)}
+              disabled={!data?.next}
+              className="flex items-center gap-1 px-3 py-1 border border-gray-300 rounded-md hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+            >
+              Next
+              <ChevronRight className="w-4 h-4" />
+            </button>
+          </div>
+        </div>
+      )}
+
       {/* Modal */}
       {showModal && (
         <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
@@ -146,8 +146,8 @@ const PublicCareersPage = () => {
                 {section.title}
               </h2>
               <div
-                className="text-gray-700 whitespace-pre-line"
-                dangerouslySetInnerHTML={{ __html: section.content.replace(/\n/g, '<br />') }}
+                className="text-gray-700"
+                dangerouslySetInnerHTML={{ __html: section.content_html }}
               />
             </section>
           ))}
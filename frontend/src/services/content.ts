@@ -2,6 +2,8 @@ import api from './api';
 
 export type SectionType = 'about' | 'life' | 'benefits' | 'values' | 'mission' | 'custom';
 
+export type ContentFormat = 'text' | 'markdown';
+
 export interface ContentSection {
   id: number;
   company: number;
@@ -10,6 +12,8 @@ export interface ContentSection {
   section_type: SectionType;
   title: string;
   content: string;
+  content_format: ContentFormat;
+  content_html: string; // Sanitized HTML rendered by the server on save
   order: number;
   is_active: boolean;
   created_at: string;
@@ -21,6 +25,8 @@ export interface ContentSectionPublic {
   section_type: SectionType;
   title: string;
   content: string;
+  content_format: ContentFormat;
+  content_html: string;
   order: number;
 }
 
@@ -30,7 +36,7 @@ export const contentService = {
     return response.data;
   },
 
-  async createSection(data: Omit<ContentSection, 'id' | 'created_at' | 'updated_at' | 'company_name' | 'company_slug'>): Promise<ContentSection> {
+  async createSection(data: Omit<ContentSection, 'id' | 'content_html' | 'created_at' | 'updated_at' | 'company_name' | 'company_slug'>): Promise<ContentSection> {
     const response = await api.post<ContentSection>('/content/', data);
     return response.data;
   },
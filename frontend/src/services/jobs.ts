@@ -15,6 +15,28 @@ export interface Job {
   experience?: 'junior' | 'mid-level' | 'senior';
   salary_range?: string;
   posted_date: string;
+  status?: JobStatus;
+  closed_at?: string | null;
+}
+
+export type JobStatus = 'open' | 'closed';
+
+export type JobSort = 'newest' | 'oldest' | 'title' | 'salary' | 'salary_asc';
+
+// Recruiter list: the public filters plus status, sort and page
+export interface JobListParams extends JobFilters {
+  status?: JobStatus;
+  sort?: JobSort;
+  page?: number;
+  page_size?: number;
+}
+
+export interface PaginatedResponse<T> {
+  count: number;
+  count_capped: boolean; // More rows match than were counted; count is the cap
+  next: string | null;
+  previous: string | null;
+  results: T[];
 }
 
 export interface JobPublic {
@@ -52,8 +74,17 @@ export interface JobFilters {
 }
 
 export const jobService = {
-  async getJobs(): Promise<Job[]> {
-    const response = await api.get<Job[]>('/jobs/');
+  async getJobs(listParams: JobListParams = {}): Promise<PaginatedResponse<Job>> {
+    const params = new URLSearchParams();
+
+    // Only add non-empty values
+    Object.entries(listParams).forEach(([key, value]) => {
+      if (value !== undefined && value !== null && String(value).trim()) {
+        params.append(key, String(value).trim());
+      }
+    });
+
+    const response = await api.get<PaginatedResponse<Job>>(`/jobs/?${params.toString()}`);
     return response.data;
   },
 